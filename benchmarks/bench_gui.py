@@ -0,0 +1,148 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Benchmarks for the GUI hot paths, using the real widgets offscreen.
+
+    python -m benchmarks.bench_gui --output bench_gui.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, List
+
+# must be set before Qt is loaded
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("POMLET_AUDIO", "null")
+
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.common import measure, write_report
+from benchmarks.synthetic import generate_deck
+from src.gui.tabs.list_flashcard import ListTab
+from src.gui.tabs.review_flashcard import ReviewTab
+from src.gui.tabs.timer.progress_circle import ProgressCircle
+from src.gui.tabs.timer.timer import TimerTab
+from src.gui.tray import Tray
+from src.questions_manager import QuestionManager, get_question_path
+
+
+def _write_deck(size: int, seed: int):
+    with open(get_question_path(), "w", encoding="utf-8") as f:
+        json.dump(generate_deck(size, seed), f)
+
+
+def bench_list_tab(app: QApplication, size: int, seed: int, budget: float):
+    _write_deck(size, seed)
+    list_tab = ListTab(QuestionManager())
+
+    def refresh():
+        list_tab.refresh()
+        app.processEvents()
+
+    return measure(
+        "ListTab.refresh", refresh, min_runs=3, budget=budget, size=size
+    )
+
+
+def bench_review_tab(app: QApplication, size: int, seed: int, budget: float):
+    _write_deck(size, seed)
+    review_tab = ReviewTab(QuestionManager())
+    review_tab.start_review_btn.click()
+
+    def restart_if_done():
+        if not review_tab.correct_btn.isEnabled():
+            review_tab.start_review_btn.click()
+
+    def answer(btn):
+        btn.click()
+        app.processEvents()
+
+    return [
+        measure(
+            f"ReviewTab {name} -> next card",
+            lambda btn=btn: answer(btn),
+            setup=restart_if_done,
+            budget=budget,
+            size=size,
+        )
+        for name, btn in (
+            ("correct", review_tab.correct_btn),
+            ("wrong", review_tab.wrong_btn),
+        )
+    ]
+
+
+def bench_timer_tick(app: QApplication, budget: float):
+    tray = Tray()
+    timer_tab = TimerTab(tray, 25, 5)
+    timer_tab.tick.connect(tray.update)
+    timer_tab.start()
+    timer_tab._timer.stop()  # ticks are driven by the benchmark
+
+    def tick():
+        timer_tab._tick()
+        app.processEvents()
+
+    result = measure("TimerTab._tick + Tray.update", tick, budget=budget)
+    timer_tab.stop()
+    return result
+
+
+def bench_progress_circle(budget: float):
+    circle = ProgressCircle()
+    circle.setFixedSize(240, 240)
+    circle.update_progress(0.42, "14:30")
+    pixmap = QPixmap(circle.size())
+
+    return measure(
+        "ProgressCircle paint (240x240)", lambda: circle.render(pixmap), budget=budget
+    )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks for the GUI hot paths.")
+    parser.add_argument("--list-sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--review-size", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--budget", type=float, default=2.0, help="seconds spent timing each operation"
+    )
+    parser.add_argument("--output", help="JSON report path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    app = QApplication(sys.argv[:1])
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="pomlet-bench-") as home:
+        os.environ["POMLET_HOME"] = home
+        os.environ.pop("DEV", None)
+
+        for size in args.list_sizes:
+            results.append(bench_list_tab(app, size, args.seed, args.budget))
+        results += bench_review_tab(app, args.review_size, args.seed, args.budget)
+        results.append(bench_timer_tick(app, args.budget))
+        results.append(bench_progress_circle(args.budget))
+
+    write_report("gui", results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
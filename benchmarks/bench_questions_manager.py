@@ -0,0 +1,152 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Benchmarks for QuestionManager on synthetic decks.
+
+    python -m benchmarks.bench_questions_manager --output bench.json
+    python -m benchmarks.bench_questions_manager --sizes 1000 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from benchmarks.common import measure, write_report
+from benchmarks.synthetic import generate_deck
+from src.questions_manager import QuestionManager, get_question_path
+
+
+def bench_size(size: int, seed: int, budget: float) -> List[Dict[str, Any]]:
+    with tempfile.TemporaryDirectory(prefix="pomlet-bench-") as home:
+        os.environ["POMLET_HOME"] = home
+        os.environ.pop("DEV", None)
+
+        deck = generate_deck(size, seed)
+        with open(get_question_path(), "w", encoding="utf-8") as f:
+            json.dump(deck, f)
+        del deck
+
+        print(f"-- {size} cards", file=sys.stderr)
+        rng = random.Random(seed)
+        qm = QuestionManager()
+        ids = [q["id"] for q in qm._questions]
+        picked: Dict[str, Any] = {}
+
+        def pick_card():
+            picked["card"] = qm.find_by_id(rng.choice(ids))
+
+        def fill_backups():
+            backups_dir = get_question_path().parent.joinpath("backups")
+            backups_dir.mkdir(exist_ok=True)
+            start = datetime(2020, 1, 1)
+            for i in range(60):
+                backups_dir.joinpath((start + timedelta(minutes=i)).isoformat()).touch()
+
+        def prime_iterator():
+            qm.reset()
+            qm.get_next_to_repeat()
+
+        common = {"size": size}
+        return [
+            measure("load", QuestionManager, budget=budget, **common),
+            measure("save", qm.save_questions, budget=budget, **common),
+            measure("count", qm.count, budget=budget, **common),
+            measure(
+                "get_next_to_repeat (after reset)",
+                qm.get_next_to_repeat,
+                setup=qm.reset,
+                budget=budget,
+                **common,
+            ),
+            measure(
+                "get_next_to_repeat (primed)",
+                qm.get_next_to_repeat,
+                setup=prime_iterator,
+                budget=budget,
+                **common,
+            ),
+            measure(
+                "correct",
+                lambda: qm.correct(picked["card"]),
+                setup=pick_card,
+                budget=budget,
+                **common,
+            ),
+            measure(
+                "wrong",
+                lambda: qm.wrong(picked["card"]),
+                setup=pick_card,
+                budget=budget,
+                **common,
+            ),
+            measure(
+                "add_question",
+                lambda: qm.add_question("What is a benchmark?", "Benchmarks"),
+                budget=budget,
+                **common,
+            ),
+            measure("reschedule_all", qm.reschedule_all, budget=budget, **common),
+            measure("forecast (365 days)", lambda: qm.forecast(365), budget=budget, **common),
+            measure(
+                "forecast (365 days, simulated)",
+                lambda: qm.forecast(365, simulate=True, seed=seed),
+                budget=budget,
+                **common,
+            ),
+            measure(
+                "get_all_grouped_by_subject",
+                qm.get_all_grouped_by_subject,
+                budget=budget,
+                **common,
+            ),
+            measure(
+                "clean_backups (60 backups)",
+                qm._clean_backups,
+                setup=fill_backups,
+                budget=budget,
+                **common,
+            ),
+        ]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[-2].strip())
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--budget", type=float, default=2.0, help="seconds spent timing each operation"
+    )
+    parser.add_argument("--output", help="JSON report path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results: List[Dict[str, Any]] = []
+    for size in args.sizes:
+        results += bench_size(size, args.seed, args.budget)
+
+    write_report("questions_manager", results, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    setup: Callable[[], Any] | None = None,
+    min_runs: int = 5,
+    max_runs: int = 100,
+    budget: float = 2.0,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """Time fn until max_runs or the time budget is used, at least min_runs times.
+
+    setup runs before every call, outside the timing. Peak memory is taken
+    from one extra traced call, so tracing does not skew the timings.
+    """
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < max_runs and (
+        len(timings) < min_runs or time.perf_counter() - started < budget
+    ):
+        if setup is not None:
+            setup()
+        t = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    median = statistics.median(timings)
+    result = {
+        "name": name,
+        "runs": len(timings),
+        "min_s": min(timings),
+        "median_s": median,
+        "mean_s": statistics.fmean(timings),
+        "ops_per_sec": 1 / median if median > 0 else None,
+        "peak_memory_bytes": peak,
+        **extra,
+    }
+    print(
+        f"{name:<40} {median * 1000:>10.3f} ms  {result['ops_per_sec'] or 0:>12.1f} ops/s"
+        f"  {peak / 1024:>10.0f} KiB",
+        file=sys.stderr,
+    )
+    return result
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(suite: str, results: List[Dict[str, Any]], output: str | None):
+    """Write the results with enough context to compare runs across versions."""
+    report = {
+        "suite": suite,
+        "timestamp": datetime.now().isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if output is None or output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
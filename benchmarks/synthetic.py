@@ -0,0 +1,82 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+SUBJECTS = [
+    "Theoretical Computer Science",
+    "DevOps",
+    "Databases",
+    "Operating Systems",
+    "Linear Algebra",
+    "Statistics",
+    "Machine Learning",
+    "Computer Networks",
+    "Compilers",
+    "Distributed Systems",
+    "Cryptography",
+    "Software Engineering",
+]
+
+# days after the last repetition, indexed by the number of correct repetitions
+INTERVALS = [0, 0.5, 1, 3, 7, 14, 31]
+
+WORDS = (
+    "what how why when which define explain compare prove describe the a of in "
+    "for between difference language automaton pod container index transaction "
+    "kernel matrix eigenvalue gradient packet grammar consensus cipher test"
+).split()
+
+
+def generate_deck(size: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """A deck shaped like a real one, reproducible for a given size and seed.
+
+    Subjects follow a Zipf-like distribution, most cards have few correct
+    repetitions and about a tenth are overdue.
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    subject_weights = [1 / (rank + 1) for rank in range(len(SUBJECTS))]
+    repeated_weights = [30, 20, 15, 12, 10, 8, 5]
+
+    subjects = rng.choices(SUBJECTS, weights=subject_weights, k=size)
+    repetitions = rng.choices(range(len(INTERVALS)), weights=repeated_weights, k=size)
+
+    deck: List[Dict[str, Any]] = []
+    for id_, (subject, repeated) in enumerate(zip(subjects, repetitions)):
+        created = now - timedelta(days=rng.uniform(0, 365))
+        interval = timedelta(days=INTERVALS[repeated])
+        # spread reviews so that roughly 10% of the cards are overdue
+        last_repeated = max(created, now - interval * rng.uniform(0.1, 1.1))
+        next_repeat = last_repeated + interval
+
+        deck.append(
+            {
+                "id": id_,
+                "question": " ".join(rng.choices(WORDS, k=rng.randint(4, 18))) + "?",
+                "last_repeated": last_repeated.isoformat(),
+                "created": created.isoformat(),
+                "repeated": repeated,
+                "subject": subject,
+                "next_repeat": next_repeat.isoformat(),
+            }
+        )
+
+    return deck
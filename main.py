@@ -16,21 +16,70 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import multiprocessing
+import os
 import sys
-from dotenv import load_dotenv
+import time
 
-from PySide6.QtWidgets import QApplication
-import dotenv
-import qdarktheme
-from src.gui.pomodoro import PomodoroApp
+SHUTDOWN_TIMEOUT = 2.0  # seconds given to queued side effects when quitting
 
 
+def main() -> int:
+    # everything is imported here, not at module level: the scheduler optimizer
+    # runs in a spawned process, which imports this module again
+    launched_at = time.perf_counter()
+    from dotenv import load_dotenv
 
-if __name__ == "__main__":
-    print(dotenv.find_dotenv())
+    imported_dotenv_at = time.perf_counter()
+    # before any src import: several modules read their POMLET_* settings on import
     load_dotenv()
-    app = QApplication(sys.argv)
-    window = PomodoroApp()
-    qdarktheme.setup_theme("auto")
-    window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    loaded_dotenv_at = time.perf_counter()
+
+    from src import startup_profile
+
+    # no-op unless POMLET_PROFILE_STARTUP or --profile-startup
+    startup_profile.start(launched_at)
+    startup_profile.record("import dotenv", launched_at, imported_dotenv_at)
+    startup_profile.record("dotenv", imported_dotenv_at, loaded_dotenv_at)
+
+    with startup_profile.phase("import Qt"):
+        from PySide6.QtWidgets import QApplication
+
+    with startup_profile.phase("import qdarktheme"):
+        import qdarktheme
+
+    with startup_profile.phase("import app"):
+        from src import metrics, optimizer
+        from src.config import get_config_path
+        from src.dispatcher import get_dispatcher
+        from src.gui.pomodoro import PomodoroApp
+        from src.gui.watchdog import StallWatchdog
+
+    with startup_profile.phase("QApplication"):
+        app = QApplication(sys.argv)
+    # calendar events are queued on disk, so a hung osascript need not hold up quitting
+    app.aboutToQuit.connect(lambda: get_dispatcher().shutdown(timeout=SHUTDOWN_TIMEOUT))
+    app.aboutToQuit.connect(optimizer.shutdown)
+    metrics.start_exporter()  # no-op unless POMLET_METRICS_FILE or POMLET_METRICS_PORT
+
+    # stalls longer than POMLET_WATCHDOG_THRESHOLD seconds go to stalls.log, 0 disables
+    stall_threshold = float(os.getenv("POMLET_WATCHDOG_THRESHOLD", "1.0"))
+    if stall_threshold > 0:
+        watchdog = StallWatchdog(
+            get_config_path().parent.joinpath("stalls.log"), stall_threshold, parent=app
+        )
+        watchdog.start()
+        app.aboutToQuit.connect(watchdog.stop)
+
+    with startup_profile.phase("PomodoroApp.__init__"):
+        window = PomodoroApp()
+    with startup_profile.phase("theme setup"):
+        qdarktheme.setup_theme("auto")
+    with startup_profile.phase("window.show"):
+        window.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()  # the scheduler optimizer runs in a child process
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Files of fixed-size records, shared by the review and session logs. A file
+starts with a 16 byte header (magic, format version, record size) followed
+by the records, and is read by mapping it into memory and viewing it as a
+NumPy structured array without copying.
+"""
+
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("<4sHH8x")  # magic, version, record size
+
+
+def prepare_append(f: BinaryIO, magic: bytes, version: int, record_size: int) -> int:
+    """Get a file opened for writing ready for new records, return its size.
+
+    An empty file gets the header; a record torn by a crash is dropped, so
+    the rest stays aligned.
+    """
+    size = f.seek(0, os.SEEK_END)
+    if size == 0:
+        f.write(HEADER.pack(magic, version, record_size))
+        return HEADER.size
+
+    torn = (size - HEADER.size) % record_size
+    if torn:
+        size -= torn
+        f.truncate(size)
+        f.seek(size)
+    return size
+
+
+def map_records(path: Path, magic: bytes, dtype: Any) -> Any | None:
+    """The records of path as a read-only structured array backed by the file.
+
+    None if the file is missing, holds no records or is not a log of this
+    kind; a torn last record is left out.
+    """
+    import numpy as np
+
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= HEADER.size:
+                return None
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        return None
+
+    file_magic, _, record_size = HEADER.unpack_from(mm)
+    if file_magic != magic or record_size != dtype.itemsize:
+        logger.warning("Ignoring %s: not a %s log", path, magic.decode())
+        return None
+
+    count = (size - HEADER.size) // record_size
+    return np.frombuffer(mm, dtype=dtype, count=count, offset=HEADER.size)
@@ -16,35 +16,264 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
+import os
+from abc import ABC, abstractmethod
 import platform
 import subprocess
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Set
 
+from src.config import get_config_path
+from src.dispatcher import get_dispatcher
 
-def create_calendar_event(title, start_time, end_time):
-    """Add an event to Apple Calendar (macOS only)."""
-    if platform.system() != "Darwin":
-        return  # skip if not on macOS
-
-    applescript = (
-        f"""
-    set theStartDate to (current date)
-    set hours of theStartDate to {start_time.hour}
-    set minutes of theStartDate to {start_time.minute}
-    set seconds of theStartDate to {start_time.second}
-
-    set theEndDate to (current date)
-    set hours of theEndDate to {end_time.hour}
-    set minutes of theEndDate to {end_time.minute}
-    set seconds of theEndDate to {end_time.second}
-    """
-        + '''
-    tell application "Calendar"
-        tell calendar "Pomodoro"
-            make new event with properties {summary: "'''
-        + title
-        + """", start date:theStartDate, end date:theEndDate}
-        end tell
-    end tell
+Event = Dict[str, str]
+
+
+class CalendarSink(ABC):
+    """Destination for finished pomodoros, written to in batches."""
+
+    name: str = ""
+
+    @abstractmethod
+    def write(self, events: List[Event]) -> None:
+        """Write a batch of events; raise if any of them could not be written."""
+
+
+class AppleCalendarSink(CalendarSink):
+    """Add events to the "Pomodoro" calendar of Apple Calendar (macOS only)."""
+
+    name = "apple"
+
+    def write(self, events: List[Event]) -> None:
+        lines = [
+            "on makeDate(y, m, d, h, mi, s)",
+            "    set theDate to (current date)",
+            "    set day of theDate to 1",
+            "    set year of theDate to y",
+            "    set month of theDate to m",
+            "    set day of theDate to d",
+            "    set hours of theDate to h",
+            "    set minutes of theDate to mi",
+            "    set seconds of theDate to s",
+            "    return theDate",
+            "end makeDate",
+            'tell application "Calendar"',
+            '    tell calendar "Pomodoro"',
+        ]
+        for event in events:
+            title = event["title"].replace("\\", "\\\\").replace('"', '\\"')
+            start = self._make_date(datetime.fromisoformat(event["start"]))
+            end = self._make_date(datetime.fromisoformat(event["end"]))
+            lines.append(
+                f'        make new event with properties {{summary:"{title}", '
+                f"start date:{start}, end date:{end}}}"
+            )
+        lines += ["    end tell", "end tell"]
+
+        subprocess.run(
+            ["osascript", "-e", "\n".join(lines)],
+            timeout=30 + 2 * len(events),
+            check=True,
+            capture_output=True,
+        )
+
+    def _make_date(self, when: datetime) -> str:
+        return (
+            f"my makeDate({when.year}, {when.month}, {when.day}, "
+            f"{when.hour}, {when.minute}, {when.second})"
+        )
+
+
+class IcsSink(CalendarSink):
+    """Append events to a local iCalendar file, importable by any calendar app."""
+
+    name = "ics"
+    _HEADER = b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Pomlet//Pomlet//EN\r\n"
+    _FOOTER = b"END:VCALENDAR\r\n"
+    _TAIL_CHUNK = 16 * 1024
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def write(self, events: List[Event]) -> None:
+        # a batch replayed after a crash between writing and dequeuing it
+        # must not show up twice
+        written = self._recent_uids(len(events))
+        body = b"".join(
+            self._format(event) for event in events if event["uid"] not in written
+        )
+        if not body:
+            return
+
+        if not self._path.exists() or self._path.stat().st_size < len(self._HEADER):
+            with open(self._path, "wb") as f:
+                f.write(self._HEADER + body + self._FOOTER)
+                f.flush()
+                os.fsync(f.fileno())
+            return
+
+        with open(self._path, "r+b") as f:
+            # insert the new events right before the closing END:VCALENDAR
+            f.seek(-len(self._FOOTER), os.SEEK_END)
+            if f.read() == self._FOOTER:
+                f.seek(-len(self._FOOTER), os.SEEK_END)
+            f.truncate()
+            f.write(body + self._FOOTER)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _recent_uids(self, count: int) -> Set[str]:
+        """UIDs of at least the last count events of the file.
+
+        Only a replayed batch can repeat events, and what it wrote before the
+        crash is at the end of the file, so only the tail is read.
+        """
+        if count == 0 or not self._path.exists():
+            return set()
+        with open(self._path, "rb") as f:
+            start = f.seek(0, os.SEEK_END)
+            tail = b""
+            while start > 0 and tail.count(b"BEGIN:VEVENT\r\n") < count:
+                read_to = start
+                start = max(0, start - self._TAIL_CHUNK)
+                f.seek(start)
+                tail = f.read(read_to - start) + tail
+
+        lines = tail.split(b"\r\n")
+        if start > 0:
+            lines = lines[1:]  # may start in the middle of a line
+        return {line[4:].decode("utf-8") for line in lines if line.startswith(b"UID:")}
+
+    def _format(self, event: Event) -> bytes:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        start = datetime.fromisoformat(event["start"]).strftime("%Y%m%dT%H%M%S")
+        end = datetime.fromisoformat(event["end"]).strftime("%Y%m%dT%H%M%S")
+        title = (
+            event["title"]
+            .replace("\\", "\\\\")
+            .replace(";", "\\;")
+            .replace(",", "\\,")
+            .replace("\n", "\\n")
+        )
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{event['uid']}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start}",
+            f"DTEND:{end}",
+            f"SUMMARY:{title}",
+            "END:VEVENT",
+        ]
+        return b"".join(self._fold(line) for line in lines)
+
+    def _fold(self, line: str) -> bytes:
+        # RFC 5545: lines longer than 75 octets continue on lines starting with a space
+        data = line.encode("utf-8")
+        chunks = []
+        while len(data) > 75:
+            cut = 75 if not chunks else 74
+            while cut > 0 and (data[cut] & 0xC0) == 0x80:  # keep utf-8 sequences whole
+                cut -= 1
+            chunks.append(data[:cut])
+            data = data[cut:]
+        chunks.append(data)
+        return b"\r\n ".join(chunks) + b"\r\n"
+
+
+class CalendarWriter:
+    """Queue events durably on disk, one queue per sink, and flush them in batches.
+
+    An event stays in a sink's queue until that sink has written it, so a slow
+    or failing calendar only delays events instead of dropping them.
     """
-    )
-    subprocess.run(["osascript", "-e", applescript])
+
+    def __init__(
+        self, sinks: List[CalendarSink], queue_dir: Path, batch_size: int = 50
+    ) -> None:
+        self._sinks = sinks
+        self._queue_dir = queue_dir
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+
+    def _queue_path(self, sink: CalendarSink) -> Path:
+        return self._queue_dir.joinpath(f"calendar_queue_{sink.name}.jsonl")
+
+    def add_event(self, title: str, start_time: datetime, end_time: datetime):
+        event = {
+            "uid": f"{uuid.uuid4()}@pomlet",
+            "title": title,
+            "start": start_time.isoformat(),
+            "end": end_time.isoformat(),
+        }
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            for sink in self._sinks:
+                with open(self._queue_path(sink), "a", encoding="utf-8") as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def pending(self, sink: CalendarSink) -> List[Event]:
+        queue_path = self._queue_path(sink)
+        if not queue_path.exists():
+            return []
+
+        with open(queue_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def flush(self):
+        """Write queued events to every sink; raises if a sink failed."""
+        errors = []
+        for sink in self._sinks:
+            with self._lock:
+                events = self.pending(sink)
+
+            for i in range(0, len(events), self._batch_size):
+                batch = events[i : i + self._batch_size]
+                try:
+                    sink.write(batch)
+                except Exception as e:
+                    errors.append(e)
+                    break
+                self._drop(sink, len(batch))
+
+        if errors:
+            raise errors[0]
+
+    def _drop(self, sink: CalendarSink, count: int):
+        with self._lock:
+            remaining = self.pending(sink)[count:]
+            queue_path = self._queue_path(sink)
+            tmp_path = queue_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(event) + "\n" for event in remaining)
+            os.replace(tmp_path, queue_path)
+
+
+_writer: CalendarWriter | None = None
+
+
+def get_calendar_writer() -> CalendarWriter:
+    global _writer
+    if _writer is None:
+        data_dir: Path = get_config_path().parent
+        sinks: List[CalendarSink] = [IcsSink(data_dir.joinpath("pomlet.ics"))]
+        if platform.system() == "Darwin":
+            sinks.append(AppleCalendarSink())
+        _writer = CalendarWriter(sinks, data_dir)
+    return _writer
+
+
+def flush_calendar_events():
+    """Flush queued events in the background, e.g. left over from the last run."""
+    get_dispatcher().submit("calendar", get_calendar_writer().flush, retries=2)
+
+
+def create_calendar_event(title, start_time, end_time):
+    """Record a finished pomodoro in the local .ics file and Apple Calendar (macOS)."""
+    get_calendar_writer().add_event(title, start_time, end_time)
+    flush_calendar_events()
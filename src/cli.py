@@ -0,0 +1,348 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Command line interface to the flashcards. It only uses the Qt-free core
+(everything in src/ outside src/gui), so it starts fast enough for scripts
+and cron jobs. For the same reason the core imports numpy inside the
+functions that use it, never at module level, and commands that do not
+need it never load it.
+"""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+from src.config import add_subject, get_subjects
+from src.questions_manager import QuestionManager
+
+
+def _ensure_subject(subject: str):
+    # the GUI lists subjects from the config, not from the flashcards
+    if subject not in get_subjects():
+        add_subject(subject)
+
+
+def cmd_due(args: argparse.Namespace) -> int:
+    due_count = None if args.exact else QuestionManager.peek_due_count()
+    if due_count is None:
+        due_count = QuestionManager().count()
+    print(due_count)
+    return 0
+
+
+def cmd_review(args: argparse.Namespace) -> int:
+    questions_manager = QuestionManager()
+    reviewed = 0
+    skipped = 0
+    print("Answer y (correct), n (wrong), s (skip) or q (quit).")
+
+    while args.limit is None or reviewed < args.limit:
+        question = questions_manager.get_next_to_repeat()
+        if question is None:
+            print("All done for today!")
+            break
+
+        print(f"\n[{question['subject']}] {question['question'].strip()}")
+        shown_at = time.monotonic()
+        answer = ""
+        while answer not in ("y", "n", "s", "q"):
+            print("> ", end="", flush=True)
+            line = sys.stdin.readline()
+            if line == "":  # end of input
+                answer = "q"
+                break
+            answer = line.strip().lower()
+
+        if answer == "q":
+            break
+        if answer == "s":
+            skipped += 1
+            continue
+        latency = time.monotonic() - shown_at
+        if answer == "y":
+            questions_manager.correct(question, latency)
+        else:
+            questions_manager.wrong(question, latency)
+        reviewed += 1
+
+    print(f"Reviewed {reviewed} flashcards" + (f", skipped {skipped}." if skipped else "."))
+    return 0
+
+
+def cmd_add(args: argparse.Namespace) -> int:
+    question_text = sys.stdin.read() if args.question == "-" else args.question
+    if question_text.strip() == "":
+        print("Question is empty", file=sys.stderr)
+        return 1
+
+    _ensure_subject(args.subject)
+    question = QuestionManager().add_question(question_text.strip(), args.subject)
+    print(question["id"])
+    return 0
+
+
+def _read_import_file(path: Path, default_subject: str) -> Dict[str, List[str]]:
+    """Questions by subject from an exported .json file or a .csv file.
+
+    Only the first CSV column is read, like the files in data/, all with
+    default_subject; files written by export start with a "question,subject"
+    header and keep their subjects. Rows with more columns than the header
+    are skipped and reported with their line number; a file the csv module
+    cannot parse raises ValueError.
+    """
+    grouped: Dict[str, List[str]] = {}
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            for question in json.load(f):
+                subject = question.get("subject") or default_subject
+                grouped.setdefault(subject, []).append(question["question"].strip())
+        return grouped
+
+    has_subjects = False
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        try:
+            for index, row in enumerate(reader):
+                if index == 0 and row == ["question", "subject"]:
+                    has_subjects = True
+                    continue
+                if not row or row[0].strip() == "":
+                    continue
+                if has_subjects and len(row) > 2:
+                    print(
+                        f"{path}:{reader.line_num}: expected question,subject, skipped",
+                        file=sys.stderr,
+                    )
+                    continue
+                subject = row[1].strip() if has_subjects and len(row) > 1 else ""
+                grouped.setdefault(subject or default_subject, []).append(row[0].strip())
+        except csv.Error as e:
+            raise ValueError(f"{path}:{reader.line_num}: {e}") from e
+    return grouped
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    path = Path(args.file)
+    try:
+        grouped = _read_import_file(path, args.subject or path.stem)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    questions_manager = QuestionManager()
+    total = 0
+    for subject, question_texts in grouped.items():
+        _ensure_subject(subject)
+        total += len(questions_manager.add_questions(question_texts, subject))
+
+    print(f"Imported {total} flashcards.")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    grouped = QuestionManager().get_all_grouped_by_subject()
+    questions = [q for subject in sorted(grouped) for q in grouped[subject]]
+
+    out = (
+        sys.stdout
+        if args.file in (None, "-")
+        else open(args.file, "w", newline="", encoding="utf-8")
+    )
+    try:
+        if args.format == "json":
+            json.dump(questions, out, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.writer(out)
+            writer.writerow(["question", "subject"])
+            for question in questions:
+                writer.writerow([question["question"].strip(), question["subject"]])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+def cmd_stats(args: argparse.Namespace) -> int:
+    now = datetime.now()
+    grouped = QuestionManager().get_all_grouped_by_subject()
+    rows = []
+    for subject in sorted(grouped):
+        questions = grouped[subject]
+        due = sum(
+            1
+            for q in questions
+            if q["next_repeat"] is not None
+            and datetime.fromisoformat(q["next_repeat"]) <= now
+        )
+        rows.append((subject, len(questions), due))
+
+    width = max([len("Subject")] + [len(row[0]) for row in rows])
+    print(f"{'Subject':<{width}}  {'Cards':>6}  {'Due':>6}")
+    for subject, cards, due in rows:
+        print(f"{subject:<{width}}  {cards:>6}  {due:>6}")
+    print(
+        f"{'Total':<{width}}  {sum(r[1] for r in rows):>6}  {sum(r[2] for r in rows):>6}"
+    )
+    return 0
+
+
+def cmd_forecast(args: argparse.Namespace) -> int:
+    counts = QuestionManager().forecast(args.days, simulate=args.simulate)
+    today = datetime.now().date()
+    for day, count in enumerate(counts):
+        print(f"{today + timedelta(days=day)}  {count:>8.0f}")
+    return 0
+
+
+def cmd_reschedule(args: argparse.Namespace) -> int:
+    rescheduled = QuestionManager().reschedule_all()
+    print(f"Rescheduled {rescheduled} flashcards.")
+    return 0
+
+
+def cmd_optimize(args: argparse.Namespace) -> int:
+    if not 0 < args.target < 1:
+        print("Target retention must be between 0 and 1", file=sys.stderr)
+        return 1
+
+    from src.optimizer import optimize
+
+    params = optimize(args.target, per_subject=not args.no_subjects)
+    if params is None:
+        print("Not enough new reviews since the last fit.")
+        return 0
+
+    print(f"Interval modifier: {params['interval_modifier']:.3f} ({params['reviews']} reviews)")
+    for name, subject in sorted(params["subjects"].items()):
+        print(f"  {name}: {subject['interval_modifier']:.3f}")
+    if args.reschedule:
+        QuestionManager().reschedule_all()
+    return 0
+
+
+def cmd_sessions(args: argparse.Namespace) -> int:
+    from src.session_log import BREAK, WORK, get_session_log
+
+    today = datetime.now().date()
+    until = args.until or today
+    since = args.since or until - timedelta(days=6)
+    minutes = get_session_log().minutes_by_subject(
+        datetime.combine(since, datetime.min.time()),
+        datetime.combine(until + timedelta(days=1), datetime.min.time()),
+        BREAK if args.breaks else WORK,
+    )
+
+    width = max([len("Subject")] + [len(subject) for subject in minutes])
+    print(f"{'Subject':<{width}}  {'Minutes':>8}")
+    for subject in sorted(minutes):
+        print(f"{subject:<{width}}  {minutes[subject]:>8.0f}")
+    print(f"{'Total':<{width}}  {sum(minutes.values()):>8.0f}")
+    return 0
+
+
+def _date(value: str):
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pomlet", description="Pomlet flashcards from the command line."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    due = commands.add_parser("due", help="print the number of flashcards to review")
+    due.add_argument(
+        "--exact", action="store_true", help="count from the deck, not the summary"
+    )
+    due.set_defaults(func=cmd_due)
+
+    review = commands.add_parser("review", help="review due flashcards via stdin")
+    review.add_argument("--limit", type=int, help="stop after this many flashcards")
+    review.set_defaults(func=cmd_review)
+
+    add = commands.add_parser("add", help="add a flashcard")
+    add.add_argument("subject")
+    add.add_argument("question", help="question text, or - to read it from stdin")
+    add.set_defaults(func=cmd_add)
+
+    import_ = commands.add_parser("import", help="import flashcards from .csv or .json")
+    import_.add_argument("file")
+    import_.add_argument(
+        "--subject", help="subject for rows without one (default: file name)"
+    )
+    import_.set_defaults(func=cmd_import)
+
+    export = commands.add_parser("export", help="export all flashcards")
+    export.add_argument("file", nargs="?", help="output file (default: stdout)")
+    export.add_argument("--format", choices=["csv", "json"], default="csv")
+    export.set_defaults(func=cmd_export)
+
+    stats = commands.add_parser("stats", help="flashcards and due count per subject")
+    stats.set_defaults(func=cmd_stats)
+
+    forecast = commands.add_parser("forecast", help="reviews due on each of the next days")
+    forecast.add_argument("--days", type=int, default=30)
+    forecast.add_argument(
+        "--simulate", action="store_true", help="simulate wrong answers too"
+    )
+    forecast.set_defaults(func=cmd_forecast)
+
+    reschedule = commands.add_parser(
+        "reschedule", help="recompute all due dates with the current scheduler"
+    )
+    reschedule.set_defaults(func=cmd_reschedule)
+
+    optimize = commands.add_parser(
+        "optimize", help="fit the scheduler's intervals on the review history"
+    )
+    optimize.add_argument(
+        "--target", type=float, default=0.9, help="recall probability at the due time"
+    )
+    optimize.add_argument(
+        "--no-subjects", action="store_true", help="fit one modifier for all subjects"
+    )
+    optimize.add_argument(
+        "--reschedule", action="store_true", help="apply it to the current due dates"
+    )
+    optimize.set_defaults(func=cmd_optimize)
+
+    sessions = commands.add_parser(
+        "sessions", help="minutes of pomodoros per subject, pauses excluded"
+    )
+    sessions.add_argument(
+        "--since", type=_date, help="first day, YYYY-MM-DD (default: 6 days before --until)"
+    )
+    sessions.add_argument("--until", type=_date, help="last day, YYYY-MM-DD (default: today)")
+    sessions.add_argument("--breaks", action="store_true", help="count breaks instead")
+    sessions.set_defaults(func=cmd_sessions)
+
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,14 +20,16 @@ import json
 import os
 from pathlib import Path
 
+from src.tracing import traced
+
 
 def get_config_path() -> Path:
-    print(os.getenv("DEV"))
     if os.getenv("DEV") == "True":
         return Path().joinpath("config.json")
 
-    dir_: Path = Path.home().joinpath(".pomodoro")
-    dir_.mkdir(exist_ok=True)
+    # POMLET_HOME relocates all data, e.g. for scripts or a second profile
+    dir_: Path = Path(os.getenv("POMLET_HOME") or Path.home().joinpath(".pomodoro"))
+    dir_.mkdir(parents=True, exist_ok=True)
     return dir_.joinpath("config.json")
 
 
@@ -100,11 +102,13 @@ def get_subjects():
     return list(config.keys())
 
 
+@traced("config.write", "config")
 def _write_config(config: dict):
     with open(get_config_path(), "w", encoding="utf-8") as f:
         json.dump(config, f)
 
 
+@traced("config.load", "config")
 def _load_config():
     config_file: Path = get_config_path()
     if not config_file.exists():
@@ -0,0 +1,128 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import math
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+SUMMARY_VERSION = 2
+HOUR = 60 * 60
+HORIZON_HOURS = 7 * 24  # hourly buckets for a week, then one "later" bucket
+
+
+def get_summary_path(question_path: Path) -> Path:
+    return question_path.with_name("questions_summary.json")
+
+
+def build_summary(questions: List[Dict[str, Any]], question_path: Path) -> Dict[str, Any]:
+    """Summarize the deck as saved in question_path.
+
+    Cards already due are only counted; those due within HORIZON_HOURS go
+    into a histogram keyed by the hour (since the epoch) from which they are
+    counted, and the rest are only counted as later.
+    """
+    now = time.time()
+    horizon = (math.ceil(now / HOUR) + HORIZON_HOURS) * HOUR
+    subjects: Dict[str, int] = {}
+    histogram: Dict[str, int] = {}
+    due = 0
+    later = 0
+    next_due = None
+
+    for q in questions:
+        subjects[q["subject"]] = subjects.get(q["subject"], 0) + 1
+        if q["next_repeat"] is None:
+            continue
+
+        ts = datetime.fromisoformat(q["next_repeat"]).timestamp()
+        if ts <= now:
+            due += 1
+            continue
+
+        next_due = ts if next_due is None else min(next_due, ts)
+        if ts > horizon:
+            later += 1
+            continue
+
+        hour = str(math.ceil(ts / HOUR))
+        histogram[hour] = histogram.get(hour, 0) + 1
+
+    stat = question_path.stat()
+    return {
+        "version": SUMMARY_VERSION,
+        "deck_mtime_ns": stat.st_mtime_ns,
+        "deck_size": stat.st_size,
+        "saved_at": now,
+        "subjects": subjects,
+        "due": due,
+        "due_histogram": histogram,
+        "horizon": horizon,
+        "later": later,
+        "next_due": next_due,
+    }
+
+
+def write_summary(questions: List[Dict[str, Any]], question_path: Path):
+    summary_path = get_summary_path(question_path)
+    tmp_path = summary_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(build_summary(questions, question_path), f)
+    os.replace(tmp_path, summary_path)
+
+
+def load_summary(question_path: Path) -> Dict[str, Any] | None:
+    """Load the summary, None if it is missing or does not match the deck on disk."""
+    summary_path = get_summary_path(question_path)
+    try:
+        with open(summary_path, encoding="utf-8") as f:
+            summary = json.load(f)
+        stat = question_path.stat()
+    except (OSError, ValueError):
+        return None
+
+    if (
+        summary.get("version") != SUMMARY_VERSION
+        or summary.get("deck_mtime_ns") != stat.st_mtime_ns
+        or summary.get("deck_size") != stat.st_size
+    ):
+        return None
+
+    return summary
+
+
+def count_due(summary: Dict[str, Any], now: float | None = None) -> int | None:
+    """Cards due at now, None once the summary is too old to tell.
+
+    Cards are counted from the end of the hour they come due in, so the
+    count may leave out those that came due in the last hour.
+    """
+    now = time.time() if now is None else now
+    if summary["next_due"] is None or summary["next_due"] > now:
+        return summary["due"]
+    if summary["later"] and now > summary["horizon"]:
+        return None
+
+    return summary["due"] + sum(
+        count
+        for hour, count in summary["due_histogram"].items()
+        if int(hour) * HOUR <= now
+    )
@@ -0,0 +1,161 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple
+
+from src import metrics
+from src.tracing import span
+
+logger = logging.getLogger(__name__)
+
+_side_effect_seconds = metrics.histogram(
+    "pomlet_side_effect_duration_seconds",
+    "Time to run a side effect (notification, calendar write, subprocess) by channel",
+)
+
+_Action = Tuple[Future, Callable[..., Any], tuple, dict, int, float]
+
+
+class Dispatcher:
+    """Run side effects (sounds, notifications, calendar writes) off the GUI thread.
+
+    Actions submitted on the same channel run one at a time, in submission
+    order. Different channels run concurrently, at most max_workers at once.
+    Workers are daemon threads: a hung action cannot keep the app from
+    exiting (an executor's threads are joined at interpreter exit).
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._workers = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[_Action]] = {}
+        self._draining: Set[str] = set()
+        self._threads: Dict[str, threading.Thread] = {}
+        self._closed = False
+
+    def submit(
+        self,
+        channel: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        retries: int = 0,
+        retry_delay: float = 0.5,
+        **kwargs: Any,
+    ) -> Future:
+        """Queue fn(*args, **kwargs) on channel, retrying it up to retries times."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(RuntimeError("Dispatcher is shut down"))
+                return future
+
+            queue = self._queues.setdefault(channel, deque())
+            queue.append((future, fn, args, kwargs, retries, retry_delay))
+            if channel not in self._draining:
+                self._draining.add(channel)
+                thread = threading.Thread(
+                    target=self._drain,
+                    args=(channel,),
+                    name=f"pomlet-side-effect-{channel}",
+                    daemon=True,
+                )
+                self._threads[channel] = thread
+                thread.start()
+
+        return future
+
+    def run(
+        self,
+        channel: str,
+        args: List[str],
+        timeout: float = 10,
+        retries: int = 0,
+    ) -> Future:
+        """Queue an external process, killed if it runs longer than timeout seconds."""
+        return self.submit(
+            channel,
+            subprocess.run,
+            args,
+            timeout=timeout,
+            check=True,
+            capture_output=True,
+            retries=retries,
+        )
+
+    def shutdown(self, wait: bool = True, timeout: float | None = None):
+        """Stop accepting actions; with wait, block until queued ones are done,
+        for at most timeout seconds. Actions still queued or running then are
+        abandoned when the process exits."""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads.values())
+        if not wait:
+            return
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+
+    def _drain(self, channel: str):
+        with self._workers:
+            self._drain_queue(channel)
+
+    def _drain_queue(self, channel: str):
+        while True:
+            with self._lock:
+                queue = self._queues[channel]
+                if not queue:
+                    self._draining.discard(channel)
+                    self._threads.pop(channel, None)
+                    return
+                future, fn, args, kwargs, retries, retry_delay = queue.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            for attempt in range(retries + 1):
+                try:
+                    with span(
+                        channel, "side-effect", attempt=attempt
+                    ), _side_effect_seconds.time(channel=channel):
+                        result = fn(*args, **kwargs)
+                except Exception as e:
+                    if attempt < retries:
+                        time.sleep(retry_delay)
+                        continue
+                    logger.warning("Side effect on %r failed: %s", channel, e)
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+                break
+
+
+_dispatcher: Dispatcher | None = None
+
+
+def get_dispatcher() -> Dispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = Dispatcher()
+    return _dispatcher
@@ -0,0 +1,105 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Forecast of the number of reviews per day. Every card is followed through
+all its repetitions inside the horizon, a whole generation of repetitions
+at a time: the due days are histogrammed, answers are drawn (or assumed
+correct) and the scheduler computes the next intervals for all of them in
+one NumPy pass.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from src.scheduler import Scheduler
+
+MAX_GENERATIONS = 1000
+
+
+def forecast(
+    cards: List[Dict[str, Any]],
+    scheduler: Scheduler,
+    days: int = 30,
+    simulate: bool = False,
+    runs: int = 5,
+    retention: float = 0.9,
+    seed: int | None = None,
+    now: datetime | None = None,
+) -> Any:
+    """Expected number of reviews on each of the next days, today first.
+
+    Overdue cards count for today. Without simulate every answer is assumed
+    correct; with it, each of runs simulations answers correctly with
+    probability retention ** (elapsed / scheduled interval), and the mean
+    over the runs is returned.
+    """
+    import numpy as np
+
+    now = datetime.now() if now is None else now
+    counts = np.zeros(days)
+    if not cards or days <= 0:
+        return counts
+
+    midnight = np.datetime64(now.replace(hour=0, minute=0, second=0, microsecond=0), "us")
+    one_day = np.timedelta64(86_400_000_000, "us")
+    elapsed_today = (np.datetime64(now, "us") - midnight) / one_day
+
+    # days since today's midnight
+    due = (
+        np.array([c["next_repeat"] for c in cards], dtype="datetime64[us]") - midnight
+    ) / one_day
+    last = (
+        np.array([c["last_repeated"] for c in cards], dtype="datetime64[us]") - midnight
+    ) / one_day
+    due = np.maximum(due, elapsed_today)
+    scheduled = np.maximum(due - last, 1 / 24)
+    state = scheduler.state_arrays(cards, np)
+
+    if simulate:
+        runs = max(runs, 1)
+        due, last, scheduled = (np.tile(a, runs) for a in (due, last, scheduled))
+        state = {key: np.tile(value, runs) for key, value in state.items()}
+    else:
+        runs = 1
+    rng = np.random.default_rng(seed)
+
+    def keep(mask):
+        nonlocal due, last, scheduled, state
+        due, last, scheduled = due[mask], last[mask], scheduled[mask]
+        state = {key: value[mask] for key, value in state.items()}
+
+    # cards leave the arrays once their next repetition is past the horizon
+    keep(due < days)
+    for _ in range(MAX_GENERATIONS):
+        if due.size == 0:
+            break
+
+        counts += np.bincount(due.astype(np.int64), minlength=days)[:days]
+
+        elapsed = due - last
+        if simulate:
+            recall = retention ** (elapsed / scheduled)
+            correct = rng.random(due.size) < recall
+        else:
+            correct = np.ones(due.size, dtype=bool)
+
+        scheduled = scheduler.review_arrays(state, correct, elapsed, np)
+        last = due
+        due = due + scheduled
+        keep(due < days)
+
+    return counts / runs
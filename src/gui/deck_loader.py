@@ -0,0 +1,47 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+
+from PySide6.QtCore import QThread, Signal
+
+from src import startup_profile
+from src.questions_manager import QuestionManager
+
+logger = logging.getLogger(__name__)
+
+
+class DeckLoader(QThread):
+    """Load the flashcard deck off the GUI thread.
+
+    Emits loaded with the QuestionManager, or failed with the error, e.g.
+    for a corrupt questions.json.
+    """
+
+    loaded = Signal(object)
+    failed = Signal(str)
+
+    def run(self):
+        try:
+            with startup_profile.phase("QuestionManager load"):
+                questions_manager = QuestionManager()
+        except Exception as e:
+            logger.exception("Could not load the flashcards")
+            self.failed.emit(str(e) or type(e).__name__)
+            return
+        self.loaded.emit(questions_manager)
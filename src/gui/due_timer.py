@@ -0,0 +1,61 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+from datetime import datetime
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from src.questions_manager import QuestionManager
+
+
+class DueTimer(QObject):
+    """Wake up when the next flashcard comes due, and only then.
+
+    A single-shot timer is armed for the earliest due time of the deck; when
+    it fires the cards that came due join the review queue, due_changed is
+    emitted with the new count and the timer is armed for the next card.
+    Call arm() again whenever flashcards are answered, added or removed.
+    """
+
+    due_changed = Signal(int)
+
+    # a timer may fire late after the computer slept, so it never waits
+    # longer than this before checking the clock again
+    MAX_WAIT_MS = 60 * 60 * 1000
+
+    def __init__(self, questions_manager: QuestionManager, parent=None):
+        super().__init__(parent)
+        self._questions_manager = questions_manager
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def arm(self):
+        next_due = self._questions_manager.next_due_time()
+        if next_due is None:
+            self._timer.stop()
+            return
+
+        wait_ms = math.ceil((next_due - datetime.now()).total_seconds() * 1000)
+        self._timer.start(min(max(wait_ms, 0), self.MAX_WAIT_MS))
+
+    def _on_timeout(self):
+        if self._questions_manager.promote_due():
+            self.due_changed.emit(self._questions_manager.count())
+        self.arm()
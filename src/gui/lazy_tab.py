@@ -0,0 +1,58 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Callable, Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from src import startup_profile
+
+
+class LazyTab(QWidget):
+    """Tab page showing a placeholder until its real widget is built."""
+
+    def __init__(self, name: str, factory: Callable[[], QWidget], placeholder: str):
+        super().__init__()
+        self._name = name
+        self._factory = factory
+        self._widget: Optional[QWidget] = None
+
+        self._placeholder = QLabel(placeholder)
+        self._placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._placeholder.setWordWrap(True)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._placeholder)
+
+    def set_placeholder(self, text: str):
+        self._placeholder.setText(text)
+
+    def build(self) -> QWidget:
+        if self._widget is None:
+            with startup_profile.phase(f"build {self._name} tab"):
+                self._widget = self._factory()
+            self.layout().removeWidget(self._placeholder)
+            self._placeholder.deleteLater()
+            self.layout().addWidget(self._widget)
+        return self._widget
+
+    @property
+    def widget(self) -> Optional[QWidget]:
+        return self._widget
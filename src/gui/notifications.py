@@ -0,0 +1,103 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import sys
+import time
+from typing import Dict, List
+
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QSystemTrayIcon
+
+from src import metrics
+from src.dispatcher import get_dispatcher
+
+_notification_delay_seconds = metrics.histogram(
+    "pomlet_notification_delay_seconds",
+    "Time from a notification request to its delivery, batching included",
+)
+
+
+class NotificationService(QObject):
+    """Deliver tray notifications, deduplicated, rate limited and batched.
+
+    A message identical to one delivered less than dedup_window seconds ago
+    is dropped. Messages arriving close together are joined into a single
+    notification, and deliveries are at least min_interval seconds apart.
+    """
+
+    def __init__(
+        self,
+        tray: QSystemTrayIcon,
+        dedup_window: float = 30.0,
+        min_interval: float = 3.0,
+        batch_delay: float = 0.25,
+    ):
+        super().__init__(tray)
+        self._tray = tray
+        self._dedup_window = dedup_window
+        self._min_interval = min_interval
+        self._batch_delay = batch_delay
+
+        self._pending: List[str] = []
+        self._pending_since: float = 0.0
+        self._sent_at: Dict[str, float] = {}
+        self._last_delivery: float = float("-inf")
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush)
+
+    def notify(self, msg: str):
+        now = time.monotonic()
+        if msg in self._pending or now - self._sent_at.get(msg, float("-inf")) < (
+            self._dedup_window
+        ):
+            return
+
+        if not self._pending:
+            self._pending_since = now
+        self._pending.append(msg)
+        if not self._flush_timer.isActive():
+            delay = max(self._batch_delay, self._last_delivery + self._min_interval - now)
+            self._flush_timer.start(int(delay * 1000))
+
+    def _flush(self):
+        if not self._pending:
+            return
+
+        now = time.monotonic()
+        msgs, self._pending = self._pending, []
+        self._last_delivery = now
+        self._sent_at = {
+            msg: sent_at
+            for msg, sent_at in self._sent_at.items()
+            if now - sent_at < self._dedup_window
+        }
+        for msg in msgs:
+            self._sent_at[msg] = now
+        _notification_delay_seconds.observe(now - self._pending_since)
+
+        text = "\n".join(msgs)
+        self._tray.showMessage("Pomlet", text, QSystemTrayIcon.MessageIcon.Information)
+        if sys.platform == "darwin":
+            escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+            get_dispatcher().run(
+                "notification",
+                ["osascript", "-e", f'display notification "{escaped}" with title "Pomlet"'],
+                timeout=5,
+            )
@@ -16,16 +16,25 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from PySide6.QtGui import QCloseEvent
+from typing import Optional
+
+from PySide6.QtGui import QCloseEvent, QPaintEvent
 from PySide6.QtWidgets import QTabWidget, QVBoxLayout, QWidget
 
-from src.gui.tabs.list_flashcard import ListTab
+from src import optimizer, startup_profile
+from src.calendar_manager import flush_calendar_events
 from src.config import get_subjects, load_config
+from src.gui.deck_loader import DeckLoader
+from src.gui.due_timer import DueTimer
+from src.gui.lazy_tab import LazyTab
+from src.gui.sound import get_sound_engine
 from src.gui.tabs.add_flashcard import AddTab
+from src.gui.tabs.list_flashcard import ListTab
 from src.gui.tabs.review_flashcard import ReviewTab
+from src.gui.tabs.stats import StatsTab
 from src.gui.tabs.timer.timer import TimerTab
 from src.gui.tray import Tray
-from src.questions_manager import QuestionManager
+from src.questions_manager import QuestionManager, get_question_path
 
 
 class PomodoroApp(QWidget):
@@ -35,37 +44,63 @@ class PomodoroApp(QWidget):
         self.setFixedSize(400, 560)
 
         self._subjects = get_subjects()
-        self._tray: Tray = Tray()
-
-        self._questions_manager: QuestionManager = QuestionManager()
-        self._to_repeat = self._questions_manager._questions_to_repeat
-        self._add_tab: AddTab = AddTab(self._questions_manager)
-        self._review_tab: ReviewTab = ReviewTab(self._questions_manager)
-        self._list_tab: ListTab = ListTab(self._questions_manager)
+        with startup_profile.phase("build tray"):
+            self._tray: Tray = Tray()
+        with startup_profile.phase("preload sound"):
+            get_sound_engine()  # decode the alert once, before the first session ends
+        flush_calendar_events()  # events still queued from the last run
+        self._painted: bool = False
+
+        # the timer needs no flashcards, the other tabs are built on first
+        # activation once the deck has been loaded in the background
+        self._questions_manager: Optional[QuestionManager] = None
+        self._due_timer: Optional[DueTimer] = None
         default_work, default_break = load_config(None)
-        self._timer_tab: TimerTab = TimerTab(
-            self._questions_manager, self._tray, default_work, default_break
+        with startup_profile.phase("build Timer tab"):
+            self._timer_tab: TimerTab = TimerTab(
+                self._tray, default_work, default_break
+            )
+        self._review_page = LazyTab(
+            "Review", self._build_review_tab, "Loading flashcards…"
+        )
+        self._add_page = LazyTab(
+            "Add", self._build_add_tab, "Loading flashcards…"
+        )
+        self._list_page = LazyTab(
+            "List", self._build_list_tab, "Loading flashcards…"
+        )
+        self._stats_page = LazyTab(
+            "Stats", self._build_stats_tab, "Loading flashcards…"
         )
 
         self._connect()
         self._build_tabs()
-        self._tray.showMsg(
-            f"Welcome back! There are {self._questions_manager.count()} flashcards to review today."
-        )
+
+        # the summary sidecar gives the due count without parsing the deck
+        self._welcomed: bool = False
+        due_count = QuestionManager.peek_due_count()
+        if due_count is not None:
+            self._review_page.set_placeholder(
+                f"There are {due_count} flashcards to review"
+                if due_count > 0
+                else "All done for today!"
+            )
+            self._welcome(due_count)
+
+        self._deck_loader = DeckLoader(self)
+        self._deck_loader.loaded.connect(self._on_deck_loaded)
+        self._deck_loader.failed.connect(self._on_deck_failed)
+        self._deck_loader.finished.connect(self._deck_loader.deleteLater)
+        self._deck_loader.start()
 
     def _connect(self):
-        self._timer_tab.subjects_updated.connect(self._add_tab.on_subjects_updated)
-        self._add_tab.flashcard_added.connect(self._review_tab.on_flashcard_added)
+        self._timer_tab.subjects_updated.connect(self._on_subjects_updated)
 
         self._timer_tab.tick.connect(self._tray.update)
         self._tray.start_signal.connect(self._timer_tab.start)
         self._tray.pause_signal.connect(self._timer_tab.toggle_pause)
         self._tray.stop_signal.connect(self._timer_tab.stop)
 
-        self._add_tab.flashcard_added.connect(self._list_tab.refresh)
-        self._review_tab.flashcard_modified.connect(self._list_tab.refresh)
-        self._add_tab.flashcard_added.connect(self._list_tab.refresh)
-
     def _build_tabs(self):
         self.setStyleSheet("""
         QPushButton {
@@ -74,13 +109,109 @@ class PomodoroApp(QWidget):
         """)
         self.tabs = QTabWidget(self)
         self.tabs.addTab(self._timer_tab, "Timer")
-        self.tabs.addTab(self._review_tab, "Review")
-        self.tabs.addTab(self._add_tab, "Add")
-        self.tabs.addTab(self._list_tab, "List")
+        self.tabs.addTab(self._review_page, "Review")
+        self.tabs.addTab(self._add_page, "Add")
+        self.tabs.addTab(self._list_page, "List")
+        self.tabs.addTab(self._stats_page, "Stats")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         layout = QVBoxLayout(self)
         layout.addWidget(self.tabs)
 
+    def _build_review_tab(self) -> ReviewTab:
+        review_tab = ReviewTab(self._questions_manager)
+        review_tab.flashcard_modified.connect(self._on_flashcard_modified)
+        return review_tab
+
+    def _build_add_tab(self) -> AddTab:
+        add_tab = AddTab(self._questions_manager)
+        add_tab.flashcard_added.connect(self._on_flashcard_added)
+        return add_tab
+
+    def _build_list_tab(self) -> ListTab:
+        return ListTab(self._questions_manager)
+
+    def _build_stats_tab(self) -> StatsTab:
+        return StatsTab(self._questions_manager)
+
+    def _on_deck_loaded(self, questions_manager: QuestionManager):
+        self._questions_manager = questions_manager
+        self._on_tab_changed(self.tabs.currentIndex())
+        due_count = self._questions_manager.count()
+        if not self._welcomed:
+            self._welcome(due_count)
+        self._tray.set_due_count(due_count)
+
+        self._due_timer = DueTimer(self._questions_manager, self)
+        self._due_timer.due_changed.connect(self._on_due_changed)
+        self._due_timer.arm()
+
+        # refit the scheduler on the review history, in another process
+        optimizer.start_background_optimization()
+
+        startup_profile.mark("deck loaded")
+        if self._painted:
+            startup_profile.finish()
+
+    def _on_deck_failed(self, error: str):
+        # the timer still works; the flashcard tabs say what went wrong
+        message = f"Could not load the flashcards from {get_question_path()}:\n{error}"
+        for page in (self._review_page, self._add_page, self._list_page, self._stats_page):
+            page.set_placeholder(message)
+        self._tray.showMsg("Could not load the flashcards, see the Review tab.")
+
+    def _welcome(self, due_count: int):
+        self._welcomed = True
+        self._tray.showMsg(
+            f"Welcome back! There are {due_count} flashcards to review today."
+        )
+
+    def _on_tab_changed(self, index: int):
+        page = self.tabs.widget(index)
+        if isinstance(page, LazyTab) and self._questions_manager is not None:
+            page.build()
+
+    def _on_subjects_updated(self, subject: str):
+        if self._add_page.widget is not None:
+            self._add_page.widget.on_subjects_updated(subject)
+
+    def _on_flashcard_added(self):
+        if self._review_page.widget is not None:
+            self._review_page.widget.on_flashcard_added()
+        if self._list_page.widget is not None:
+            self._list_page.widget.refresh()
+        if self._stats_page.widget is not None:
+            self._stats_page.widget.mark_stale()
+        self._on_schedule_changed()
+
+    def _on_flashcard_modified(self):
+        if self._list_page.widget is not None:
+            self._list_page.widget.refresh()
+        if self._stats_page.widget is not None:
+            self._stats_page.widget.mark_stale()
+        self._on_schedule_changed()
+
+    def _on_schedule_changed(self):
+        # the answered or added flashcard may now be the next one to come due
+        if self._due_timer is not None:
+            self._due_timer.arm()
+        if self._questions_manager is not None:
+            self._tray.set_due_count(self._questions_manager.count())
+
+    def _on_due_changed(self, due_count: int):
+        self._tray.set_due_count(due_count)
+        if self._review_page.widget is not None:
+            self._review_page.widget.on_due_changed(due_count)
+
+    def paintEvent(self, ev: QPaintEvent):
+        super().paintEvent(ev)
+        if not self._painted:
+            self._painted = True
+            startup_profile.mark("first paint")
+            if self._questions_manager is not None:
+                startup_profile.finish()
+
     def closeEvent(self, ev: QCloseEvent):
-        self._questions_manager.save_questions()
+        if self._questions_manager is not None:
+            self._questions_manager.save_questions()
         ev.accept()
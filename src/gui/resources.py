@@ -0,0 +1,57 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import QResource, QSize
+from PySide6.QtGui import QIcon
+
+from src import startup_profile
+
+logger = logging.getLogger(__name__)
+
+TRAY_ICON_SIZES = (16, 32, 64)
+
+_registered: bool = False
+
+
+def get_resources_path() -> Path:
+    # PyInstaller unpacks data files under sys._MEIPASS
+    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parents[2]))
+    return base.joinpath("assets", "assets.rcc")
+
+
+def register_resources() -> bool:
+    """Register the compiled assets.rcc on first use; Qt maps the file, not copies it."""
+    global _registered
+    if not _registered:
+        with startup_profile.phase("register resources"):
+            _registered = QResource.registerResource(str(get_resources_path()))
+        if not _registered:
+            logger.warning("Could not register resources from %s", get_resources_path())
+    return _registered
+
+
+def get_tray_icon() -> QIcon:
+    register_resources()
+    icon = QIcon()
+    for size in TRAY_ICON_SIZES:
+        icon.addFile(f":/tray_icon_{size}.png", QSize(size, size))
+    return icon
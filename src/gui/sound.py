@@ -0,0 +1,162 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import array
+import logging
+import math
+import os
+import platform
+import struct
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+
+try:
+    from PySide6.QtMultimedia import QAudioFormat, QAudioSink, QMediaDevices
+except ImportError:  # e.g. Linux without PulseAudio
+    QAudioSink = None
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 44100
+MACOS_ALERT = Path("/System/Library/Sounds/Ping.aiff")
+
+
+def synthesize_alert(sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Two-tone chime as 16-bit mono little-endian PCM."""
+    samples = array.array("h")
+    for freq, duration in ((880.0, 0.18), (1320.0, 0.32)):
+        n = int(sample_rate * duration)
+        for i in range(n):
+            envelope = math.exp(-6.0 * i / n)
+            value = math.sin(2 * math.pi * freq * i / sample_rate) * envelope
+            samples.append(int(value * 0.6 * 32767))
+
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def decode_aiff(path: Path) -> Tuple[bytes, int, int]:
+    """Decode a 16-bit PCM AIFF file into (little-endian PCM, rate, channels)."""
+    data = path.read_bytes()
+    if data[:4] != b"FORM" or data[8:12] != b"AIFF":
+        raise ValueError(f"{path} is not an AIFF file")
+
+    channels = sample_size = sample_rate = 0
+    pcm = b""
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos : pos + 4]
+        (size,) = struct.unpack(">I", data[pos + 4 : pos + 8])
+        body = data[pos + 8 : pos + 8 + size]
+        if chunk_id == b"COMM":
+            channels, _, sample_size = struct.unpack(">hIh", body[:8])
+            exponent, mantissa = struct.unpack(">HQ", body[8:18])
+            sample_rate = int(mantissa * 2.0 ** ((exponent & 0x7FFF) - 16383 - 63))
+        elif chunk_id == b"SSND":
+            (offset,) = struct.unpack(">I", body[:4])
+            pcm = body[8 + offset :]
+        pos += 8 + size + (size & 1)
+
+    if sample_size != 16 or not pcm or not sample_rate:
+        raise ValueError(f"Unsupported AIFF format in {path}")
+
+    samples = array.array("h", pcm[: len(pcm) // 2 * 2])
+    if sys.byteorder == "little":
+        samples.byteswap()
+    return samples.tobytes(), sample_rate, channels
+
+
+class NullSink:
+    """Audio output that plays nothing; used headless or without an audio device."""
+
+    def __init__(self):
+        self.played: List[int] = []
+
+    def play(self, pcm: QByteArray):
+        self.played.append(pcm.size())
+
+
+class QtSink:
+    """Non-blocking playback of in-memory PCM through QAudioSink."""
+
+    def __init__(self, sample_rate: int, channels: int):
+        audio_format = QAudioFormat()
+        audio_format.setSampleRate(sample_rate)
+        audio_format.setChannelCount(channels)
+        audio_format.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+
+        self._sink = QAudioSink(QMediaDevices.defaultAudioOutput(), audio_format)
+        self._buffer = QBuffer()
+
+    def play(self, pcm: QByteArray):
+        self._sink.stop()
+        self._buffer.close()
+        self._buffer.setData(pcm)
+        self._buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        self._sink.start(self._buffer)
+
+
+class SoundEngine:
+    """Decode the alert once and play it from memory without blocking."""
+
+    def __init__(self):
+        pcm, sample_rate, channels = self._load_alert()
+        self._pcm = QByteArray(pcm)
+        self._sink = self._make_sink(sample_rate, channels)
+
+    def _load_alert(self) -> Tuple[bytes, int, int]:
+        if platform.system() == "Darwin" and MACOS_ALERT.exists():
+            try:
+                return decode_aiff(MACOS_ALERT)
+            except (OSError, ValueError) as e:
+                logger.warning("Could not decode %s: %s", MACOS_ALERT, e)
+
+        return synthesize_alert(), SAMPLE_RATE, 1
+
+    def _make_sink(self, sample_rate: int, channels: int) -> NullSink | QtSink:
+        if os.getenv("POMLET_AUDIO") == "null" or QAudioSink is None:
+            return NullSink()
+        if QMediaDevices.defaultAudioOutput().isNull():
+            return NullSink()
+        return QtSink(sample_rate, channels)
+
+    def play(self):
+        self._sink.play(self._pcm)
+
+    @property
+    def sink(self):
+        return self._sink
+
+
+_engine: SoundEngine | None = None
+
+
+def get_sound_engine() -> SoundEngine:
+    global _engine
+    if _engine is None:
+        _engine = SoundEngine()
+    return _engine
+
+
+def play_sound():
+    """Play the alert when the timer ends."""
+    get_sound_engine().play()
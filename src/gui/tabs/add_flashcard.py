@@ -88,7 +88,6 @@ class AddTab(QWidget):
         self.flashcard_added.emit()
 
     def on_subjects_updated(self, subject: str):
-        print("Called ", subject)
         self._subject_box.clear()
         self._subject_box.addItems(get_subjects())
 
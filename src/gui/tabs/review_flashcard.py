@@ -16,6 +16,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import time
 from typing import Any, Dict, Optional
 
 from PySide6.QtCore import Qt, Signal
@@ -46,6 +47,7 @@ class ReviewTab(QWidget):
         self._start_review_btn: QPushButton = QPushButton("▶ Start Review")
         self._stop_review_btn: QPushButton = QPushButton("⏹")
         self._current_question: Optional[Dict[str, Any]] = None
+        self._shown_at: float = 0.0  # when the current question was shown
 
         self._modify_btn: QPushButton = QPushButton("✎ Modify")
         self._confirm_btn: QPushButton = QPushButton("✓ Confirm")
@@ -195,7 +197,10 @@ class ReviewTab(QWidget):
         if self._current_question is None:
             return
 
-        self._questions_manager.correct(self._current_question)
+        self._questions_manager.correct(
+            self._current_question, time.monotonic() - self._shown_at
+        )
+        self.flashcard_modified.emit()
         next_question: Dict[str, Any] | None = (
             self._questions_manager.get_next_to_repeat()
         )
@@ -207,7 +212,7 @@ class ReviewTab(QWidget):
         self._question_label.setText(next_question["question"])
         self._subject_label.setText(next_question["subject"])
         self._current_question = next_question
-        self.flashcard_modified.emit()
+        self._shown_at = time.monotonic()
 
     def _on_start_review(self):
         self._modify_btn.setEnabled(True)
@@ -227,12 +232,16 @@ class ReviewTab(QWidget):
         self._question_label.setText(next_question["question"])
         self._subject_label.setText(next_question["subject"])
         self._current_question = next_question
+        self._shown_at = time.monotonic()
 
     def _on_wrong(self):
         if self._current_question is None:
             return
 
-        self._questions_manager.wrong(self._current_question)
+        self._questions_manager.wrong(
+            self._current_question, time.monotonic() - self._shown_at
+        )
+        self.flashcard_modified.emit()
         next_question: Dict[str, Any] | None = (
             self._questions_manager.get_next_to_repeat()
         )
@@ -244,7 +253,7 @@ class ReviewTab(QWidget):
         self._question_label.setText(next_question["question"])
         self._subject_label.setText(next_question["subject"])
         self._current_question = next_question
-        self.flashcard_modified.emit()
+        self._shown_at = time.monotonic()
 
     def on_flashcard_added(self):
         self._start_review_btn.setEnabled(True)
@@ -253,6 +262,13 @@ class ReviewTab(QWidget):
             f"There are {self._questions_manager.count()} flashcards to review"
         )
 
+    def on_due_changed(self, due_count: int):
+        """Flashcards came due; during a review they are already queued."""
+        if self._stop_review_btn.isEnabled():
+            return
+        self._start_review_btn.setEnabled(due_count > 0)
+        self._set_question_label()
+
     @property
     def start_review_btn(self):
         return self._start_review_btn
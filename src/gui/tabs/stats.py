@@ -0,0 +1,439 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+from PySide6.QtCore import QPointF, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QMouseEvent, QPainter, QPalette, QPixmap, QShowEvent
+from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QSizePolicy,
+    QToolTip,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.questions_manager import QuestionManager
+from src.stats import StatsStore, get_stats_store, retention
+
+
+class ForecastChart(QWidget):
+    """Bar chart of reviews per day, grouped into at most MAX_BARS bars."""
+
+    MAX_BARS = 60
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._start = date.today()
+        self._bars: List[float] = []
+        self._days = 0
+        self._days_per_bar = 1
+        self.setMinimumHeight(160)
+        self.setMouseTracking(True)
+
+    def set_data(self, counts: Sequence[float], start: date):
+        self._start = start
+        self._days = len(counts)
+        self._days_per_bar = max(1, math.ceil(len(counts) / self.MAX_BARS))
+        self._bars = [
+            float(sum(counts[i : i + self._days_per_bar]))
+            for i in range(0, len(counts), self._days_per_bar)
+        ]
+        self.update()
+
+    def _plot_rect(self) -> QRectF:
+        return QRectF(8, 20, self.width() - 16, self.height() - 40)
+
+    def _bar_at(self, x: float) -> int | None:
+        plot = self._plot_rect()
+        if not self._bars or not plot.left() <= x < plot.right():
+            return None
+        return int((x - plot.left()) / plot.width() * len(self._bars))
+
+    def mouseMoveEvent(self, ev: QMouseEvent):
+        index = self._bar_at(ev.position().x())
+        if index is None:
+            QToolTip.hideText()
+            return
+
+        first = self._start + timedelta(days=index * self._days_per_bar)
+        when = first.strftime("%d %b")
+        if self._days_per_bar > 1:
+            last = min(
+                first + timedelta(days=self._days_per_bar - 1),
+                self._start + timedelta(days=self._days - 1),
+            )
+            when += f" – {last.strftime('%d %b')}"
+        QToolTip.showText(
+            ev.globalPosition().toPoint(), f"{when}: {self._bars[index]:.0f} reviews", self
+        )
+
+    def paintEvent(self, _):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        text_color = self.palette().color(QPalette.ColorRole.WindowText)
+        bar_color = self.palette().color(QPalette.ColorRole.Highlight)
+
+        plot = self._plot_rect()
+        painter.setPen(text_color)
+        if not self._bars or max(self._bars) <= 0:
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Nothing due")
+            return
+
+        peak = max(self._bars)
+        painter.drawText(
+            QRectF(plot.left(), 0, plot.width(), 18),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"{peak:.0f}"
+            + (f" per {self._days_per_bar} days" if self._days_per_bar > 1 else ""),
+        )
+
+        width = plot.width() / len(self._bars)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(bar_color)
+        for i, value in enumerate(self._bars):
+            height = plot.height() * value / peak
+            painter.drawRect(
+                QRectF(
+                    plot.left() + i * width + width * 0.1,
+                    plot.bottom() - height,
+                    max(width * 0.8, 1),
+                    height,
+                )
+            )
+
+        painter.setPen(text_color)
+        labels = QRectF(plot.left(), plot.bottom() + 2, plot.width(), 18)
+        end = self._start + timedelta(days=self._days - 1)
+        painter.drawText(labels, Qt.AlignmentFlag.AlignLeft, self._start.strftime("%d %b"))
+        painter.drawText(labels, Qt.AlignmentFlag.AlignRight, end.strftime("%d %b"))
+
+
+class ActivityHeatmap(QWidget):
+    """Calendar of one year, a column per week, shaded by the day's activity.
+
+    The cells shrink to fit the 54 weeks in the available width. Values come
+    from the per-day rollups of the statistics, and the drawn calendar is
+    kept as a pixmap until the statistics change or the widget is resized.
+    """
+
+    CELL = 11  # at most
+    GAP = 2
+    WEEKS = 54  # a leap year starting on a Sunday spans 54 weeks
+    MIN_STEP = 4
+    TOP = 16  # room for the month names
+    LEVELS = 4
+    METRICS = {"minutes": "focus minutes", "reviews": "reviews"}
+
+    def __init__(self, stats: StatsStore, parent=None):
+        super().__init__(parent)
+        self._stats = stats
+        self._year = date.today().year
+        self._metric = "minutes"
+        # (year, metric, device pixel ratio) -> (statistics version, pixmap)
+        self._cache: Dict[Tuple[int, str, float], Tuple[int, QPixmap]] = {}
+        policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+        self.setMouseTracking(True)
+
+    def _step(self, width: int) -> float:
+        """Distance between two weeks for a widget this wide."""
+        return max(min((width - self.GAP) / self.WEEKS, self.CELL + self.GAP), self.MIN_STEP)
+
+    def _left(self) -> float:
+        """Left edge of the first week, so the calendar is centred."""
+        return max((self.width() - self.WEEKS * self._step(self.width())) / 2, 0)
+
+    def sizeHint(self) -> QSize:
+        width = self.WEEKS * (self.CELL + self.GAP) + self.GAP
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self) -> QSize:
+        width = self.WEEKS * self.MIN_STEP + self.GAP
+        return QSize(width, self.heightForWidth(width))
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        return math.ceil(self.TOP + 7 * self._step(width))
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        self._cache.clear()
+
+    @property
+    def year(self) -> int:
+        return self._year
+
+    def set_year(self, year: int):
+        self._year = year
+        self.update()
+
+    def set_metric(self, metric: str):
+        self._metric = metric
+        self.update()
+
+    def _first_monday(self) -> date:
+        first = date(self._year, 1, 1)
+        return first - timedelta(days=first.weekday())
+
+    def _cell(self, day: date) -> QRectF:
+        offset = (day - self._first_monday()).days
+        step = self._step(self.width())
+        cell = step * self.CELL / (self.CELL + self.GAP)
+        return QRectF(
+            self._left() + offset // 7 * step, self.TOP + offset % 7 * step, cell, cell
+        )
+
+    def _render(self, ratio: float) -> QPixmap:
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        days = self._stats.days()
+        first, last = date(self._year, 1, 1), date(self._year, 12, 31)
+        values: List[Tuple[date, float]] = []
+        day = first
+        while day <= last:
+            rollup = days.get(day.isoformat())
+            values.append((day, rollup[self._metric] if rollup is not None else 0))
+            day += timedelta(days=1)
+        peak = max((value for _, value in values), default=0)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        empty = self.palette().color(QPalette.ColorRole.Mid)
+        empty.setAlpha(60)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for day, value in values:
+            if value <= 0 or peak <= 0:
+                painter.setBrush(empty)
+            else:
+                level = math.ceil(value / peak * self.LEVELS)
+                color = QColor(self.palette().color(QPalette.ColorRole.Highlight))
+                color.setAlphaF(0.25 + 0.75 * level / self.LEVELS)
+                painter.setBrush(color)
+            cell = self._cell(day)
+            painter.drawRoundedRect(cell, cell.width() / 5, cell.width() / 5)
+
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        font = painter.font()
+        font.setPointSizeF(font.pointSizeF() * 0.8)
+        painter.setFont(font)
+        for month in range(1, 13):
+            first_of_month = date(self._year, month, 1)
+            cell = self._cell(first_of_month)
+            painter.drawText(QPointF(cell.left(), self.TOP - 4), first_of_month.strftime("%b"))
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, _):
+        ratio = self.devicePixelRatioF()
+        key = (self._year, self._metric, ratio)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != self._stats.version:
+            cached = (self._stats.version, self._render(ratio))
+            self._cache[key] = cached
+        QPainter(self).drawPixmap(0, 0, cached[1])
+
+    def changeEvent(self, ev):
+        super().changeEvent(ev)
+        if ev.type() == ev.Type.PaletteChange:
+            self._cache.clear()
+
+    def mouseMoveEvent(self, ev: QMouseEvent):
+        step = self._step(self.width())
+        column = int((ev.position().x() - self._left()) // step)
+        row = int((ev.position().y() - self.TOP) // step)
+        day = self._first_monday() + timedelta(days=column * 7 + row)
+        if not (0 <= row < 7 and 0 <= column and day.year == self._year):
+            QToolTip.hideText()
+            return
+
+        value = self._stats.day(day)[self._metric]
+        QToolTip.showText(
+            ev.globalPosition().toPoint(),
+            f"{day.strftime('%a %d %b %Y')}: {value:.0f} {self.METRICS[self._metric]}",
+            self,
+        )
+
+
+def _percent(value: float | None) -> str:
+    return "–" if value is None else f"{value:.0%}"
+
+
+class StatsTab(QWidget):
+    HORIZONS = {"30 days": 30, "90 days": 90, "365 days": 365}
+    PERIODS = {"Last 7 days": 7, "Last 30 days": 30, "Last 365 days": 365, "All time": None}
+
+    def __init__(self, questions_manager: QuestionManager):
+        super().__init__()
+        self._questions_manager = questions_manager
+        self._stats = get_stats_store()
+
+        self._today_label = QLabel()
+        self._heatmap = ActivityHeatmap(self._stats)
+        self._heatmap_metric_box = QComboBox()
+        self._previous_year_btn = QPushButton("◀")
+        self._next_year_btn = QPushButton("▶")
+        self._year_label = QLabel()
+        self._period_box = QComboBox()
+        self._subjects_tree = QTreeWidget()
+        self._horizon_box = QComboBox()
+        self._simulate_box = QCheckBox("Simulate answers")
+        self._chart = ForecastChart()
+        self._summary_label = QLabel()
+        self._stale: bool = False
+        self._build()
+
+    def _build(self):
+        self._today_label.setWordWrap(True)
+        self._period_box.addItems(list(self.PERIODS))
+        self._period_box.setCurrentIndex(1)
+        self._subjects_tree.setRootIsDecorated(False)
+        self._subjects_tree.setHeaderLabels(["Subject", "Reviews", "Correct", "Added", "Minutes"])
+        self._period_box.currentIndexChanged.connect(self._refresh_history)
+
+        for metric, name in ActivityHeatmap.METRICS.items():
+            self._heatmap_metric_box.addItem(name.capitalize(), metric)
+        self._heatmap_metric_box.currentIndexChanged.connect(
+            lambda: self._heatmap.set_metric(self._heatmap_metric_box.currentData())
+        )
+        self._previous_year_btn.clicked.connect(lambda: self._show_year(-1))
+        self._next_year_btn.clicked.connect(lambda: self._show_year(1))
+        self._show_year(0)
+
+        heatmap_controls = QHBoxLayout()
+        heatmap_controls.addWidget(self._previous_year_btn)
+        heatmap_controls.addWidget(self._year_label)
+        heatmap_controls.addWidget(self._next_year_btn)
+        heatmap_controls.addStretch()
+        heatmap_controls.addWidget(self._heatmap_metric_box)
+
+        period = QHBoxLayout()
+        period.addWidget(QLabel("By subject:"))
+        period.addStretch()
+        period.addWidget(self._period_box)
+
+        self._horizon_box.addItems(list(self.HORIZONS))
+        self._simulate_box.setToolTip(
+            "Include the extra reviews of flashcards you will get wrong"
+        )
+        self._summary_label.setWordWrap(True)
+        self._summary_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self._horizon_box.currentIndexChanged.connect(self.refresh)
+        self._simulate_box.toggled.connect(self.refresh)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Reviews in the next"))
+        controls.addWidget(self._horizon_box)
+        controls.addStretch()
+        controls.addWidget(self._simulate_box)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self._today_label)
+        layout.addLayout(heatmap_controls)
+        layout.addWidget(self._heatmap)
+        layout.addLayout(period)
+        layout.addWidget(self._subjects_tree)
+        layout.addLayout(controls)
+        layout.addWidget(self._chart)
+        layout.addWidget(self._summary_label)
+
+        self.refresh()
+
+    def mark_stale(self):
+        """Refresh the next time the tab is shown, not on every answer."""
+        if self.isVisible():
+            self.refresh()
+        else:
+            self._stale = True
+
+    def showEvent(self, ev: QShowEvent):
+        super().showEvent(ev)
+        if self._stale:
+            self.refresh()
+        else:
+            self._refresh_history()  # cheap, and pomodoros do not mark the tab stale
+
+    def _show_year(self, delta: int):
+        year = self._heatmap.year + delta
+        self._heatmap.set_year(year)
+        self._year_label.setText(str(year))
+        self._next_year_btn.setEnabled(year < date.today().year)
+
+    def _refresh_history(self):
+        today = date.today()
+        rollup = self._stats.day(today)
+        current, longest = self._stats.streak(today)
+        self._today_label.setText(
+            f"Today: {rollup['reviews']} reviews ({_percent(retention(rollup))} correct)"
+            f" · {rollup['added']} added · {rollup['minutes']:.0f} focus minutes\n"
+            f"Streak: {current} days · longest: {longest} days"
+        )
+
+        days = self.PERIODS[self._period_box.currentText()]
+        if days is None:
+            subjects = self._stats.subjects()
+        else:
+            subjects = self._stats.period(today - timedelta(days=days - 1), today)["subjects"]
+
+        self._subjects_tree.clear()
+        for subject, counts in sorted(subjects.items()):
+            item = QTreeWidgetItem(
+                [
+                    subject or "(deleted flashcards)",
+                    str(counts["reviews"]),
+                    _percent(retention(counts)),
+                    str(counts["added"]),
+                    f"{counts['minutes']:.0f}",
+                ]
+            )
+            for column in range(1, 5):
+                item.setTextAlignment(column, Qt.AlignmentFlag.AlignRight)
+            self._subjects_tree.addTopLevelItem(item)
+        self._subjects_tree.resizeColumnToContents(0)
+        self._heatmap.update()  # redrawn only if the statistics changed
+
+    def refresh(self):
+        self._stale = False
+        self._refresh_history()
+        days = self.HORIZONS[self._horizon_box.currentText()]
+        counts = self._questions_manager.forecast(
+            days, simulate=self._simulate_box.isChecked(), seed=0
+        )
+        today = date.today()
+        self._chart.set_data(counts.tolist(), today)
+
+        busiest = int(counts.argmax()) if len(counts) else 0
+        self._summary_label.setText(
+            f"Today: {counts[0]:.0f} reviews · next 7 days: {counts[:7].sum():.0f}\n"
+            f"Busiest day: {(today + timedelta(days=busiest)).strftime('%a %d %b')} "
+            f"({counts[busiest]:.0f} reviews)"
+        )
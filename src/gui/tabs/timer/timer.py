@@ -30,11 +30,11 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSlider,
-    QSystemTrayIcon,
     QVBoxLayout,
     QWidget,
 )
 
+from src import metrics
 from src.calendar_manager import create_calendar_event
 from src.config import (
     add_subject,
@@ -43,12 +43,19 @@ from src.config import (
     modify_subject,
     remove_subject,
 )
+from src.gui.sound import play_sound
 from src.gui.tabs.timer.progress_circle import ProgressCircle
-from src.questions_manager import QuestionManager
-from src.sound import play_sound
+from src.gui.tray import Tray
+from src.session_log import BREAK, WORK, focus_minutes, get_session_log
+from src.stats import get_stats_store
+from src.timer_state import clear_timer_state, load_timer_state, save_timer_state
 
 logger = logging.getLogger(__name__)
 
+_tick_seconds = metrics.histogram(
+    "pomlet_tick_duration_seconds", "Time spent in the timer tick handler"
+)
+
 
 class SessionType(enum.Enum):
     BREAK = enum.auto()
@@ -62,8 +69,7 @@ class TimerTab(QWidget):
 
     def __init__(
         self,
-        questions_manager: QuestionManager,
-        tray: QSystemTrayIcon,
+        tray: Tray,
         default_work: int,
         default_break: int,
     ):
@@ -75,8 +81,7 @@ class TimerTab(QWidget):
         # with open("src/gui/style.css") as f:
         #     self.setStyleSheet(f.read())
 
-        self._questions_manager: QuestionManager = questions_manager
-        self._tray: QSystemTrayIcon = tray
+        self._tray: Tray = tray
         self._subjects: List[str] = get_subjects()
         self._subject_box = QComboBox()
         self._add_btn = QPushButton("+")
@@ -89,6 +94,9 @@ class TimerTab(QWidget):
         self._remaining_time: timedelta = timedelta()
         self._session_end_time: Optional[datetime] = None
         self._work_started_at = None
+        self._session_started_at: Optional[datetime] = None
+        self._paused_seconds: float = 0.0
+        self._paused_at: Optional[datetime] = None
         self._work_done: bool = False
         self._paused: bool = False
 
@@ -102,8 +110,10 @@ class TimerTab(QWidget):
         self._pause_btn = QPushButton("⏸ Pause")
         self._circle = ProgressCircle()
 
+        saved_state = load_timer_state()
         self._build()
         self._reset()
+        self._restore(saved_state)
 
     def _build(self):
         layout = QVBoxLayout(self)
@@ -213,8 +223,9 @@ class TimerTab(QWidget):
         ):
             self._start_break()
         else:
+            if self._session_end_time is None:
+                self._work_started_at = datetime.now()
             self._start_session(SessionType.WORK, self._work_slider.value())
-            self._work_started_at = datetime.now()
 
     def _start_break(self):
         self._start_session(SessionType.BREAK, self._break_slider.value())
@@ -226,9 +237,12 @@ class TimerTab(QWidget):
 
         self._current_session_type = session_type
         self._total_time = timedelta(minutes=minutes)
-        self._session_end_time = datetime.now() + self._total_time
+        self._session_started_at = datetime.now()
+        self._session_end_time = self._session_started_at + self._total_time
         self._remaining_time = self._total_time
         self._paused = False
+        self._paused_seconds = 0.0
+        self._paused_at = None
 
         self._start_btn.setEnabled(False)
         self._stop_btn.setEnabled(True)
@@ -240,12 +254,18 @@ class TimerTab(QWidget):
 
         self._update_circle()
         self._timer.start(1000)
+        self._checkpoint()
 
     def stop(self):
+        if self._current_session_type is not SessionType.NONE:
+            self._log_session(datetime.now(), interrupted=True)
         self._reset()
 
     def toggle_pause(self):
         if self._paused:
+            if self._paused_at is not None:
+                self._paused_seconds += (datetime.now() - self._paused_at).total_seconds()
+                self._paused_at = None
             self._session_end_time = datetime.now() + self._remaining_time
             self._timer.start(1000)
             self._pause_btn.setText("⏸ Pause")
@@ -255,21 +275,24 @@ class TimerTab(QWidget):
                 return
 
             self._remaining_time = self._session_end_time - datetime.now()
+            self._paused_at = datetime.now()
             self._timer.stop()
             self._pause_btn.setText("▶ Resume")
         self._paused = not self._paused
+        self._checkpoint()
 
     def _tick(self):
         if self._session_end_time is None:
             logger.warning("Tried to tick, but no session running!")
             return
 
-        self._remaining_time = self._session_end_time - datetime.now()
-        if self._remaining_time.total_seconds() <= 0:
-            self._timer.stop()
-            self._session_done()
-            return
-        self._update_circle()
+        with _tick_seconds.time():
+            self._remaining_time = self._session_end_time - datetime.now()
+            if self._remaining_time.total_seconds() <= 0:
+                self._timer.stop()
+                self._session_done()
+                return
+            self._update_circle()
 
     def _update_circle(self):
         total_secs = int(self._remaining_time.total_seconds())
@@ -280,19 +303,48 @@ class TimerTab(QWidget):
         self.tick.emit(mins, secs)
         self._circle.update_progress(percent, time_to_display)
 
-    def _session_done(self):
-        play_sound()
+    def _log_session(self, ended_at: datetime, interrupted: bool):
+        paused = self._paused_seconds
+        if self._paused_at is not None:
+            paused += (ended_at - self._paused_at).total_seconds()
+        subject = self._subject_box.currentText()
+        started_at = self._session_started_at or ended_at - self._total_time
+        work = self._current_session_type is SessionType.WORK
+        get_session_log().append(
+            subject,
+            WORK if work else BREAK,
+            started_at,
+            ended_at,
+            self._total_time.total_seconds(),
+            paused,
+            interrupted,
+        )
+        if work:
+            # same minutes, and day, as the session log reports
+            get_stats_store().record_session(
+                subject,
+                focus_minutes(started_at.timestamp(), ended_at.timestamp(), paused),
+                started_at,
+            )
+
+    def _session_done(self, ended_at: Optional[datetime] = None):
+        """Finish the current session; ended_at is set when it ended while closed."""
+        if ended_at is None:
+            play_sound()
+            ended_at = datetime.now()
+
+        self._log_session(ended_at, interrupted=False)
         if self._current_session_type is SessionType.WORK:
             msg: str = "Time's up! Take a break!"
             self._work_done = True
             title = f"{self._subject_box.currentText()} Pomodoro"
-            create_calendar_event(title, self._work_started_at, datetime.now())
+            create_calendar_event(title, self._work_started_at, ended_at)
             self._start_btn.setText("▶ Start Break")
         else:
             msg = "Time's up! Get back to work!"
             self._start_btn.setText("▶ Start")
 
-        self._tray.showMessage("Pomlet", msg, QSystemTrayIcon.MessageIcon.Information)
+        self._tray.showMsg(msg)
         self._start_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         self._pause_btn.setEnabled(False)
@@ -302,6 +354,126 @@ class TimerTab(QWidget):
 
         self._current_session_type = SessionType.NONE
         self._session_end_time = None
+        self._checkpoint()
+
+    def _checkpoint(self):
+        """Persist the session so it survives a crash or quit (transitions only)."""
+        if self._current_session_type is SessionType.NONE and not self._work_done:
+            clear_timer_state()
+            return
+
+        save_timer_state(
+            {
+                "session_type": self._current_session_type.name,
+                "subject": self._subject_box.currentText(),
+                "total_seconds": self._total_time.total_seconds(),
+                "remaining_seconds": self._remaining_time.total_seconds(),
+                "session_end_time": (
+                    self._session_end_time.isoformat()
+                    if self._session_end_time is not None
+                    else None
+                ),
+                "work_started_at": (
+                    self._work_started_at.isoformat()
+                    if self._work_started_at is not None
+                    else None
+                ),
+                "work_done": self._work_done,
+                "paused": self._paused,
+                "session_started_at": (
+                    self._session_started_at.isoformat()
+                    if self._session_started_at is not None
+                    else None
+                ),
+                "paused_seconds": self._paused_seconds,
+                "paused_at": (
+                    self._paused_at.isoformat() if self._paused_at is not None else None
+                ),
+            }
+        )
+
+    def _restore(self, state: Optional[dict]):
+        """Resume a checkpointed session, or finalize it if it ended meanwhile.
+
+        The _reset() before it cleared the checkpoint, so every branch writes
+        it back.
+        """
+        if state is None:
+            return
+
+        try:
+            session_type = SessionType[state["session_type"]]
+            total_time = timedelta(seconds=state["total_seconds"])
+            remaining_time = timedelta(seconds=state["remaining_seconds"])
+            session_end_time = (
+                datetime.fromisoformat(state["session_end_time"])
+                if state["session_end_time"] is not None
+                else None
+            )
+            work_started_at = (
+                datetime.fromisoformat(state["work_started_at"])
+                if state["work_started_at"] is not None
+                else None
+            )
+            # missing in checkpoints written before the session log
+            session_started_at = (
+                datetime.fromisoformat(state["session_started_at"])
+                if state.get("session_started_at") is not None
+                else None
+            )
+            paused_at = (
+                datetime.fromisoformat(state["paused_at"])
+                if state.get("paused_at") is not None
+                else None
+            )
+            paused_seconds = float(state.get("paused_seconds", 0.0))
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Discarding unreadable timer state: %s", state)
+            clear_timer_state()
+            return
+
+        if state["subject"] in self._subjects:
+            self._subject_box.setCurrentText(state["subject"])
+
+        self._work_started_at = work_started_at
+        self._work_done = state["work_done"]
+        if self._work_done:
+            self._start_btn.setText("▶ Start Break")
+
+        if session_type is SessionType.NONE or total_time.total_seconds() <= 0:
+            self._checkpoint()
+            return
+
+        self._current_session_type = session_type
+        self._total_time = total_time
+        self._remaining_time = remaining_time
+        self._session_end_time = session_end_time
+        self._session_started_at = session_started_at
+        self._paused_seconds = paused_seconds
+        self._paused_at = paused_at
+
+        self._start_btn.setEnabled(False)
+        self._stop_btn.setEnabled(True)
+        self._pause_btn.setEnabled(True)
+        self._work_slider.setEnabled(False)
+        self._break_slider.setEnabled(False)
+        self._subject_box.setEnabled(False)
+
+        if state["paused"]:
+            self._paused = True
+            self._pause_btn.setText("▶ Resume")
+            self._update_circle()
+            self._checkpoint()
+            return
+
+        if session_end_time is None or session_end_time <= datetime.now():
+            self._session_done(ended_at=session_end_time or datetime.now())  # checkpoints
+            return
+
+        self._remaining_time = session_end_time - datetime.now()
+        self._update_circle()
+        self._timer.start(1000)
+        self._checkpoint()
 
     def on_subject_changed(self):
         subject: str = self._subject_box.currentText()
@@ -358,6 +530,7 @@ class TimerTab(QWidget):
         self._break_slider.setEnabled(True)
 
         self._circle.reset(f"{self._work_slider.value():02}:00")
+        self._checkpoint()
 
     def _work_changed(self, val: int):
         self._work_value_label.setText(f"{val} min")
@@ -16,15 +16,16 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import subprocess
-import sys
-from pathlib import Path
+from datetime import datetime
 
 from PySide6.QtCore import QPoint, QSize, Qt, Signal
 from PySide6.QtGui import QAction, QIcon, QPainter, QPixmap, QRegion
 from PySide6.QtWidgets import QApplication, QLabel, QMenu, QMessageBox, QSystemTrayIcon
 
-import src.gui.assets  # tray icon
+from src import tracing
+from src.config import get_config_path
+from src.gui.notifications import NotificationService
+from src.gui.resources import get_tray_icon
 
 
 class Tray(QSystemTrayIcon):
@@ -34,15 +35,17 @@ class Tray(QSystemTrayIcon):
 
     def __init__(self):
         super().__init__()
-        print(Path().absolute())
-        self._initial_icon: QIcon = QIcon(":/tray_icon.png")
+        self._initial_icon: QIcon = get_tray_icon()
         self._menu: QMenu = QMenu()
+        self._notifications = NotificationService(self)
 
         # actions
         self._time_left = QAction("")
+        self._due = QAction("")
         self._start_timer = QAction("Start")
         self._pause_timer = QAction("Pause")
         self._stop_timer = QAction("Stop")
+        self._export_trace = QAction("Export Trace...")
         self._about = QAction("About...")
         self._quit = QAction("Quit")
 
@@ -66,27 +69,39 @@ class Tray(QSystemTrayIcon):
         self.setIcon(self._initial_icon)
         self.setVisible(True)
         self._time_left.setVisible(False)
+        self._due.setEnabled(False)
+        self._due.setVisible(False)
 
         self._pause_timer.setEnabled(False)
 
         # connect actions
         self._quit.triggered.connect(QApplication.quit)
         self._about.triggered.connect(self._show_about)
+        self._export_trace.triggered.connect(self._on_export_trace)
+        self._export_trace.setVisible(tracing.enabled())
         self._start_timer.triggered.connect(self.start)
         self._pause_timer.triggered.connect(self.pause)
         self._stop_timer.triggered.connect(self.stop)
 
         # add actions
+        self._menu.addAction(self._due)
         self._menu.addAction(self._time_left)
         self._menu.addAction(self._start_timer)
         self._menu.addAction(self._pause_timer)
         self._menu.addAction(self._stop_timer)
+        self._menu.addAction(self._export_trace)
         self._menu.addAction(self._about)
         self._menu.addAction(self._quit)
 
         # Add the menu to the tray
         self.setContextMenu(self._menu)
 
+    def _on_export_trace(self):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        trace_path = get_config_path().parent.joinpath(f"trace-{stamp}.json")
+        count = tracing.export_chrome_trace(trace_path)
+        self.showMsg(f"Exported {count} spans to {trace_path}")
+
     def start(self):
         self._time_left.setVisible(True)
 
@@ -109,12 +124,19 @@ class Tray(QSystemTrayIcon):
             "Resume" if self._pause_timer.text() == "Pause" else "Pause"
         )
 
+    @tracing.traced("Tray.update", "tray")
     def update(self, remaining_minutes: int, remaining_seconds: int):
         self.setIcon(self.label_to_icon(QLabel(f"{remaining_minutes}")))
         self._time_left.setText(
             f"Time left: {remaining_minutes:02}:{remaining_seconds:02}"
         )
 
+    def set_due_count(self, due_count: int):
+        text = f"{due_count} flashcards to review" if due_count > 0 else "All done for today!"
+        self._due.setText(text)
+        self._due.setVisible(True)
+        self.setToolTip(f"Pomlet — {text}")
+
     def label_to_icon(self, label: QLabel, render_size: int = 64) -> QIcon:
         # Style and layout
         label.setStyleSheet("""
@@ -141,13 +163,4 @@ class Tray(QSystemTrayIcon):
         return QIcon(pixmap)
 
     def showMsg(self, msg: str):
-        if sys.platform == "darwin":
-            subprocess.run(
-                ["osascript", "-e", f'display notification "{msg}" with title "Pomlet"']
-            )
-        self.showMessage("Pomlet", msg, QSystemTrayIcon.MessageIcon.Information)
-        if sys.platform == "darwin":
-            subprocess.run(
-                ["osascript", "-e", f'display notification "{msg}" with title "Pomlet"']
-            )
-        self.showMessage("Pomlet", msg, QSystemTrayIcon.MessageIcon.Information)
+        self._notifications.notify(msg)
@@ -0,0 +1,120 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer
+
+from src import metrics
+
+logger = logging.getLogger(__name__)
+
+_event_loop_lag_seconds = metrics.histogram(
+    "pomlet_event_loop_lag_seconds", "How late the event loop heartbeat fired"
+)
+
+
+class StallWatchdog(QObject):
+    """Detect stalls of the Qt event loop and log what the main thread was doing.
+
+    A timer on the main thread records a heartbeat every interval seconds. A
+    helper thread checks it, and when no heartbeat arrived for threshold
+    seconds it captures the main thread's Python stack. Stalls are logged and
+    appended, with a timestamp, to log_path.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        threshold: float = 1.0,
+        interval: float = 0.1,
+        parent: QObject | None = None,
+    ):
+        super().__init__(parent)
+        self._log_path = log_path
+        self._threshold = threshold
+        self._interval = interval
+
+        self._main_thread_id = threading.main_thread().ident
+        # guards _last_beat and _stalled_since, shared with the watchdog thread
+        self._lock = threading.Lock()
+        self._last_beat: float = time.monotonic()
+        self._stalled_since: float | None = None
+        self._latency: float = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._heartbeat = QTimer(self)
+        self._heartbeat.timeout.connect(self._beat)
+
+    def start(self):
+        self._last_beat = time.monotonic()
+        self._heartbeat.start(int(self._interval * 1000))
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._watch, name="pomlet-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._heartbeat.stop()
+        self._stop.set()
+
+    @property
+    def latency(self) -> float:
+        """How late the last heartbeat was, in seconds."""
+        return self._latency
+
+    def _beat(self):
+        with self._lock:
+            now = time.monotonic()
+            self._latency = max(0.0, now - self._last_beat - self._interval)
+            self._last_beat = now
+            stalled_since, self._stalled_since = self._stalled_since, None
+        _event_loop_lag_seconds.observe(self._latency)
+
+        if stalled_since is not None:
+            self._write(f"event loop recovered after {now - stalled_since:.2f} s\n")
+
+    def _watch(self):
+        while not self._stop.wait(min(self._interval, self._threshold / 4)):
+            with self._lock:
+                stalled_for = time.monotonic() - self._last_beat
+                if stalled_for < self._threshold or self._stalled_since is not None:
+                    continue
+                self._stalled_since = self._last_beat
+
+            frame = sys._current_frames().get(self._main_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<unknown>\n"
+            logger.warning("Event loop stalled for %.2f s", stalled_for)
+            self._write(
+                f"event loop stalled for {stalled_for:.2f} s, main thread at:\n{stack}"
+            )
+
+    def _write(self, msg: str):
+        try:
+            with open(self._log_path, "a", encoding="utf-8") as f:
+                f.write(f"[{datetime.now().isoformat()}] {msg}")
+        except OSError as e:
+            logger.warning("Could not write %s: %s", self._log_path, e)
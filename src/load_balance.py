@@ -0,0 +1,80 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Spreads due dates so that cards scheduled together do not all come due on
+the same day. A histogram of due cards per day is kept up to date as cards
+are scheduled, and a card is moved, within a tolerance window around its
+ideal due date, to the day with the fewest cards.
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable
+
+MIN_BALANCED_DAYS = 2  # shorter intervals are kept exact
+FUZZ = 0.05  # tolerance, as a fraction of the interval
+MAX_WINDOW = 7
+# cards added at once beyond this many are spread over the next days
+NEW_CARDS_PER_DAY = int(os.getenv("POMLET_NEW_PER_DAY", "20"))
+
+
+def window(interval_days: float) -> int:
+    """Days a due date may move either way for an interval of interval_days."""
+    if interval_days < MIN_BALANCED_DAYS:
+        return 0
+    return min(max(1, round(interval_days * FUZZ)), MAX_WINDOW)
+
+
+class DueHistogram:
+    """Number of cards due per day, keyed by the date part of next_repeat."""
+
+    def __init__(self, cards: Iterable[Dict[str, Any]] = ()):
+        self._days: Dict[str, int] = {}
+        for card in cards:
+            self.add(card["next_repeat"])
+
+    def add(self, next_repeat: str | None):
+        if next_repeat is not None:
+            day = next_repeat[:10]
+            self._days[day] = self._days.get(day, 0) + 1
+
+    def remove(self, next_repeat: str | None):
+        if next_repeat is None:
+            return
+        day = next_repeat[:10]
+        count = self._days.get(day, 0) - 1
+        if count > 0:
+            self._days[day] = count
+        else:
+            self._days.pop(day, None)
+
+    def load(self, day: datetime) -> int:
+        return self._days.get(day.date().isoformat(), 0)
+
+    def least_loaded(self, ideal: datetime, before: int, after: int) -> datetime:
+        """The ideal time moved by whole days, at most before days earlier and
+        after days later, to the least loaded day.
+
+        Ties go to the day closest to the ideal one, earlier first.
+        """
+        best, best_key = ideal, None
+        for shift in range(-before, after + 1):
+            day = ideal + timedelta(days=shift)
+            key = (self.load(day), abs(shift), shift)
+            if best_key is None or key < best_key:
+                best, best_key = day, key
+        return best
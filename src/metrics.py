@@ -0,0 +1,314 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Performance counters in the Prometheus text exposition format. Set
+POMLET_METRICS_FILE to have them written there every POMLET_METRICS_INTERVAL
+seconds (15 by default, for the node-exporter textfile collector), and/or
+POMLET_METRICS_PORT to serve them on http://127.0.0.1:<port>/metrics. With
+neither set, recording a value does nothing.
+"""
+
+import atexit
+import bisect
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+_enabled: bool = bool(os.getenv("POMLET_METRICS_FILE") or os.getenv("POMLET_METRICS_PORT"))
+_lock = threading.Lock()
+_metrics: Dict[str, "_Metric"] = {}
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 2.5e5, 5e5, 1e6, 2.5e6, 5e6, 1e7)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True):
+    global _enabled
+    _enabled = on
+
+
+def _key(labels: Dict[str, str]) -> _Labels:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+def _format_labels(labels: _Labels, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: Dict[_Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        if not _enabled:
+            return
+        key = _key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for labels, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str):
+        super().__init__(name, help)
+        self._values: Dict[_Labels, float] = {}
+
+    def set(self, value: float, **labels: str):
+        if not _enabled:
+            return
+        with self._lock:
+            self._values[_key(labels)] = value
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for labels, value in self._values.items():
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: "Histogram", labels: Dict[str, str]):
+        self._histogram = histogram
+        self._labels = labels
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float]):
+        super().__init__(name, help)
+        self._buckets = tuple(sorted(buckets))
+        # per label set: count per bucket (the last one is +Inf), sum
+        self._values: Dict[_Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str):
+        if not _enabled:
+            return
+        key = _key(labels)
+        i = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(
+                key, ([0] * (len(self._buckets) + 1), [0.0])
+            )
+            counts[i] += 1
+            total[0] += value
+
+    def time(self, **labels: str) -> _Timer | _NullTimer:
+        """Context manager observing the duration of the enclosed block."""
+        if not _enabled:
+            return _NULL_TIMER
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        with self._lock:
+            for labels, (counts, total) in self._values.items():
+                cumulative = 0
+                for bound, count in zip(self._buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = f'le="{_format_value(bound)}"'
+                    lines.append(
+                        f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}"
+                    )
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {total[0]!r}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+def _register(metric: _Metric) -> _Metric:
+    with _lock:
+        existing = _metrics.get(metric.name)
+        if existing is not None:
+            if existing.kind != metric.kind:
+                raise ValueError(f"Metric {metric.name} already registered as {existing.kind}")
+            return existing
+        _metrics[metric.name] = metric
+        return metric
+
+
+def counter(name: str, help: str) -> Counter:
+    return _register(Counter(name, help))  # type: ignore[return-value]
+
+
+def gauge(name: str, help: str) -> Gauge:
+    return _register(Gauge(name, help))  # type: ignore[return-value]
+
+
+def histogram(
+    name: str, help: str, buckets: Sequence[float] = DURATION_BUCKETS
+) -> Histogram:
+    return _register(Histogram(name, help, buckets))  # type: ignore[return-value]
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    with _lock:
+        metrics = sorted(_metrics.values(), key=lambda m: m.name)
+    lines: List[str] = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path):
+    """Write the metrics atomically, as the textfile collector expects."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp_path, path)
+
+
+def _metrics_handler():
+    from http.server import BaseHTTPRequestHandler
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    return MetricsHandler
+
+
+_exporting: bool = False
+
+
+def start_exporter():
+    """Start the file writer and/or the HTTP server configured in the environment."""
+    global _exporting
+    if not _enabled or _exporting:
+        return
+    _exporting = True
+
+    metrics_file = os.getenv("POMLET_METRICS_FILE")
+    if metrics_file:
+        interval = float(os.getenv("POMLET_METRICS_INTERVAL", "15"))
+        threading.Thread(
+            target=_write_periodically,
+            args=(Path(metrics_file), interval),
+            name="pomlet-metrics-file",
+            daemon=True,
+        ).start()
+
+    port = os.getenv("POMLET_METRICS_PORT")
+    if port:
+        from http.server import ThreadingHTTPServer  # only needed when serving
+
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", int(port)), _metrics_handler())
+        except OSError as e:
+            logger.warning("Could not serve metrics on port %s: %s", port, e)
+            return
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name="pomlet-metrics-http", daemon=True
+        ).start()
+
+
+def _write_periodically(path: Path, interval: float):
+    while True:
+        try:
+            write_textfile(path)
+        except OSError as e:
+            logger.warning("Could not write metrics to %s: %s", path, e)
+        time.sleep(interval)
+
+
+def _write_at_exit():
+    metrics_file = os.getenv("POMLET_METRICS_FILE")
+    if _enabled and metrics_file:
+        write_textfile(Path(metrics_file))
+
+
+atexit.register(_write_at_exit)
@@ -0,0 +1,246 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Fits the schedulers' interval modifier, for all flashcards and per subject,
+on the review log, and stores it in ~/.pomodoro/scheduler_params.json.
+
+Recall after elapsed days is modelled as exp(-theta * elapsed / interval),
+where interval is the one the card was scheduled with. theta is the maximum
+likelihood estimate, found with Newton's method for every group at once; a
+few pseudo reviews recalled at exactly target_retention keep small groups
+close to their current modifier. The modifier then scales intervals so
+that recall at the due time is target_retention.
+
+Only reviews made since the last fit are used, since they were scheduled
+with the current modifiers, which the fitted ratios are applied to.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from src.config import get_config_path
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+MIN_REVIEWS = 50
+MIN_INTERVAL_DAYS = 0.5  # shorter intervals are learning steps
+MODIFIER_RANGE = (0.5, 2.5)
+PRIOR_REVIEWS = 20.0
+
+
+def get_params_path() -> Path:
+    return get_config_path().parent.joinpath("scheduler_params.json")
+
+
+def load_params() -> Dict[str, Any] | None:
+    try:
+        with open(get_params_path(), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_params(params: Dict[str, Any]):
+    path = get_params_path()
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(params, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def fit_ratios(x, y, groups, n_groups: int, target_retention: float, iterations: int = 50):
+    """Interval ratio per group from elapsed/interval ratios x and outcomes y.
+
+    Returns the factor to multiply each group's intervals by, so that the
+    modelled recall at the due time is target_retention.
+    """
+    import numpy as np
+
+    # pseudo reviews at x = 1, recalled with probability target_retention
+    pseudo_groups = np.arange(n_groups)
+    x = np.concatenate([x, np.ones(2 * n_groups)])
+    y = np.concatenate([y, np.ones(n_groups), np.zeros(n_groups)])
+    w = np.concatenate(
+        [
+            np.ones(len(groups)),
+            np.full(n_groups, PRIOR_REVIEWS * target_retention),
+            np.full(n_groups, PRIOR_REVIEWS * (1 - target_retention)),
+        ]
+    )
+    groups = np.concatenate([groups, pseudo_groups, pseudo_groups])
+
+    theta = np.full(n_groups, -math.log(target_retention))
+    for _ in range(iterations):
+        tx = theta[groups] * x
+        forgot = -np.expm1(-tx)  # 1 - exp(-theta x), the probability to forget
+        kept_over_forgot = np.exp(-tx) / forgot
+        failed = w * (1 - y)
+        grad = np.bincount(
+            groups, w * -y * x + failed * x * kept_over_forgot, minlength=n_groups
+        )
+        hess = np.bincount(
+            groups, -failed * x * x * kept_over_forgot / forgot, minlength=n_groups
+        )
+        step = grad / hess
+        theta = np.maximum(theta - step, theta / 10)
+        if np.max(np.abs(step)) < 1e-9:
+            break
+
+    return -math.log(target_retention) / theta
+
+
+def _reviews_since(fitted_at: float):
+    import numpy as np
+
+    from src.review_log import ReviewLog
+
+    reviews = ReviewLog().read()
+    reviews = reviews[
+        (reviews["ts"] > fitted_at) & (reviews["interval"] >= MIN_INTERVAL_DAYS)
+    ]
+    x = reviews["elapsed"].astype(np.float64) / reviews["interval"]
+    return reviews["card_id"], x, reviews["outcome"].astype(np.float64)
+
+
+def _subjects_by_card() -> Dict[int, str]:
+    from src.questions_manager import get_question_path
+
+    with open(get_question_path(), encoding="utf-8") as f:
+        return {q["id"]: q["subject"] for q in json.load(f)}
+
+
+def optimize(
+    target_retention: float = 0.9, per_subject: bool = True, min_reviews: int = MIN_REVIEWS
+) -> Dict[str, Any] | None:
+    """Fit the modifiers on the new reviews and save them.
+
+    Returns the new parameters, or None when there are fewer than min_reviews
+    new reviews; the time of that check is saved as checked_at.
+    """
+    import numpy as np
+
+    previous = load_params() or {}
+    card_ids, x, y = _reviews_since(previous.get("fitted_at", 0.0))
+    if len(x) < min_reviews:
+        _save_params({**previous, "checked_at": time.time()})
+        return None
+
+    names: List[str] = ["*"]
+    groups = np.zeros(len(x), dtype=np.int64)
+    if per_subject:
+        subjects = _subjects_by_card()
+        names += sorted(set(subjects.values()))
+        index = {name: i for i, name in enumerate(names)}
+        groups = np.fromiter(
+            (index.get(subjects.get(int(c), ""), 0) for c in card_ids),
+            dtype=np.int64,
+            count=len(card_ids),
+        )
+
+    # all reviews for the overall modifier, then every subject on its own
+    ratios = fit_ratios(x, y, np.zeros(len(x), dtype=np.int64), 1, target_retention)
+    counts = np.bincount(groups, minlength=len(names))
+    if per_subject:
+        ratios = np.concatenate(
+            [ratios, fit_ratios(x, y, groups, len(names), target_retention)[1:]]
+        )
+
+    def clamp(m: float) -> float:
+        return min(max(m, MODIFIER_RANGE[0]), MODIFIER_RANGE[1])
+
+    overall = previous.get("interval_modifier", 1.0)
+    params: Dict[str, Any] = {
+        "fitted_at": time.time(),
+        "target_retention": target_retention,
+        "reviews": int(len(x)),
+        "interval_modifier": clamp(overall * float(ratios[0])),
+        "subjects": dict(previous.get("subjects", {})),
+    }
+    for i, name in enumerate(names[1:], start=1):
+        if counts[i] >= min_reviews:
+            current = previous.get("subjects", {}).get(name, {}).get(
+                "interval_modifier", overall
+            )
+            params["subjects"][name] = {
+                "interval_modifier": clamp(current * float(ratios[i])),
+                "reviews": int(counts[i]),
+            }
+
+    _save_params(params)
+    logger.info("Fitted interval modifier %.3f", params["interval_modifier"])
+    return params
+
+
+_executor: "ProcessPoolExecutor | None" = None
+
+
+def start_background_optimization(max_age_days: float = 7.0) -> "Future | None":
+    """Refit in a separate process if the parameters are older than max_age_days,
+    and were not checked in that time either.
+
+    The result applies to QuestionManagers created after it is saved.
+    """
+    from src.review_log import get_reviews_path
+
+    global _executor
+    params = load_params() or {}
+    last_run = max(params.get("fitted_at", 0.0), params.get("checked_at", 0.0))
+    if time.time() - last_run < max_age_days * 86400:
+        return None
+    if not any(get_reviews_path().glob("segment-*.bin")):
+        return None
+
+    if _executor is None:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # not fork: a forked copy of the GUI process would inherit Qt's threads and locks
+        _executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+    future = _executor.submit(optimize)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def _log_failure(future: "Future"):
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Scheduler optimization failed: %s", future.exception())
+
+
+def shutdown():
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+
+
+def modifiers() -> Tuple[float, Dict[str, float]]:
+    """The overall interval modifier and the ones fitted per subject."""
+    params = load_params()
+    if params is None or "interval_modifier" not in params:  # never fitted
+        return 1.0, {}
+    return params["interval_modifier"], {
+        name: subject["interval_modifier"]
+        for name, subject in params.get("subjects", {}).items()
+    }
@@ -16,26 +16,103 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import heapq
 import json
+import math
+import os
 import shutil
+from collections import deque
 from copy import copy
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from random import shuffle
-from typing import Any, Dict, List
+from typing import Any, Deque, Dict, List, Set, Tuple
 
+from src import load_balance, metrics
 from src.config import get_config_path
+from src.deck_summary import count_due, load_summary, write_summary
+from src.forecast import forecast
+from src.load_balance import DueHistogram
+from src.review_log import CORRECT, WRONG, ReviewLog
+from src.scheduler import RELEARNING_STEP, get_scheduler
+from src.session_log import SessionLog
+from src.stats import get_stats_store
+from src.tracing import span, traced
+
+_save_seconds = metrics.histogram(
+    "pomlet_save_duration_seconds", "Time to save the deck, backup included"
+)
+_save_bytes = metrics.histogram(
+    "pomlet_save_bytes", "Bytes written per deck save", metrics.SIZE_BUCKETS
+)
+_backup_files = metrics.gauge("pomlet_backup_files", "Number of deck backups")
+_backup_bytes = metrics.gauge("pomlet_backup_bytes", "Total size of the deck backups")
+_due_scan_seconds = metrics.histogram(
+    "pomlet_due_scan_duration_seconds", "Time to find the flashcards to review"
+)
+_cards_reviewed = metrics.counter(
+    "pomlet_cards_reviewed_total", "Flashcards reviewed, by outcome"
+)
+
+
+# a card answered wrong comes back in the same review round after this many
+# other cards or minutes, whichever comes first
+RELEARN_AFTER_CARDS = int(os.getenv("POMLET_RELEARN_AFTER_CARDS", "5"))
+RELEARN_AFTER_MINUTES = float(os.getenv("POMLET_RELEARN_AFTER_MINUTES", "10"))
+
+
+def get_question_path() -> Path:
+    return get_config_path().parent.joinpath("questions.json")
 
 
 class QuestionManager:
     def __init__(self) -> None:
+        self._scheduler = get_scheduler()
+        self._review_log = ReviewLog()
+        self._stats = get_stats_store()
         self._questions = self._load_questions()
-        self._questions_to_repeat = self._get_flashcards_to_repeat()
         self._operations = 0
+        self._due_histogram: DueHistogram | None = None  # built when first needed
+        self._by_id: Dict[int, Dict[str, Any]] = {}
+        # cards not due yet, by due time; entries of cards rescheduled or
+        # removed since they were pushed are skipped when they surface
+        self._upcoming: List[Tuple[datetime, int, str]] = []
+        self._due: Set[int] = set()
+        self._queue: Deque[int] = deque()  # ids of the current review round
+        # cards answered wrong in this round, in two heaps by when they come
+        # back (answers given, time); the map holds each card's live entry
+        self._answers = 0
+        self._relearn_by_answers: List[Tuple[int, int, int]] = []
+        self._relearn_by_time: List[Tuple[datetime, int, int]] = []
+        self._relearning: Dict[int, int] = {}
+        self._relearn_entries = 0
+
+        # cards retired by the old fixed table come back on their last interval
+        retired = [q for q in self._questions if q["next_repeat"] is None]
+        if retired:
+            self._scheduler.reschedule(retired)
+            self.save_questions()
+        elif load_summary(self._get_question_path()) is None:
+            write_summary(self._questions, self._get_question_path())
+
+        if not self._stats.backfilled():
+            self._stats.backfill(self._questions, self._review_log.read(), SessionLog())
+
+        self._index_due_times()
+        self.reset()
+
+    @staticmethod
+    def peek_due_count() -> int | None:
+        """Due count from the summary sidecar, None if it is missing, stale or too old."""
+        summary = load_summary(get_question_path())
+        if summary is None:
+            return None
+        return count_due(summary)
 
     def _get_question_path(self):
-        return get_config_path().parent.joinpath("questions.json")
+        return get_question_path()
 
+    @traced("QuestionManager.load", "questions")
     def _load_questions(self):
         question_path: Path = self._get_question_path()
         if not question_path.exists():
@@ -45,6 +122,7 @@ class QuestionManager:
         with open(question_path, encoding="utf-8") as f:
             return json.load(f)
 
+    @traced("QuestionManager.clean_backups", "questions")
     def _clean_backups(self):
         question_path: Path = self._get_question_path()
         backups_dir: Path = question_path.parent.joinpath("backups")
@@ -64,53 +142,180 @@ class QuestionManager:
 
         self._operations = 0
 
+    @traced("QuestionManager.save", "questions")
     def save_questions(self):
-        if self._operations > 50:
-            self._clean_backups()
-
-        question_path: Path = self._get_question_path()
-        backups_dir = question_path.parent.joinpath("backups")
-        backups_dir.mkdir(exist_ok=True)
-        shutil.copyfile(
-            question_path,
-            backups_dir.joinpath(datetime.now().isoformat()),
-        )
+        with _save_seconds.time():
+            if self._operations > 50:
+                self._clean_backups()
 
-        self._operations += 1
+            question_path: Path = self._get_question_path()
+            backups_dir = question_path.parent.joinpath("backups")
+            backups_dir.mkdir(exist_ok=True)
+            with span("QuestionManager.backup", "questions"):
+                shutil.copyfile(
+                    question_path,
+                    backups_dir.joinpath(datetime.now().isoformat()),
+                )
 
-        with open(question_path, "w", encoding="utf-8") as f:
-            return json.dump(self._questions, f)
+            self._operations += 1
 
-    def _get_flashcards_to_repeat(self):
-        qs = []
-        for q in self._questions:
-            if (
-                q["next_repeat"] is not None
-                and datetime.fromisoformat(q["next_repeat"]) <= datetime.now()
-            ):  # None already repeated enough
-                qs.append(q)
-
-        shuffle(qs)
-
-        for q in qs:
-            yield q
+            with open(question_path, "w", encoding="utf-8") as f:
+                json.dump(self._questions, f)
+                _save_bytes.observe(f.tell())
+
+            with span("QuestionManager.write_summary", "questions"):
+                write_summary(self._questions, question_path)
+
+        if metrics.enabled():
+            sizes = [p.stat().st_size for p in backups_dir.iterdir()]
+            _backup_files.set(len(sizes))
+            _backup_bytes.set(sum(sizes))
+
+    def _index_due_times(self):
+        """Split the deck into the due cards and a heap of the others."""
+        now = datetime.now()
+        self._by_id = {q["id"]: q for q in self._questions}
+        self._due = set()
+        upcoming: List[Tuple[datetime, int, str]] = []
+        with span(
+            "QuestionManager.due_scan", "questions", cards=len(self._questions)
+        ), _due_scan_seconds.time():
+            for q in self._questions:
+                if q["next_repeat"] is None:
+                    continue
+                due = datetime.fromisoformat(q["next_repeat"])
+                if due <= now:
+                    self._due.add(q["id"])
+                else:
+                    upcoming.append((due, q["id"], q["next_repeat"]))
+            heapq.heapify(upcoming)
+        self._upcoming = upcoming
+
+    def _schedule(self, question: Dict[str, Any]):
+        """Track a card whose next_repeat has just been set."""
+        self._due.discard(question["id"])
+        if question["next_repeat"] is not None:
+            heapq.heappush(
+                self._upcoming,
+                (
+                    datetime.fromisoformat(question["next_repeat"]),
+                    question["id"],
+                    question["next_repeat"],
+                ),
+            )
+
+    def promote_due(self, now: datetime | None = None) -> List[Dict[str, Any]]:
+        """Move the cards that came due since the last call into the due set,
+        at the end of the current review round, and return them."""
+        now = datetime.now() if now is None else now
+        promoted: List[Dict[str, Any]] = []
+        while self._upcoming and self._upcoming[0][0] <= now:
+            _, id, next_repeat = heapq.heappop(self._upcoming)
+            question = self._by_id.get(id)
+            if question is None or question["next_repeat"] != next_repeat or id in self._due:
+                continue
+            self._due.add(id)
+            self._queue.append(id)
+            promoted.append(question)
+        return promoted
+
+    def next_due_time(self) -> datetime | None:
+        """When the next card that is not due yet comes due, None if none."""
+        while self._upcoming:
+            due, id, next_repeat = self._upcoming[0]
+            question = self._by_id.get(id)
+            if question is not None and question["next_repeat"] == next_repeat:
+                return due
+            heapq.heappop(self._upcoming)
+        return None
 
     def count(self):
-        return len([x for x in self._get_flashcards_to_repeat()])
+        self.promote_due()
+        return len(self._due)
+
+    def _answered(self, question: Dict[str, Any]):
+        self._answers += 1
+        self._relearning.pop(question["id"], None)
+
+    def _relearn(self, question: Dict[str, Any], now: datetime):
+        """Bring a card answered wrong back later in this review round."""
+        self._relearn_entries += 1
+        entry = self._relearn_entries
+        self._relearning[question["id"]] = entry
+        heapq.heappush(
+            self._relearn_by_answers,
+            (self._answers + RELEARN_AFTER_CARDS, entry, question["id"]),
+        )
+        heapq.heappush(
+            self._relearn_by_time,
+            (now + timedelta(minutes=RELEARN_AFTER_MINUTES), entry, question["id"]),
+        )
+
+    def _pop_relearning(self, now: datetime, force: bool = False) -> Dict[str, Any] | None:
+        """The card answered wrong whose turn has come, the earliest one if force."""
+        for heap, ready in (
+            (self._relearn_by_answers, self._answers),
+            (self._relearn_by_time, now),
+        ):
+            while heap:
+                key, entry, id = heap[0]
+                if self._relearning.get(id) != entry:
+                    heapq.heappop(heap)  # answered again, or removed
+                    continue
+                if key <= ready or force:
+                    del self._relearning[id]
+                    return self._by_id[id]
+                break
+        return None
+
+    def _log_review(
+        self, question: Dict[str, Any], outcome: int, now: datetime, latency: float | None
+    ):
+        last_repeated = datetime.fromisoformat(question["last_repeated"])
+        interval = datetime.fromisoformat(question["next_repeat"]) - last_repeated
+        self._review_log.append(
+            question["id"],
+            outcome,
+            interval / timedelta(days=1),
+            (now - last_repeated) / timedelta(days=1),
+            latency,
+            now.timestamp(),
+        )
 
-    def correct(self, question: Dict[str, Any]) -> None:
+    def correct(self, question: Dict[str, Any], latency: float | None = None) -> None:
+        """Record a correct answer; latency is the time taken to answer, in seconds."""
         stored_question = self.find_question(question)
-        stored_question["last_repeated"] = datetime.now().isoformat()
+        now = datetime.now()
+        self._log_review(stored_question, CORRECT, now, latency)
+        self._answered(stored_question)
+        next_repeat = self._balance(self._scheduler.correct(stored_question, now), now)
+        stored_question["last_repeated"] = now.isoformat()
         stored_question["repeated"] += 1
-        next_repeat = self._get_next_repeat(
-            stored_question["repeated"], stored_question["last_repeated"]
-        )
-        stored_question["next_repeat"] = (
-            next_repeat.isoformat() if next_repeat is not None else next_repeat
-        )
+        self._set_next_repeat(stored_question, next_repeat.isoformat())
 
+        _cards_reviewed.inc(outcome="correct")
+        self._stats.record_review(stored_question["subject"], True, now)
         self.save_questions()
 
+    def _histogram(self) -> DueHistogram:
+        if self._due_histogram is None:
+            self._due_histogram = DueHistogram(self._questions)
+        return self._due_histogram
+
+    def _set_next_repeat(self, question: Dict[str, Any], next_repeat: str):
+        if self._due_histogram is not None:
+            self._due_histogram.remove(question.get("next_repeat"))
+            self._due_histogram.add(next_repeat)
+        question["next_repeat"] = next_repeat
+        self._schedule(question)
+
+    def _balance(self, ideal: datetime, now: datetime) -> datetime:
+        """Move ideal to the least loaded day within the interval's tolerance."""
+        window = load_balance.window((ideal - now) / timedelta(days=1))
+        if window == 0:
+            return ideal
+        return self._histogram().least_loaded(ideal, window, window)
+
     def modify(self, question: Dict[str, Any]) -> None:
         stored_question = self.find_question(question)
         stored_question["question"] = question["question"]
@@ -121,74 +326,134 @@ class QuestionManager:
             return 0
         return max([x["id"] for x in self._questions]) + 1
 
-    def add_question(self, question_text: str, subject: str) -> Dict[str, Any] | None:
+    def _new_question(self, id: int, question_text: str, subject: str):
         now = datetime.now().isoformat()
-        question = {
-            "id": self._id(),
+        return {
+            "id": id,
             "question": question_text,
             "last_repeated": now,
             "created": now,
             "repeated": 0,
             "subject": subject,
+            "next_repeat": now,  # new flashcards are due right away
         }
-        next_repeat = self._get_next_repeat(
-            question["repeated"], question["last_repeated"]
-        )
-
-        if next_repeat is None:
-            return None
 
-        question["next_repeat"] = next_repeat.isoformat()
+    def add_question(self, question_text: str, subject: str) -> Dict[str, Any]:
+        question = self._new_question(self._id(), question_text, subject)
         self._questions.append(question)
+        self._by_id[question["id"]] = question
+        self._schedule(question)
+        if self._due_histogram is not None:
+            self._due_histogram.add(question["next_repeat"])
         self.save_questions()
+        self._stats.record_added(subject)
 
-        # reset generator of questions to be repeated
-        self.reset()
-
+        # due right away, it joins the review round at the next get_next_to_repeat()
         return question
 
-    def _get_next_repeat(self, times, last_repeated):
-        match times:
-            case 0:
-                delta = timedelta(hours=0)
-            case 1:
-                delta = timedelta(hours=12)
-            case 2:
-                delta = timedelta(days=1)
-            case 3:
-                delta = timedelta(days=3)
-            case 4:
-                delta = timedelta(days=7)
-            case 5:
-                delta = timedelta(days=14)
-            case 5:
-                delta = timedelta(days=31)
-            case _:
-                return None
-
-        return datetime.fromisoformat(last_repeated) + delta
-
-    def wrong(self, question: Dict[str, Any]) -> None:
+    def add_questions(
+        self, question_texts: List[str], subject: str
+    ) -> List[Dict[str, Any]]:
+        """Add many questions with a single save, e.g. when importing a file.
+
+        Beyond NEW_CARDS_PER_DAY questions, they are spread over the next days,
+        on the least loaded ones.
+        """
+        now = datetime.now()
+        spread = math.ceil(len(question_texts) / load_balance.NEW_CARDS_PER_DAY) - 1
+        histogram = self._histogram() if spread > 0 else self._due_histogram
+        next_id = self._id()
+        added: List[Dict[str, Any]] = []
+        for question_text in question_texts:
+            question = self._new_question(next_id, question_text, subject)
+            if spread > 0:
+                due = histogram.least_loaded(now, 0, spread)
+                if due.date() > now.date():
+                    due = datetime.combine(due.date(), time.min)
+                question["next_repeat"] = due.isoformat()
+            if histogram is not None:
+                histogram.add(question["next_repeat"])
+            added.append(question)
+            next_id += 1
+
+        if added:
+            self._questions.extend(added)
+            for question in added:
+                self._by_id[question["id"]] = question
+                self._schedule(question)
+            self.save_questions()
+            self._stats.record_added(subject, len(added), now)
+
+        return added
+
+    def wrong(self, question: Dict[str, Any], latency: float | None = None) -> None:
+        """Record a wrong answer; latency is the time taken to answer, in seconds."""
         stored_question = self.find_question(question)
-        stored_question["last_repeated"] = datetime.now().isoformat()
+        now = datetime.now()
+        self._log_review(stored_question, WRONG, now, latency)
+        self._answered(stored_question)
+        self._scheduler.wrong(stored_question, now)
+        stored_question["last_repeated"] = now.isoformat()
         stored_question["repeated"] = 0
-        stored_question["next_repeat"] = (
-            datetime.now() + timedelta(hours=1)
-        ).isoformat()
+        self._set_next_repeat(stored_question, (now + RELEARNING_STEP).isoformat())
+        self._relearn(stored_question, now)
+        _cards_reviewed.inc(outcome="wrong")
+        self._stats.record_review(stored_question["subject"], False, now)
         self.save_questions()
 
     def find_question(self, question: Dict[str, Any]):
-        for stored_question in self._questions:
-            if stored_question["id"] == question["id"]:
-                return stored_question
+        stored_question = self._by_id.get(question["id"])
+        if stored_question is None:
+            raise ValueError("Question not found")
+        return stored_question
+
+    def reschedule_all(self) -> int:
+        """Recompute every due time, e.g. after the scheduler parameters changed."""
+        with span("QuestionManager.reschedule_all", "questions", cards=len(self._questions)):
+            rescheduled = self._scheduler.reschedule(self._questions)
+        self._due_histogram = None
+        self._index_due_times()
+        self.save_questions()
+        self.reset()
+        return rescheduled
 
-        raise ValueError("Question not found")
+    def forecast(
+        self, days: int = 30, simulate: bool = False, runs: int = 5, seed: int | None = None
+    ) -> Any:
+        """Expected reviews per day for the next days, as a NumPy array."""
+        with span("QuestionManager.forecast", "questions", days=days, simulate=simulate):
+            return forecast(self._questions, self._scheduler, days, simulate, runs, seed=seed)
 
     def get_next_to_repeat(self):
-        return next(self._questions_to_repeat, None)
+        """The next card of the review round, None when it is over.
+
+        Cards answered wrong come back before the due ones once their turn
+        has come, and right away when nothing else is left.
+        """
+        now = datetime.now()
+        self.promote_due(now)
+        question = self._pop_relearning(now)
+        if question is not None:
+            return question
+
+        while self._queue:
+            id = self._queue.popleft()
+            if id in self._due:  # not answered or removed since the round began
+                return self._by_id[id]
+        return self._pop_relearning(now, force=True)
 
     def reset(self):
-        self._questions_to_repeat = self._get_flashcards_to_repeat()
+        """Start a new review round over the due cards, in random order.
+
+        Cards answered wrong in the previous round come back when due.
+        """
+        self.promote_due()
+        queue = list(self._due)
+        shuffle(queue)
+        self._queue = deque(queue)
+        self._relearning.clear()
+        self._relearn_by_answers.clear()
+        self._relearn_by_time.clear()
 
     def get_all_grouped_by_subject(self):
         grouped_questions: Dict[str, List[Dict[str, Any]]] = {}
@@ -202,9 +467,9 @@ class QuestionManager:
         return grouped_questions
 
     def find_by_id(self, id: int):
-        for question in self._questions:
-            if question["id"] == id:
-                return copy(question)
+        question = self._by_id.get(id)
+        if question is not None:
+            return copy(question)
 
     def remove(self, question: Dict[str, Any]):
         question = self.find_question(question)
@@ -212,8 +477,13 @@ class QuestionManager:
             return
 
         self._questions.remove(question)
+        del self._by_id[question["id"]]
+        self._due.discard(question["id"])
+        self._relearning.pop(question["id"], None)
+        if self._due_histogram is not None:
+            self._due_histogram.remove(question["next_repeat"])
         self.save_questions()
 
     @property
     def questions_to_repeat(self):
-        return self._questions_to_repeat
+        return [self._by_id[id] for id in self._queue if id in self._due]
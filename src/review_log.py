@@ -0,0 +1,147 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Append-only log of every answer, in ~/.pomodoro/reviews/. Each segment file
+starts with a 16 byte header followed by fixed-size 32 byte records:
+
+    card_id     int64    flashcard id
+    ts          float64  answer time, seconds since the epoch
+    interval    float32  days between the previous repetition and the due time
+    elapsed     float32  days between the previous repetition and the answer
+    latency_ms  uint32   time taken to answer, 0 if unknown
+    outcome     uint8    1 correct, 0 wrong
+    (3 padding bytes)
+
+A segment holds up to SEGMENT_RECORDS records. Reading maps the segments
+into memory and views them as NumPy structured arrays without copying.
+"""
+
+import logging
+import struct
+import time
+from pathlib import Path
+from typing import Any, Iterator, List
+
+from src.binary_log import HEADER, map_records, prepare_append
+from src.config import get_config_path
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PLRL"
+VERSION = 1
+RECORD = struct.Struct("<qdffIB3x")
+SEGMENT_RECORDS = 1 << 20  # 32 MiB per segment
+
+CORRECT = 1
+WRONG = 0
+
+
+def get_reviews_path() -> Path:
+    return get_config_path().parent.joinpath("reviews")
+
+
+def record_dtype():
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("card_id", "<i8"),
+            ("ts", "<f8"),
+            ("interval", "<f4"),
+            ("elapsed", "<f4"),
+            ("latency_ms", "<u4"),
+            ("outcome", "u1"),
+            ("_pad", "V3"),
+        ]
+    )
+
+
+def _segments(directory: Path) -> List[Path]:
+    return sorted(directory.glob("segment-*.bin"))
+
+
+class ReviewLog:
+    def __init__(self, directory: Path | None = None):
+        self._directory = get_reviews_path() if directory is None else directory
+        self._segment: Path | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def _current_segment(self) -> Path:
+        if self._segment is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            segments = _segments(self._directory)
+            self._segment = (
+                segments[-1] if segments else self._directory.joinpath("segment-000000.bin")
+            )
+
+        try:
+            size = self._segment.stat().st_size
+        except FileNotFoundError:
+            size = 0
+
+        if size >= HEADER.size + SEGMENT_RECORDS * RECORD.size:
+            number = int(self._segment.stem.split("-")[1]) + 1
+            self._segment = self._directory.joinpath(f"segment-{number:06d}.bin")
+        return self._segment
+
+    def append(
+        self,
+        card_id: int,
+        outcome: int,
+        interval: float,
+        elapsed: float,
+        latency: float | None = None,
+        ts: float | None = None,
+    ):
+        """Log one answer; interval and elapsed in days, latency in seconds."""
+        record = RECORD.pack(
+            card_id,
+            time.time() if ts is None else ts,
+            interval,
+            elapsed,
+            0 if latency is None else min(int(latency * 1000), 0xFFFFFFFF),
+            outcome,
+        )
+        segment = self._current_segment()
+        try:
+            with open(segment, "ab") as f:
+                prepare_append(f, MAGIC, VERSION, RECORD.size)
+                f.write(record)
+        except OSError as e:
+            logger.warning("Could not log review of flashcard %s: %s", card_id, e)
+
+    def segments(self) -> Iterator[Any]:
+        """Every segment as a read-only structured array backed by the file."""
+        dtype = record_dtype()
+        for path in _segments(self._directory):
+            records = map_records(path, MAGIC, dtype)
+            if records is not None:
+                yield records
+
+    def read(self) -> Any:
+        """All records, oldest first, as one structured array."""
+        import numpy as np
+
+        segments = list(self.segments())
+        if not segments:
+            return np.empty(0, dtype=record_dtype())
+        if len(segments) == 1:
+            return segments[0]
+        return np.concatenate(segments)
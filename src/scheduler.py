@@ -0,0 +1,386 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Spaced repetition schedulers. POMLET_SCHEDULER selects "sm2" (default) or
+"fsrs". A scheduler computes the next repetition of one card after a correct
+answer, updates its memory state after a wrong one (the card itself comes
+back after QuestionManager's one hour relearning step), and reschedules a
+whole deck in one NumPy pass after its parameters change.
+
+Cards never retire: intervals grow until MAX_INTERVAL_DAYS.
+"""
+
+import math
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from src.optimizer import modifiers
+
+# days after the last repetition, indexed by the number of correct
+# repetitions, of the original fixed table; used for cards without state
+LEGACY_INTERVALS = (0, 0.5, 1, 3, 7, 14, 31)
+MAX_INTERVAL_DAYS = 36500
+RELEARNING_STEP = timedelta(hours=1)  # wrong answers come back after this
+
+
+def legacy_interval(repeated: int) -> float:
+    return LEGACY_INTERVALS[min(repeated, len(LEGACY_INTERVALS) - 1)]
+
+
+def _field(cards: List[Dict[str, Any]], field: str, np, repeated=None) -> Any:
+    """Float array of field, with the old table's interval where it is missing."""
+    values = np.fromiter(
+        (c.get(field, math.nan) for c in cards), dtype=np.float64, count=len(cards)
+    )
+    missing = np.isnan(values)
+    if missing.any():
+        if repeated is None:
+            repeated = _repeated(cards, np)
+        table = np.array(LEGACY_INTERVALS, dtype=np.float64)
+        values[missing] = table[np.minimum(repeated[missing], len(table) - 1)]
+    return values
+
+
+def _repeated(cards: List[Dict[str, Any]], np) -> Any:
+    return np.fromiter((c["repeated"] for c in cards), dtype=np.int64, count=len(cards))
+
+
+class Scheduler(ABC):
+    """Base class; subclasses implement the interval of one or many cards."""
+
+    name = ""
+
+    def __init__(
+        self,
+        interval_modifier: float = 1.0,
+        subject_modifiers: Dict[str, float] | None = None,
+    ):
+        # scale the intervals, as fitted on the review history by src.optimizer
+        self.interval_modifier = interval_modifier
+        self.subject_modifiers = subject_modifiers or {}
+
+    @abstractmethod
+    def correct(self, card: Dict[str, Any], now: datetime) -> datetime:
+        """Update the card's memory state and return its next repetition.
+
+        Called before the card's repeated and last_repeated are updated.
+        """
+
+    @abstractmethod
+    def wrong(self, card: Dict[str, Any], now: datetime) -> None:
+        """Update the card's memory state after a wrong answer."""
+
+    @abstractmethod
+    def _intervals(self, cards: List[Dict[str, Any]], np) -> Any:
+        """Unmodified intervals in days of reviewed cards, as a NumPy array."""
+
+    @abstractmethod
+    def state_arrays(self, cards: List[Dict[str, Any]], np) -> Dict[str, Any]:
+        """The scheduling state of the cards as NumPy arrays, for simulations."""
+
+    @abstractmethod
+    def review_arrays(self, state: Dict[str, Any], correct: Any, elapsed: Any, np) -> Any:
+        """Answer every card of state (updated in place) at once.
+
+        elapsed is the number of days since each card's previous repetition.
+        Returns the days until each card's next repetition.
+        """
+
+    def _modifiers(self, cards: List[Dict[str, Any]], np) -> Any:
+        if not self.subject_modifiers:
+            return np.full(len(cards), self.interval_modifier)
+        return np.fromiter(
+            (self._modifier(c) for c in cards), dtype=np.float64, count=len(cards)
+        )
+
+    def _modifier(self, card: Dict[str, Any]) -> float:
+        return self.subject_modifiers.get(card.get("subject"), self.interval_modifier)
+
+    def _due(self, card: Dict[str, Any], now: datetime, interval: float) -> datetime:
+        days = min(interval * self._modifier(card), MAX_INTERVAL_DAYS)
+        return now + timedelta(days=days)
+
+    def reschedule(self, cards: List[Dict[str, Any]]) -> int:
+        """Recompute next_repeat of all cards answered correctly at least once.
+
+        Cards waiting for their first or relearning repetition keep their
+        due time (unless they have none). Returns how many were rescheduled.
+        """
+        import numpy as np
+
+        reviewed = [
+            c for c in cards if c["repeated"] > 0 or c["next_repeat"] is None
+        ]
+        if not reviewed:
+            return 0
+
+        last = np.array([c["last_repeated"] for c in reviewed], dtype="datetime64[us]")
+        days = np.minimum(
+            self._intervals(reviewed, np) * self._modifiers(reviewed, np),
+            MAX_INTERVAL_DAYS,
+        )
+        due = last + np.rint(days * 86_400e6).astype("timedelta64[us]")
+        for card, next_repeat in zip(
+            reviewed, np.datetime_as_string(due, unit="us").tolist()
+        ):
+            card["next_repeat"] = next_repeat
+        return len(reviewed)
+
+
+class SM2Scheduler(Scheduler):
+    """SM-2 with binary grades: correct answers multiply the interval by the
+    card's ease, wrong ones lower the ease by 0.2 and restart the steps.
+
+    The first two steps (12 hours, 1 day) match the original table.
+    """
+
+    name = "sm2"
+
+    def __init__(
+        self,
+        interval_modifier: float = 1.0,
+        subject_modifiers: Dict[str, float] | None = None,
+        initial_ease: float = 2.5,
+        min_ease: float = 1.3,
+        ease_penalty: float = 0.2,
+    ):
+        super().__init__(interval_modifier, subject_modifiers)
+        self.initial_ease = initial_ease
+        self.min_ease = min_ease
+        self.ease_penalty = ease_penalty
+
+    def correct(self, card: Dict[str, Any], now: datetime) -> datetime:
+        repeated = card["repeated"] + 1
+        if repeated <= 2:
+            interval = legacy_interval(repeated)
+        else:
+            previous = card.get("interval", legacy_interval(card["repeated"]))
+            interval = max(previous, 1) * card.get("ease", self.initial_ease)
+
+        card["interval"] = min(interval, MAX_INTERVAL_DAYS)
+        card.setdefault("ease", self.initial_ease)
+        return self._due(card, now, card["interval"])
+
+    def wrong(self, card: Dict[str, Any], now: datetime) -> None:
+        card["interval"] = 0
+        card["ease"] = max(
+            self.min_ease, card.get("ease", self.initial_ease) - self.ease_penalty
+        )
+
+    def _intervals(self, cards: List[Dict[str, Any]], np) -> Any:
+        return _field(cards, "interval", np)
+
+    def state_arrays(self, cards: List[Dict[str, Any]], np) -> Dict[str, Any]:
+        repeated = _repeated(cards, np)
+        return {
+            "repeated": repeated,
+            "interval": _field(cards, "interval", np, repeated),
+            "ease": np.fromiter(
+                (c.get("ease", self.initial_ease) for c in cards),
+                dtype=np.float64,
+                count=len(cards),
+            ),
+            "modifier": self._modifiers(cards, np),
+        }
+
+    def review_arrays(self, state: Dict[str, Any], correct: Any, elapsed: Any, np) -> Any:
+        repeated = np.where(correct, state["repeated"] + 1, 0)
+        interval = np.where(
+            repeated == 1,
+            legacy_interval(1),
+            np.where(
+                repeated == 2,
+                legacy_interval(2),
+                np.maximum(state["interval"], 1) * state["ease"],
+            ),
+        )
+        state["repeated"] = repeated
+        state["interval"] = np.where(correct, np.minimum(interval, MAX_INTERVAL_DAYS), 0)
+        state["ease"] = np.where(
+            correct, state["ease"], np.maximum(self.min_ease, state["ease"] - self.ease_penalty)
+        )
+        return np.where(
+            correct,
+            np.minimum(state["interval"] * state["modifier"], MAX_INTERVAL_DAYS),
+            RELEARNING_STEP / timedelta(days=1),
+        )
+
+
+class FSRSScheduler(Scheduler):
+    """FSRS 4.5 with binary grades (wrong is Again, correct is Good).
+
+    Every card has a stability S, the days after which the probability of
+    recalling it drops to 90%, and a difficulty D between 1 and 10. The
+    interval is the time until recall drops to desired_retention.
+    """
+
+    name = "fsrs"
+
+    DECAY = -0.5
+    FACTOR = 19 / 81
+    DEFAULT_WEIGHTS = (
+        0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+        0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+    )  # fmt: skip
+
+    AGAIN = 1
+    GOOD = 3
+
+    def __init__(
+        self,
+        interval_modifier: float = 1.0,
+        subject_modifiers: Dict[str, float] | None = None,
+        desired_retention: float = 0.9,
+        weights: tuple = DEFAULT_WEIGHTS,
+    ):
+        super().__init__(interval_modifier, subject_modifiers)
+        self.desired_retention = desired_retention
+        self.w = weights
+
+    def _initial_difficulty(self, grade: int) -> float:
+        return min(max(self.w[4] - (grade - 3) * self.w[5], 1), 10)
+
+    def _state(self, card: Dict[str, Any]) -> tuple:
+        """Stability and difficulty, derived from the old table if missing."""
+        if "stability" in card:
+            return card["stability"], card["difficulty"]
+        return max(legacy_interval(card["repeated"]), 0.1), self._initial_difficulty(
+            self.GOOD
+        )
+
+    def _retrievability(self, elapsed_days: float, stability: float) -> float:
+        return (1 + self.FACTOR * elapsed_days / stability) ** self.DECAY
+
+    def _review(self, card: Dict[str, Any], now: datetime, grade: int):
+        w = self.w
+        if "stability" not in card and card["repeated"] == 0:
+            card["stability"] = w[grade - 1]
+            card["difficulty"] = self._initial_difficulty(grade)
+            return
+
+        stability, difficulty = self._state(card)
+        elapsed = now - datetime.fromisoformat(card["last_repeated"])
+        r = self._retrievability(max(elapsed.total_seconds() / 86400, 0), stability)
+
+        if grade == self.AGAIN:
+            stability = (
+                w[11]
+                * difficulty ** -w[12]
+                * ((stability + 1) ** w[13] - 1)
+                * math.exp(w[14] * (1 - r))
+            )
+        else:
+            stability *= 1 + (
+                math.exp(w[8])
+                * (11 - difficulty)
+                * stability ** -w[9]
+                * (math.exp(w[10] * (1 - r)) - 1)
+            )
+
+        difficulty -= w[6] * (grade - 3)
+        difficulty = w[7] * self._initial_difficulty(4) + (1 - w[7]) * difficulty
+        card["stability"] = min(max(stability, 0.1), MAX_INTERVAL_DAYS)
+        card["difficulty"] = min(max(difficulty, 1), 10)
+
+    def _interval(self, stability: float) -> float:
+        return stability / self.FACTOR * (self.desired_retention ** (1 / self.DECAY) - 1)
+
+    def correct(self, card: Dict[str, Any], now: datetime) -> datetime:
+        self._review(card, now, self.GOOD)
+        return self._due(card, now, self._interval(card["stability"]))
+
+    def wrong(self, card: Dict[str, Any], now: datetime) -> None:
+        self._review(card, now, self.AGAIN)
+
+    def _intervals(self, cards: List[Dict[str, Any]], np) -> Any:
+        stability = np.maximum(_field(cards, "stability", np), 0.1)
+        return stability / self.FACTOR * (self.desired_retention ** (1 / self.DECAY) - 1)
+
+    def state_arrays(self, cards: List[Dict[str, Any]], np) -> Dict[str, Any]:
+        repeated = _repeated(cards, np)
+        stability = np.fromiter(
+            (c.get("stability", math.nan) for c in cards), dtype=np.float64, count=len(cards)
+        )
+        new = np.isnan(stability) & (repeated == 0)
+        difficulty = np.fromiter(
+            (c.get("difficulty", math.nan) for c in cards), dtype=np.float64, count=len(cards)
+        )
+        return {
+            "new": new,
+            "stability": np.maximum(_field(cards, "stability", np, repeated), 0.1),
+            "difficulty": np.where(
+                np.isnan(difficulty), self._initial_difficulty(self.GOOD), difficulty
+            ),
+            "modifier": self._modifiers(cards, np),
+        }
+
+    def review_arrays(self, state: Dict[str, Any], correct: Any, elapsed: Any, np) -> Any:
+        w = self.w
+        stability, difficulty = state["stability"], state["difficulty"]
+        grade = np.where(correct, self.GOOD, self.AGAIN)
+        r = (1 + self.FACTOR * np.maximum(elapsed, 0) / stability) ** self.DECAY
+
+        forgotten = (
+            w[11]
+            * difficulty ** -w[12]
+            * ((stability + 1) ** w[13] - 1)
+            * np.exp(w[14] * (1 - r))
+        )
+        recalled = stability * (
+            1
+            + np.exp(w[8])
+            * (11 - difficulty)
+            * stability ** -w[9]
+            * (np.exp(w[10] * (1 - r)) - 1)
+        )
+        next_difficulty = difficulty - w[6] * (grade - 3)
+        next_difficulty = (
+            w[7] * self._initial_difficulty(4) + (1 - w[7]) * next_difficulty
+        )
+
+        initial_stability = np.where(correct, w[self.GOOD - 1], w[self.AGAIN - 1])
+        initial_difficulty = np.clip(w[4] - (grade - 3) * w[5], 1, 10)
+        new = state["new"]
+        state["stability"] = np.where(
+            new,
+            initial_stability,
+            np.clip(np.where(correct, recalled, forgotten), 0.1, MAX_INTERVAL_DAYS),
+        )
+        state["difficulty"] = np.where(
+            new, initial_difficulty, np.clip(next_difficulty, 1, 10)
+        )
+        state["new"] = np.zeros_like(new)
+        return np.where(
+            correct,
+            np.minimum(
+                self._interval(state["stability"]) * state["modifier"], MAX_INTERVAL_DAYS
+            ),
+            RELEARNING_STEP / timedelta(days=1),
+        )
+
+
+SCHEDULERS = {s.name: s for s in (SM2Scheduler, FSRSScheduler)}
+
+
+def get_scheduler() -> Scheduler:
+    name = os.getenv("POMLET_SCHEDULER", "sm2").lower()
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler {name!r}, expected one of {list(SCHEDULERS)}")
+    interval_modifier, subject_modifiers = modifiers()
+    return SCHEDULERS[name](interval_modifier, subject_modifiers)
@@ -0,0 +1,211 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Log of every pomodoro and break, in ~/.pomodoro/sessions/. sessions.bin
+is a binary log (see binary_log) of fixed-size 32 byte records:
+
+    start        float64  seconds since the epoch
+    end          float64  seconds since the epoch
+    planned      float32  planned length, in seconds
+    paused       float32  time spent paused, in seconds
+    subject      uint16   index into subjects.json
+    kind         uint8    0 work, 1 break
+    interrupted  uint8    1 if stopped before the end
+    (4 padding bytes)
+
+Records are kept sorted by start time, which is the date index: a time
+range is found by binary search on the memory-mapped start column, and
+the subject column of just that range is summed per subject.
+"""
+
+import json
+import logging
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.binary_log import HEADER, map_records, prepare_append
+from src.config import get_config_path
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PLSL"
+VERSION = 1
+RECORD = struct.Struct("<ddffHBB4x")
+
+WORK = 0
+BREAK = 1
+
+
+def get_sessions_path() -> Path:
+    return get_config_path().parent.joinpath("sessions")
+
+
+def focus_minutes(start: Any, end: Any, paused: Any) -> Any:
+    """Minutes worked in a session, pauses excluded, also when it was stopped.
+
+    The one definition of focus time, for the log and the statistics; takes
+    timestamps in seconds, or arrays of them.
+    """
+    return (end - start - paused) / 60
+
+
+def record_dtype():
+    import numpy as np
+
+    return np.dtype(
+        [
+            ("start", "<f8"),
+            ("end", "<f8"),
+            ("planned", "<f4"),
+            ("paused", "<f4"),
+            ("subject", "<u2"),
+            ("kind", "u1"),
+            ("interrupted", "u1"),
+            ("_pad", "V4"),
+        ]
+    )
+
+
+class SessionLog:
+    def __init__(self, directory: Path | None = None):
+        self._directory = get_sessions_path() if directory is None else directory
+        self._subjects: List[str] | None = None  # loaded when first needed
+
+    @property
+    def path(self) -> Path:
+        return self._directory.joinpath("sessions.bin")
+
+    def _subjects_path(self) -> Path:
+        return self._directory.joinpath("subjects.json")
+
+    def subjects(self) -> List[str]:
+        """Subject names, indexed by the subject column."""
+        if self._subjects is None:
+            try:
+                with open(self._subjects_path(), encoding="utf-8") as f:
+                    self._subjects = json.load(f)
+            except FileNotFoundError:
+                self._subjects = []
+            except (OSError, ValueError) as e:
+                logger.warning("Could not read session subjects: %s", e)
+                self._subjects = []
+        return self._subjects
+
+    def _subject_index(self, subject: str) -> int:
+        subjects = self.subjects()
+        if subject in subjects:
+            return subjects.index(subject)
+
+        subjects.append(subject)
+        tmp_path = self._subjects_path().with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(subjects, f)
+        os.replace(tmp_path, self._subjects_path())
+        return len(subjects) - 1
+
+    def append(
+        self,
+        subject: str,
+        kind: int,
+        start: datetime,
+        end: datetime,
+        planned: float,
+        paused: float = 0.0,
+        interrupted: bool = False,
+    ):
+        """Log one session; planned and paused in seconds."""
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            record = RECORD.pack(
+                start.timestamp(),
+                end.timestamp(),
+                planned,
+                paused,
+                self._subject_index(subject),
+                kind,
+                int(interrupted),
+            )
+            # not "ab": a restored session may go before the last record
+            with open(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644), "r+b") as f:
+                size = prepare_append(f, MAGIC, VERSION, RECORD.size)
+                self._insert(f, size, record, start.timestamp())
+        except OSError as e:
+            logger.warning("Could not log session of %s: %s", subject, e)
+
+    @staticmethod
+    def _insert(f, size: int, record: bytes, start: float):
+        """Write record at its place by start time, almost always at the end."""
+        position = size
+        while position > HEADER.size:
+            f.seek(position - RECORD.size)
+            if RECORD.unpack(f.read(RECORD.size))[0] <= start:
+                break
+            position -= RECORD.size  # a restored session that ended while closed
+
+        f.seek(position)
+        tail = f.read()
+        f.seek(position)
+        f.write(record + tail)
+
+    def read(self) -> Any:
+        """All sessions, ordered by start time, as a read-only structured array."""
+        import numpy as np
+
+        sessions = map_records(self.path, MAGIC, record_dtype())
+        if sessions is None:
+            return np.empty(0, dtype=record_dtype())
+        return sessions
+
+    def between(self, start: datetime, end: datetime) -> Any:
+        """Sessions started from start (included) to end (excluded)."""
+        import numpy as np
+
+        sessions = self.read()
+        first, last = np.searchsorted(
+            sessions["start"], [start.timestamp(), end.timestamp()], side="left"
+        )
+        return sessions[first:last]
+
+    def minutes_by_subject(
+        self, start: datetime, end: datetime, kind: int = WORK
+    ) -> Dict[str, float]:
+        """Minutes spent per subject in sessions of a kind started in a range,
+        as counted by focus_minutes."""
+        import numpy as np
+
+        sessions = self.between(start, end)
+        sessions = sessions[sessions["kind"] == kind]
+        subjects = self.subjects()
+        minutes = np.bincount(
+            sessions["subject"],
+            weights=focus_minutes(sessions["start"], sessions["end"], sessions["paused"]),
+            minlength=len(subjects),
+        )
+        return {subjects[i]: float(minutes[i]) for i in np.flatnonzero(minutes > 0)}
+
+
+_session_log: SessionLog | None = None
+
+
+def get_session_log() -> SessionLog:
+    global _session_log
+    if _session_log is None:
+        _session_log = SessionLog()
+    return _session_log
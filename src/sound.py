@@ -1,29 +0,0 @@
-"""
-Pomlet - A simple Pomodoro timer for your studies.
-Copyright (C) 2025 @ Manueel62
-
-This program is free software: you can redistribute it and/or modify
-it under the terms of the GNU General Public License as published by
-the Free Software Foundation, either version 3 of the License, or
-(at your option) any later version.
-
-This program is distributed in the hope that it will be useful,
-but WITHOUT ANY WARRANTY; without even the implied warranty of
-MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-GNU General Public License for more details.
-
-You should have received a copy of the GNU General Public License
-along with this program.  If not, see <https://www.gnu.org/licenses/>.
-"""
-import platform
-import subprocess
-
-
-def play_sound():
-    """Play a sound when the timer ends (macOS/Windows compatible)."""
-    if platform.system() == "Darwin":  # macOS
-        subprocess.run(["afplay", "/System/Library/Sounds/Ping.aiff"])
-    elif platform.system() == "Windows":
-        raise RuntimeError("Windows not supported")
-    else:
-        print("\a")  # Fallback: System beep
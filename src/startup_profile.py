@@ -0,0 +1,216 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Startup profiling mode, enabled with POMLET_PROFILE_STARTUP=1 (or =trace)
+or the --profile-startup[=trace] flag. It records the phases of the launch
+and the cost of every import, then writes startup_profile.json (and with
+"trace" startup_trace.json, for chrome://tracing or Perfetto) to the data
+directory.
+"""
+
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+from src.config import get_config_path
+from src.tracing import chrome_trace
+
+_t0: float = time.perf_counter()  # launch time, see start()
+_mode: str = os.getenv("POMLET_PROFILE_STARTUP", "")
+for _arg in sys.argv[1:]:
+    if _arg == "--profile-startup":
+        _mode = _mode or "1"
+    elif _arg.startswith("--profile-startup="):
+        _mode = _arg.split("=", 1)[1]
+
+_enabled: bool = _mode not in ("", "0")
+_finished: bool = False
+_lock = threading.Lock()
+_phases: List[Dict[str, Any]] = []
+_imports: List[Dict[str, Any]] = []
+_import_stack: List[float] = []  # time spent in nested imports, per level
+_original_import = builtins.__import__
+
+
+def enabled() -> bool:
+    return _enabled and not _finished
+
+
+def _now_ms() -> float:
+    return (time.perf_counter() - _t0) * 1000
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if threading.current_thread() is not threading.main_thread():
+        return _original_import(name, globals, locals, fromlist, level)
+
+    loaded = len(sys.modules)
+    start = _now_ms()
+    _import_stack.append(0.0)
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = _now_ms() - start
+        nested = _import_stack.pop()
+        if _import_stack:
+            _import_stack[-1] += elapsed
+
+        if len(sys.modules) > loaded:  # skip imports of already loaded modules
+            if level > 0 and globals is not None:
+                name = f"{globals.get('__package__') or ''}{'.' * level}{name}"
+            _imports.append(
+                {
+                    "module": name,
+                    "start_ms": start,
+                    "inclusive_ms": elapsed,
+                    "self_ms": elapsed - nested,
+                }
+            )
+
+
+def start(launched_at: float | None = None):
+    """Start collecting; call as early as possible in main.py.
+
+    launched_at, a time.perf_counter() value, moves the origin of the report
+    back to work done before this module could be imported.
+    """
+    global _t0
+    if enabled():
+        if launched_at is not None:
+            _t0 = launched_at
+        builtins.__import__ = _timed_import
+
+
+def record(name: str, started_at: float, ended_at: float):
+    """Record a phase that already ended, with time.perf_counter() values."""
+    if not enabled():
+        return
+
+    with _lock:
+        _phases.append(
+            {
+                "name": name,
+                "start_ms": (started_at - _t0) * 1000,
+                "duration_ms": (ended_at - started_at) * 1000,
+                "thread": threading.current_thread().name,
+            }
+        )
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    if not enabled():
+        yield
+        return
+
+    start_ms = _now_ms()
+    try:
+        yield
+    finally:
+        with _lock:
+            _phases.append(
+                {
+                    "name": name,
+                    "start_ms": start_ms,
+                    "duration_ms": _now_ms() - start_ms,
+                    "thread": threading.current_thread().name,
+                }
+            )
+
+
+def mark(name: str):
+    """Record an instant, e.g. the first paint."""
+    if not enabled():
+        return
+
+    with _lock:
+        _phases.append(
+            {
+                "name": name,
+                "start_ms": _now_ms(),
+                "duration_ms": 0.0,
+                "thread": threading.current_thread().name,
+            }
+        )
+
+
+def finish():
+    """Stop collecting and write the reports; later calls do nothing."""
+    global _finished
+    if not enabled():
+        return
+
+    _finished = True
+    builtins.__import__ = _original_import
+    total_ms = _now_ms()
+
+    data_dir = get_config_path().parent
+    imports = sorted(_imports, key=lambda i: i["self_ms"], reverse=True)
+    report = {
+        "total_ms": total_ms,
+        "phases": sorted(_phases, key=lambda p: p["start_ms"]),
+        "imports": imports,
+    }
+    with open(data_dir.joinpath("startup_profile.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    if _mode == "trace":
+        with open(data_dir.joinpath("startup_trace.json"), "w", encoding="utf-8") as f:
+            json.dump(_chrome_trace(), f)
+
+    print(f"Startup took {total_ms:.1f} ms", file=sys.stderr)
+    for p in report["phases"]:
+        print(
+            f"  {p['start_ms']:>8.1f} ms  {p['duration_ms']:>8.1f} ms  {p['name']}",
+            file=sys.stderr,
+        )
+    print("Slowest imports (self time):", file=sys.stderr)
+    for i in imports[:15]:
+        print(
+            f"  {i['self_ms']:>8.1f} ms  ({i['inclusive_ms']:.1f} ms incl.)  {i['module']}",
+            file=sys.stderr,
+        )
+    print(f"Report written to {data_dir.joinpath('startup_profile.json')}", file=sys.stderr)
+
+
+def _chrome_trace() -> Dict[str, Any]:
+    spans = [
+        {
+            "name": p["name"],
+            "cat": "phase",
+            "ts": p["start_ms"] * 1000,
+            "dur": p["duration_ms"] * 1000,
+            "thread": p["thread"],
+        }
+        for p in _phases
+    ]
+    spans += [
+        {
+            "name": f"import {i['module']}",
+            "cat": "import",
+            "ts": i["start_ms"] * 1000,
+            "dur": i["inclusive_ms"] * 1000,
+            "thread": threading.main_thread().name,
+        }
+        for i in _imports
+    ]
+    return chrome_trace(spans)
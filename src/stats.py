@@ -0,0 +1,250 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Study statistics kept as rollups in ~/.pomodoro/stats.json: per day and,
+within each day, per subject, the number of reviews, correct answers,
+added flashcards and pomodoro minutes, plus all-time totals per subject
+and the study streak. Every review, added card and work session updates
+the rollups in place, so reading them never touches the raw history.
+"""
+
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from src.config import get_config_path
+from src.review_log import CORRECT
+from src.session_log import WORK, SessionLog, focus_minutes
+
+logger = logging.getLogger(__name__)
+
+STATS_VERSION = 1
+FIELDS = ("reviews", "correct", "added", "minutes")
+
+
+def get_stats_path() -> Path:
+    return get_config_path().parent.joinpath("stats.json")
+
+
+def _empty() -> Dict[str, Any]:
+    return {field: 0 for field in FIELDS}
+
+
+def _new_data() -> Dict[str, Any]:
+    return {
+        "version": STATS_VERSION,
+        "backfilled": False,
+        "days": {},
+        "subjects": {},
+        "streak": {"last_day": None, "current": 0, "longest": 0},
+    }
+
+
+class StatsStore:
+    def __init__(self, path: Path | None = None):
+        self._path = get_stats_path() if path is None else path
+        self._data = self._load()
+        self._version = 0  # bumped on every change, for caches of derived views
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == STATS_VERSION:
+                return data
+            logger.warning("Ignoring stats of version %s", data.get("version"))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read %s: %s", self._path, e)
+
+        return _new_data()
+
+    def _save(self):
+        tmp_path = self._path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.warning("Could not write %s: %s", self._path, e)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def backfilled(self) -> bool:
+        return self._data.get("backfilled", False)
+
+    def backfill(self, cards: List[Dict[str, Any]], records: Any, session_log: SessionLog):
+        """Build the rollups from the deck, the review log records and the
+        session log, until this has been done once.
+
+        Everything recorded so far is also in those logs, so the rollups are
+        rebuilt from scratch. Reviews of deleted cards are counted under no
+        subject.
+        """
+        self._data = _new_data()
+        subjects = {card["id"]: card["subject"] for card in cards}
+        for card in cards:
+            self._add(card["subject"], datetime.fromisoformat(card["created"]), added=1)
+
+        for card_id, ts, outcome in zip(
+            records["card_id"].tolist(), records["ts"].tolist(), records["outcome"].tolist()
+        ):
+            self._add(
+                subjects.get(card_id, ""),
+                datetime.fromtimestamp(ts),
+                streak=False,
+                reviews=1,
+                correct=int(outcome == CORRECT),
+            )
+
+        sessions = session_log.read()
+        sessions = sessions[sessions["kind"] == WORK]
+        session_subjects = session_log.subjects()
+        minutes = focus_minutes(sessions["start"], sessions["end"], sessions["paused"])
+        for subject, start, amount in zip(
+            sessions["subject"].tolist(), sessions["start"].tolist(), minutes.tolist()
+        ):
+            self._add(
+                session_subjects[subject] if subject < len(session_subjects) else "",
+                datetime.fromtimestamp(start),
+                streak=False,
+                minutes=amount,
+            )
+
+        # the logs are not merged by time, so the streak is rebuilt in day order
+        for day, rollup in sorted(self._data["days"].items()):
+            if rollup["reviews"] or rollup["minutes"]:
+                self._extend_streak(date.fromisoformat(day))
+
+        self._data["backfilled"] = True
+        self._version += 1
+        self._save()
+
+    def _add(self, subject: str, when: datetime, streak: bool = True, **amounts: float):
+        day = when.date()
+        rollup = self._data["days"].setdefault(day.isoformat(), _empty())
+        by_subject = rollup.setdefault("subjects", {}).setdefault(subject, _empty())
+        totals = self._data["subjects"].setdefault(subject, _empty())
+        for field, amount in amounts.items():
+            rollup[field] += amount
+            by_subject[field] += amount
+            totals[field] += amount
+
+        if streak and ("reviews" in amounts or "minutes" in amounts):
+            self._extend_streak(day)
+
+    def _record(self, subject: str, when: datetime | None, **amounts: float):
+        self._add(subject, when or datetime.now(), **amounts)
+        self._version += 1
+        self._save()
+
+    def _extend_streak(self, day: date):
+        streak = self._data["streak"]
+        last_day = (
+            date.fromisoformat(streak["last_day"]) if streak["last_day"] else None
+        )
+        if last_day is not None and day <= last_day:
+            return  # already counted, or an older session restored late
+
+        if last_day is not None and day - last_day == timedelta(days=1):
+            streak["current"] += 1
+        else:
+            streak["current"] = 1
+        streak["last_day"] = day.isoformat()
+        streak["longest"] = max(streak["longest"], streak["current"])
+
+    def record_review(self, subject: str, correct: bool, when: datetime | None = None):
+        self._record(subject, when, reviews=1, correct=int(correct))
+
+    def record_added(self, subject: str, count: int = 1, when: datetime | None = None):
+        self._record(subject, when, added=count)
+
+    def record_session(self, subject: str, minutes: float, when: datetime | None = None):
+        self._record(subject, when, minutes=minutes)
+
+    def day(self, day: date) -> Dict[str, Any]:
+        """The rollup of one day, with a "subjects" breakdown."""
+        rollup = self._data["days"].get(day.isoformat())
+        if rollup is None:
+            return {**_empty(), "subjects": {}}
+        return rollup
+
+    def days(self) -> Dict[str, Dict[str, Any]]:
+        """All per-day rollups, keyed by ISO date."""
+        return self._data["days"]
+
+    def period(self, start: date, end: date) -> Dict[str, Any]:
+        """Totals, and totals per subject, from start to end inclusive."""
+        totals: Dict[str, Any] = {**_empty(), "subjects": {}}
+        day = start
+        while day <= end:
+            rollup = self._data["days"].get(day.isoformat())
+            if rollup is not None:
+                for field in FIELDS:
+                    totals[field] += rollup[field]
+                for subject, counts in rollup.get("subjects", {}).items():
+                    subject_totals = totals["subjects"].setdefault(subject, _empty())
+                    for field in FIELDS:
+                        subject_totals[field] += counts[field]
+            day += timedelta(days=1)
+        return totals
+
+    def subjects(self) -> Dict[str, Dict[str, Any]]:
+        """All-time totals per subject."""
+        return self._data["subjects"]
+
+    def streak(self, today: date | None = None) -> Tuple[int, int]:
+        """Current and longest streak of days with reviews or pomodoros.
+
+        A streak is still current on the day after its last active day.
+        """
+        today = today or date.today()
+        streak = self._data["streak"]
+        current = streak["current"]
+        if streak["last_day"] is None or (
+            today - date.fromisoformat(streak["last_day"]) > timedelta(days=1)
+        ):
+            current = 0
+        return current, streak["longest"]
+
+
+def retention(rollup: Dict[str, Any]) -> float | None:
+    """Share of correct answers, None without reviews."""
+    if rollup["reviews"] == 0:
+        return None
+    return rollup["correct"] / rollup["reviews"]
+
+
+_stats_store: StatsStore | None = None
+
+
+def get_stats_store() -> StatsStore:
+    """The store of the current data directory, which POMLET_HOME may move."""
+    global _stats_store
+    if _stats_store is None or _stats_store.path != get_stats_path():
+        _stats_store = StatsStore()
+    return _stats_store
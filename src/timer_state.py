@@ -0,0 +1,55 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from src.config import get_config_path
+
+
+def get_timer_state_path() -> Path:
+    return get_config_path().parent.joinpath("timer_state.json")
+
+
+def save_timer_state(state: Dict[str, Any]):
+    """Checkpoint the running session, replacing the previous one atomically."""
+    state_path: Path = get_timer_state_path()
+    tmp_path: Path = state_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+    os.replace(tmp_path, state_path)
+
+
+def load_timer_state() -> Dict[str, Any] | None:
+    """Load the last checkpoint, None if there is none or it is unreadable."""
+    state_path: Path = get_timer_state_path()
+    if not state_path.exists():
+        return None
+
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def clear_timer_state():
+    get_timer_state_path().unlink(missing_ok=True)
@@ -0,0 +1,165 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Lightweight tracing spans around the hot paths, enabled with POMLET_TRACE=1.
+Finished spans go into a ring buffer (POMLET_TRACE_BUFFER spans, 100k by
+default) that can be exported as a Chrome/Perfetto trace on demand, or at
+exit to POMLET_TRACE_FILE. When disabled, span() returns a shared no-op.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, List, Tuple
+
+# name, category, start (ns), duration (ns), thread id, args
+_Record = Tuple[str, str, int, int, int, Dict[str, Any] | None]
+
+_enabled: bool = os.getenv("POMLET_TRACE", "") not in ("", "0")
+_buffer: Deque[_Record] = deque(maxlen=int(os.getenv("POMLET_TRACE_BUFFER", "100000")))
+_thread_names: Dict[int, str] = {}
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(on: bool = True):
+    global _enabled
+    _enabled = on
+
+
+class _Span:
+    __slots__ = ("_name", "_cat", "_args", "_start")
+
+    def __init__(self, name: str, cat: str, args: Dict[str, Any] | None):
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        tid = threading.get_ident()
+        if tid not in _thread_names:
+            _thread_names[tid] = threading.current_thread().name
+        _buffer.append(
+            (self._name, self._cat, self._start, end - self._start, tid, self._args)
+        )
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, cat: str = "app", **args: Any) -> _Span | _NullSpan:
+    """Context manager timing the enclosed block."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, cat, args or None)
+
+
+def traced(name: str, cat: str = "app") -> Callable:
+    """Decorator tracing every call of the function as a span."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, cat, None):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def chrome_trace(
+    spans: Iterable[Dict[str, Any]], pid: int | None = None
+) -> Dict[str, Any]:
+    """Chrome trace JSON from spans with name, cat, ts and dur (µs) and thread."""
+    pid = os.getpid() if pid is None else pid
+    thread_ids: Dict[str, int] = {}
+    events: List[Dict[str, Any]] = []
+    for s in spans:
+        tid = thread_ids.setdefault(s["thread"], len(thread_ids) + 1)
+        event = {
+            "name": s["name"],
+            "cat": s["cat"],
+            "ph": "X" if s["dur"] > 0 else "i",
+            "ts": s["ts"],
+            "dur": s["dur"],
+            "pid": pid,
+            "tid": tid,
+        }
+        if s.get("args"):
+            event["args"] = s["args"]
+        events.append(event)
+
+    for thread, tid in thread_ids.items():
+        events.append(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}}
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path: Path) -> int:
+    """Write the buffered spans to path; returns how many were written."""
+    records = list(_buffer)
+    spans = [
+        {
+            "name": name,
+            "cat": cat,
+            "ts": start / 1000,
+            "dur": duration / 1000,
+            "thread": _thread_names.get(tid, str(tid)),
+            "args": args,
+        }
+        for name, cat, start, duration, tid, args in records
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(chrome_trace(spans), f)
+    return len(records)
+
+
+def _export_at_exit():
+    trace_file = os.getenv("POMLET_TRACE_FILE")
+    if _enabled and trace_file:
+        export_chrome_trace(Path(trace_file))
+
+
+atexit.register(_export_at_exit)
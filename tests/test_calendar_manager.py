@@ -0,0 +1,202 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+from src.calendar_manager import CalendarSink, CalendarWriter, Event, IcsSink
+
+START = datetime(2025, 3, 14, 9, 30)
+
+
+def make_event(i: int, title: str = "Math Pomodoro") -> Event:
+    start = START + timedelta(hours=i)
+    return {
+        "uid": f"event-{i}@pomlet",
+        "title": title,
+        "start": start.isoformat(),
+        "end": (start + timedelta(minutes=25)).isoformat(),
+    }
+
+
+class RecordingSink(CalendarSink):
+    """Records the batches it is given, and fails while failing is set."""
+
+    name = "recording"
+
+    def __init__(self, failing: bool = False):
+        self.failing = failing
+        self.batches: List[List[Event]] = []
+
+    def write(self, events: List[Event]) -> None:
+        if self.failing:
+            raise OSError("calendar unavailable")
+        self.batches.append(events)
+
+
+class CrashingIcsSink(IcsSink):
+    """Writes the batch, then fails as if the app died before dequeuing it."""
+
+    name = "crashing"
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.crash = True
+
+    def write(self, events: List[Event]) -> None:
+        super().write(events)
+        if self.crash:
+            raise OSError("killed after writing")
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class CalendarSinkTest(unittest.TestCase):
+    def test_sink_without_write_cannot_be_created(self):
+        class Incomplete(CalendarSink):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class IcsSinkTest(TempDirTestCase):
+    def read_lines(self) -> List[str]:
+        return self.dir.joinpath("pomlet.ics").read_bytes().decode("utf-8").split("\r\n")
+
+    def test_writes_a_calendar_with_one_event_per_pomodoro(self):
+        IcsSink(self.dir.joinpath("pomlet.ics")).write([make_event(0), make_event(1)])
+
+        lines = self.read_lines()
+        self.assertEqual(
+            lines[:3], ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Pomlet//Pomlet//EN"]
+        )
+        self.assertEqual(lines[-2:], ["END:VCALENDAR", ""])
+        self.assertEqual(lines.count("BEGIN:VEVENT"), 2)
+        self.assertIn("UID:event-0@pomlet", lines)
+        self.assertIn("DTSTART:20250314T093000", lines)
+        self.assertIn("DTEND:20250314T095500", lines)
+        self.assertIn("SUMMARY:Math Pomodoro", lines)
+
+    def test_appends_inside_the_existing_calendar(self):
+        sink = IcsSink(self.dir.joinpath("pomlet.ics"))
+        sink.write([make_event(0)])
+        sink.write([make_event(1)])
+
+        lines = self.read_lines()
+        self.assertEqual(lines.count("BEGIN:VCALENDAR"), 1)
+        self.assertEqual(lines.count("END:VCALENDAR"), 1)
+        self.assertEqual(lines[-2], "END:VCALENDAR")
+        self.assertEqual(lines.count("BEGIN:VEVENT"), 2)
+
+    def test_escapes_and_folds_long_titles(self):
+        title = "Algebra, geometry; and more \\ " + "é" * 60
+        IcsSink(self.dir.joinpath("pomlet.ics")).write([make_event(0, title)])
+
+        data = self.dir.joinpath("pomlet.ics").read_bytes()
+        for line in data.split(b"\r\n"):
+            self.assertLessEqual(len(line), 75)
+        unfolded = data.replace(b"\r\n ", b"").decode("utf-8")
+        self.assertIn("SUMMARY:Algebra\\, geometry\\; and more \\\\ " + "é" * 60, unfolded)
+
+    def test_skips_events_already_written(self):
+        sink = IcsSink(self.dir.joinpath("pomlet.ics"))
+        sink.write([make_event(0), make_event(1)])
+        sink.write([make_event(1), make_event(2)])
+
+        lines = self.read_lines()
+        self.assertEqual(lines.count("BEGIN:VEVENT"), 3)
+        self.assertEqual(lines.count("UID:event-1@pomlet"), 1)
+
+    def test_reads_only_the_tail_for_already_written_events(self):
+        sink = IcsSink(self.dir.joinpath("pomlet.ics"))
+        sink._TAIL_CHUNK = 100  # a few lines at a time
+        sink.write([make_event(i) for i in range(20)])
+        sink.write([make_event(17), make_event(18), make_event(19), make_event(20)])
+
+        lines = self.read_lines()
+        self.assertEqual(lines.count("BEGIN:VEVENT"), 21)
+        self.assertEqual(lines.count("UID:event-17@pomlet"), 1)
+
+
+class CalendarWriterTest(TempDirTestCase):
+    def add_events(self, writer: CalendarWriter, count: int):
+        for i in range(count):
+            start = START + timedelta(hours=i)
+            writer.add_event(f"Pomodoro {i}", start, start + timedelta(minutes=25))
+
+    def test_flushes_in_batches_and_empties_the_queue(self):
+        sink = RecordingSink()
+        writer = CalendarWriter([sink], self.dir, batch_size=2)
+        self.add_events(writer, 5)
+
+        writer.flush()
+
+        self.assertEqual([len(batch) for batch in sink.batches], [2, 2, 1])
+        titles = [event["title"] for batch in sink.batches for event in batch]
+        self.assertEqual(titles, [f"Pomodoro {i}" for i in range(5)])
+        self.assertEqual(writer.pending(sink), [])
+
+    def test_failing_sink_keeps_its_events_for_the_next_run(self):
+        failing = RecordingSink(failing=True)
+        ics = IcsSink(self.dir.joinpath("pomlet.ics"))
+        writer = CalendarWriter([failing, ics], self.dir)
+        self.add_events(writer, 3)
+
+        with self.assertRaises(OSError):
+            writer.flush()
+        self.assertEqual(len(writer.pending(failing)), 3)
+        self.assertEqual(writer.pending(ics), [])  # the other sink is not held up
+
+        # next launch: a new writer replays the queue left on disk
+        failing.failing = False
+        CalendarWriter([failing, ics], self.dir).flush()
+        self.assertEqual(
+            [event["title"] for event in failing.batches[0]],
+            [f"Pomodoro {i}" for i in range(3)],
+        )
+        self.assertEqual(writer.pending(failing), [])
+
+    def test_replay_after_a_crash_does_not_duplicate_events(self):
+        path = self.dir.joinpath("pomlet.ics")
+        sink = CrashingIcsSink(path)
+        writer = CalendarWriter([sink], self.dir)
+        self.add_events(writer, 2)
+
+        with self.assertRaises(OSError):
+            writer.flush()
+        self.assertEqual(len(writer.pending(sink)), 2)
+
+        sink.crash = False
+        writer.flush()
+        self.assertEqual(writer.pending(sink), [])
+        self.assertEqual(path.read_bytes().count(b"BEGIN:VEVENT"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
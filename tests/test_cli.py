@@ -0,0 +1,96 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.cli import _read_import_file, cmd_review
+from src.questions_manager import QuestionManager
+
+
+class ReadImportFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name).joinpath("deck.csv")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def read(self, text: str):
+        self.path.write_text(text, encoding="utf-8")
+        with mock.patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            grouped = _read_import_file(self.path, "Default")
+        return grouped, stderr.getvalue()
+
+    def test_without_header_only_the_first_column_is_read(self):
+        grouped, _ = self.read("What is 2+2?,Math\n\nWhat is H2O?\n")
+
+        self.assertEqual(grouped, {"Default": ["What is 2+2?", "What is H2O?"]})
+
+    def test_rows_without_a_subject_get_the_default(self):
+        grouped, errors = self.read('question,subject\nWhat is 2+2?,Math\nWhat is H2O?\n"Why?",\n')
+
+        self.assertEqual(grouped, {"Math": ["What is 2+2?"], "Default": ["What is H2O?", "Why?"]})
+        self.assertEqual(errors, "")
+
+    def test_reports_bad_rows_with_their_line_number(self):
+        grouped, errors = self.read('question,subject\n"Multi\nline",Math\nA,B,C\nWhat is H2O?,\n')
+
+        self.assertEqual(grouped, {"Math": ["Multi\nline"], "Default": ["What is H2O?"]})
+        self.assertEqual(errors, f"{self.path}:4: expected question,subject, skipped\n")
+
+    def test_unreadable_file_raises_with_the_line_number(self):
+        self.path.write_text("question,subject\nA,Math\n" + "x" * 200_000 + "\n", encoding="utf-8")
+
+        with self.assertRaisesRegex(ValueError, ":3: "):
+            _read_import_file(self.path, "Default")
+
+
+class ReviewTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(os.environ, {"POMLET_HOME": self._tmp.name})
+        self._env.start()
+        QuestionManager().add_questions([f"Question {i}" for i in range(3)], "Math")
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def review(self, answers: str, limit=None) -> str:
+        with mock.patch("sys.stdin", io.StringIO(answers)), mock.patch(
+            "sys.stdout", new_callable=io.StringIO
+        ) as stdout:
+            self.assertEqual(cmd_review(argparse.Namespace(limit=limit)), 0)
+        return stdout.getvalue()
+
+    def test_skipped_cards_are_not_reviewed(self):
+        self.assertIn("Reviewed 2 flashcards, skipped 1.", self.review("s\ny\nn\n"))
+        self.assertEqual(QuestionManager().count(), 1)  # the skipped card is still due
+
+    def test_skipped_cards_do_not_count_for_the_limit(self):
+        self.assertIn("Reviewed 1 flashcards, skipped 1.", self.review("s\ny\n", limit=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
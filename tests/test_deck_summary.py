@@ -0,0 +1,79 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.deck_summary import HORIZON_HOURS, HOUR, build_summary, count_due
+
+
+def make_deck(offsets: List[float | None]) -> List[Dict[str, Any]]:
+    """One card per offset, in seconds from now, None for never reviewed."""
+    now = time.time()
+    return [
+        {
+            "subject": "Math",
+            "next_repeat": None
+            if offset is None
+            else datetime.fromtimestamp(now + offset).isoformat(),
+        }
+        for offset in offsets
+    ]
+
+
+class CountDueTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name).joinpath("questions.json")
+        self.path.write_text("[]")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_counts_cards_once_their_hour_is_over(self):
+        deck = make_deck([-60, None, 2 * HOUR, 5 * HOUR])
+        summary = build_summary(deck, self.path)
+        now = summary["saved_at"]
+
+        self.assertEqual(count_due(summary, now), 1)
+        self.assertEqual(count_due(summary, now + 4 * HOUR), 2)
+        self.assertEqual(count_due(summary, now + 7 * HOUR), 3)
+
+    def test_histogram_is_bounded_by_the_horizon(self):
+        minutes = range(60, (HORIZON_HOURS + 48) * 60, 7)
+        summary = build_summary(make_deck([minute * 60 for minute in minutes]), self.path)
+
+        self.assertLessEqual(len(summary["due_histogram"]), HORIZON_HOURS + 1)
+        self.assertGreater(summary["later"], 0)
+
+    def test_unknown_after_the_horizon_with_later_cards(self):
+        summary = build_summary(make_deck([HOUR, (HORIZON_HOURS + 48) * HOUR]), self.path)
+        after_horizon = summary["horizon"] + HOUR
+
+        self.assertIsNone(count_due(summary, after_horizon))
+
+        summary = build_summary(make_deck([HOUR]), self.path)
+        self.assertEqual(count_due(summary, after_horizon), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from typing import List
+from unittest import mock
+
+from src.questions_manager import QuestionManager, get_question_path
+
+
+class DueIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(os.environ, {"POMLET_HOME": self._tmp.name})
+        self._env.start()
+
+        # one card due already, the others in 1, 2 and 3 hours
+        self.now = datetime.now().replace(microsecond=0)
+        self.due_times = [self.now - timedelta(days=1)] + [
+            self.now + timedelta(hours=hours) for hours in (1, 2, 3)
+        ]
+        deck = [
+            {
+                "id": i,
+                "question": f"Question {i}",
+                "subject": "Math",
+                "created": (self.now - timedelta(days=2)).isoformat(),
+                "last_repeated": (self.now - timedelta(days=2)).isoformat(),
+                "repeated": 1,
+                "next_repeat": due.isoformat(),
+            }
+            for i, due in enumerate(self.due_times)
+        ]
+        get_question_path().write_text(json.dumps(deck), encoding="utf-8")
+        self.questions = QuestionManager()
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def promote(self, hours: float) -> List[int]:
+        promoted = self.questions.promote_due(self.now + timedelta(hours=hours))
+        return [question["id"] for question in promoted]
+
+    def test_promotes_cards_as_they_come_due(self):
+        self.assertEqual(self.questions.count(), 1)
+        self.assertEqual(self.questions.next_due_time(), self.due_times[1])
+
+        self.assertEqual(self.promote(0.5), [])
+        self.assertEqual(self.promote(2), [1, 2])
+        self.assertEqual(self.questions.next_due_time(), self.due_times[3])
+        self.assertEqual(self.promote(2), [])  # each card is promoted once
+
+        # the promoted cards join the end of the current round
+        shown = [self.questions.get_next_to_repeat()["id"] for _ in range(3)]
+        self.assertEqual(shown, [0, 1, 2])
+
+    def test_skips_a_card_answered_before_it_came_due(self):
+        self.questions.correct(self.questions.find_by_id(1))
+
+        self.assertEqual(self.questions.next_due_time(), self.due_times[2])
+        self.assertEqual(self.promote(2), [2])
+
+    def test_skips_a_removed_card(self):
+        self.questions.remove(self.questions.find_by_id(1))
+
+        self.assertEqual(self.questions.next_due_time(), self.due_times[2])
+        self.assertEqual(self.promote(3), [2, 3])
+
+    def test_no_next_due_time_once_everything_is_due(self):
+        self.promote(3)
+        self.assertIsNone(self.questions.next_due_time())
+
+
+if __name__ == "__main__":
+    unittest.main()
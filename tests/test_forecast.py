@@ -0,0 +1,83 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+import numpy as np
+
+from src.forecast import forecast
+from src.scheduler import FSRSScheduler, SM2Scheduler
+
+NOW = datetime(2025, 3, 14, 9, 30)
+
+
+def make_card(due: datetime, repeated: int = 0, **state) -> Dict[str, Any]:
+    return {
+        "id": 0,
+        "subject": "Math",
+        "repeated": repeated,
+        "last_repeated": min(due, NOW).isoformat(),
+        "next_repeat": due.isoformat(),
+        **state,
+    }
+
+
+class ForecastTest(unittest.TestCase):
+    def test_follows_a_new_card_through_its_repetitions(self):
+        counts = forecast([make_card(NOW)], SM2Scheduler(), 30, now=NOW)
+
+        # SM-2 steps of 12 hours and 1 day, then the interval times 2.5:
+        # today at 9:30 and 21:30, then 1, 2.5, 6.25 and 15.6 days later
+        expected = np.zeros(30)
+        expected[[0, 1, 4, 10, 26]] = [2, 1, 1, 1, 1]
+        np.testing.assert_array_equal(counts, expected)
+
+    def test_overdue_cards_count_for_today(self):
+        cards = [
+            make_card(NOW - timedelta(days=3), repeated=5, interval=40, ease=2.5),
+            make_card(NOW + timedelta(days=2, hours=1), repeated=5, interval=40, ease=2.5),
+            make_card(NOW + timedelta(days=45), repeated=5, interval=40, ease=2.5),
+        ]
+        counts = forecast(cards, SM2Scheduler(), 30, now=NOW)
+
+        self.assertEqual(counts[0], 1)
+        self.assertEqual(counts[2], 1)
+        self.assertEqual(counts.sum(), 2)  # the next intervals are past the horizon
+
+    def test_nothing_to_forecast(self):
+        np.testing.assert_array_equal(forecast([], SM2Scheduler(), 7, now=NOW), np.zeros(7))
+        self.assertEqual(len(forecast([make_card(NOW)], SM2Scheduler(), 0, now=NOW)), 0)
+
+    def test_simulation_adds_the_reviews_of_forgotten_cards(self):
+        cards = [make_card(NOW + timedelta(hours=i)) for i in range(100)]
+        scheduler = FSRSScheduler()
+        assumed = forecast(cards, scheduler, 30, now=NOW)
+
+        always_recalled = forecast(cards, scheduler, 30, simulate=True, retention=1.0, now=NOW)
+        np.testing.assert_allclose(always_recalled, assumed)
+
+        simulated = forecast(cards, scheduler, 30, simulate=True, runs=5, seed=1, now=NOW)
+        again = forecast(cards, scheduler, 30, simulate=True, runs=5, seed=1, now=NOW)
+        np.testing.assert_array_equal(simulated, again)
+        self.assertGreater(simulated.sum(), assumed.sum())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+from datetime import datetime, time, timedelta
+from unittest import mock
+
+from src import load_balance
+from src.load_balance import DueHistogram
+from src.questions_manager import QuestionManager
+
+IDEAL = datetime(2025, 3, 14, 9, 30)
+
+
+def histogram(loads) -> DueHistogram:
+    """Histogram with loads[i] cards due i days after IDEAL."""
+    return DueHistogram(
+        {"next_repeat": (IDEAL + timedelta(days=day)).isoformat()}
+        for day, load in loads.items()
+        for _ in range(load)
+    )
+
+
+class WindowTest(unittest.TestCase):
+    def test_grows_with_the_interval(self):
+        self.assertEqual(load_balance.window(1), 0)  # short intervals stay exact
+        self.assertEqual(load_balance.window(2), 1)
+        self.assertEqual(load_balance.window(60), 3)
+        self.assertEqual(load_balance.window(1000), load_balance.MAX_WINDOW)
+
+
+class DueHistogramTest(unittest.TestCase):
+    def test_counts_cards_per_day(self):
+        days = histogram({0: 2, 1: 1})
+        days.add(None)  # cards without a due time are not counted
+        days.remove((IDEAL + timedelta(hours=3)).isoformat())
+
+        self.assertEqual(days.load(IDEAL), 1)
+        self.assertEqual(days.load(IDEAL + timedelta(days=1)), 1)
+        self.assertEqual(days.load(IDEAL + timedelta(days=2)), 0)
+
+    def test_moves_to_the_least_loaded_day_keeping_the_time(self):
+        days = histogram({-2: 1, -1: 3, 0: 5, 1: 4, 2: 2, 3: 0})
+
+        self.assertEqual(days.least_loaded(IDEAL, 2, 2), IDEAL + timedelta(days=-2))
+        self.assertEqual(days.least_loaded(IDEAL, 1, 2), IDEAL + timedelta(days=2))
+        self.assertEqual(days.least_loaded(IDEAL, 0, 0), IDEAL)
+
+    def test_ties_go_to_the_closest_day_earlier_first(self):
+        days = histogram({-2: 1, -1: 2, 0: 3, 1: 2, 2: 1})
+
+        self.assertEqual(days.least_loaded(IDEAL, 2, 2), IDEAL + timedelta(days=-2))
+        self.assertEqual(days.least_loaded(IDEAL, 1, 1), IDEAL + timedelta(days=-1))
+
+
+class AddQuestionsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patches = [
+            mock.patch.dict(os.environ, {"POMLET_HOME": self._tmp.name}),
+            mock.patch.object(load_balance, "NEW_CARDS_PER_DAY", 10),
+        ]
+        for patch in self._patches:
+            patch.start()
+        self.questions = QuestionManager()
+
+    def tearDown(self):
+        for patch in reversed(self._patches):
+            patch.stop()
+        self._tmp.cleanup()
+
+    def test_a_few_cards_are_due_right_away(self):
+        before = datetime.now()
+        added = self.questions.add_questions([f"Question {i}" for i in range(10)], "Math")
+
+        self.assertTrue(all(datetime.fromisoformat(q["next_repeat"]) >= before for q in added))
+        self.assertEqual(self.questions.count(), 10)
+
+    def test_many_cards_are_spread_over_the_next_days(self):
+        added = self.questions.add_questions([f"Question {i}" for i in range(25)], "Math")
+
+        today = datetime.now().date()
+        due = [datetime.fromisoformat(q["next_repeat"]) for q in added]
+        per_day = Counter((d.date() - today).days for d in due)
+        self.assertEqual(set(per_day), {0, 1, 2})
+        self.assertEqual(sorted(per_day.values()), [8, 8, 9])
+        # later days start at midnight, so the cards are due when the day begins
+        self.assertTrue(all(d.time() == time.min for d in due if d.date() > today))
+        self.assertEqual(self.questions.count(), per_day[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
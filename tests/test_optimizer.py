@@ -0,0 +1,96 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import math
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src import optimizer
+from src.optimizer import fit_ratios
+from src.review_log import CORRECT, ReviewLog
+
+TARGET = 0.9
+
+
+def synthetic_reviews(ratios, per_group: int, seed: int = 0):
+    """Reviews of groups whose intervals should be multiplied by ratios.
+
+    Recall after elapsed/interval x is exp(-theta x), with theta such that
+    recall at x = ratio is TARGET.
+    """
+    rng = np.random.default_rng(seed)
+    groups = np.repeat(np.arange(len(ratios)), per_group)
+    theta = -math.log(TARGET) / np.asarray(ratios, dtype=np.float64)
+    x = rng.uniform(0.2, 3.0, groups.size)
+    y = (rng.random(groups.size) < np.exp(-theta[groups] * x)).astype(np.float64)
+    return x, y, groups
+
+
+class FitRatiosTest(unittest.TestCase):
+    def test_recovers_the_ratio_of_each_group(self):
+        ratios = [0.6, 1.0, 1.8]
+        x, y, groups = synthetic_reviews(ratios, 20_000)
+
+        fitted = fit_ratios(x, y, groups, len(ratios), TARGET)
+
+        np.testing.assert_allclose(fitted, ratios, rtol=0.05)
+
+    def test_newton_has_converged(self):
+        x, y, groups = synthetic_reviews([1.8], 5_000)
+
+        fitted = fit_ratios(x, y, groups, 1, TARGET)
+
+        np.testing.assert_allclose(fit_ratios(x, y, groups, 1, TARGET, iterations=500), fitted)
+
+    def test_few_reviews_stay_close_to_the_prior(self):
+        x, y, groups = synthetic_reviews([2.0], 3)
+
+        fitted = fit_ratios(x, y, groups, 1, TARGET)
+
+        self.assertLess(abs(fitted[0] - 1.0), 0.5)
+
+
+class BackgroundOptimizationTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(os.environ, {"POMLET_HOME": self._tmp.name})
+        self._env.start()
+        log = ReviewLog()
+        for card_id in range(10):
+            log.append(card_id, CORRECT, 2.0, 2.0, ts=1.7e9 + card_id)
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def test_too_few_reviews_are_not_checked_again_until_next_week(self):
+        self.assertIsNone(optimizer.optimize(per_subject=False))
+        self.assertIn("checked_at", optimizer.load_params())
+        self.assertEqual(optimizer.modifiers(), (1.0, {}))
+
+        with mock.patch.object(optimizer, "optimize") as optimize:
+            self.assertIsNone(optimizer.start_background_optimization())
+        optimize.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from src import questions_manager
+from src.questions_manager import QuestionManager, get_question_path
+
+NOW = datetime(2025, 3, 14, 9, 30)
+
+
+class Clock(datetime):
+    """datetime whose now() is set by the test."""
+
+    current = NOW
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+class RelearningTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patches = [
+            mock.patch.dict(os.environ, {"POMLET_HOME": self._tmp.name}),
+            mock.patch.object(questions_manager, "datetime", Clock),
+            mock.patch.object(questions_manager, "RELEARN_AFTER_CARDS", 5),
+            mock.patch.object(questions_manager, "RELEARN_AFTER_MINUTES", 10.0),
+        ]
+        for patch in self._patches:
+            patch.start()
+        Clock.current = NOW
+
+    def tearDown(self):
+        for patch in reversed(self._patches):
+            patch.stop()
+        self._tmp.cleanup()
+
+    def load_deck(self, cards: int) -> QuestionManager:
+        yesterday = (NOW - timedelta(days=1)).isoformat()
+        deck = [
+            {
+                "id": i,
+                "question": f"Question {i}",
+                "subject": "Math",
+                "created": yesterday,
+                "last_repeated": yesterday,
+                "repeated": 0,
+                "next_repeat": yesterday,
+            }
+            for i in range(cards)
+        ]
+        get_question_path().write_text(json.dumps(deck), encoding="utf-8")
+        return QuestionManager()
+
+    def answered_before_it_is_back(self, questions: QuestionManager, wrong_id: int) -> int:
+        """Answer the other cards correctly until the wrong one is shown again."""
+        answered = 0
+        while True:
+            question = questions.get_next_to_repeat()
+            self.assertIsNotNone(question)
+            if question["id"] == wrong_id:
+                return answered
+            questions.correct(question)
+            answered += 1
+
+    def test_comes_back_after_five_other_cards(self):
+        questions = self.load_deck(10)
+        wrong = questions.get_next_to_repeat()
+        questions.wrong(wrong)
+
+        self.assertEqual(self.answered_before_it_is_back(questions, wrong["id"]), 5)
+
+    def test_comes_back_after_ten_minutes(self):
+        questions = self.load_deck(10)
+        wrong = questions.get_next_to_repeat()
+        questions.wrong(wrong)
+
+        questions.correct(questions.get_next_to_repeat())
+        Clock.current = NOW + timedelta(minutes=9)
+        question = questions.get_next_to_repeat()
+        self.assertNotEqual(question["id"], wrong["id"])
+        questions.correct(question)
+
+        Clock.current = NOW + timedelta(minutes=10)
+        self.assertEqual(questions.get_next_to_repeat()["id"], wrong["id"])
+
+    def test_comes_back_right_away_when_nothing_else_is_left(self):
+        questions = self.load_deck(3)
+        wrong = questions.get_next_to_repeat()
+        questions.wrong(wrong)
+
+        self.assertEqual(self.answered_before_it_is_back(questions, wrong["id"]), 2)
+
+        questions.correct(wrong)
+        self.assertIsNone(questions.get_next_to_repeat())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from copy import deepcopy
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from unittest import mock
+
+import numpy as np
+
+from src.questions_manager import QuestionManager, get_question_path
+from src.scheduler import (
+    RELEARNING_STEP,
+    FSRSScheduler,
+    Scheduler,
+    SM2Scheduler,
+    get_scheduler,
+)
+
+NOW = datetime(2025, 3, 14, 9, 30)
+ONE_DAY = timedelta(days=1)
+
+
+def make_cards(scheduler: Scheduler, count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Cards at every stage, most with a memory state, some from the old table."""
+    rng = random.Random(seed)
+    cards = []
+    for i in range(count):
+        card = {
+            "id": i,
+            "subject": rng.choice(["Math", "Physics"]),
+            "repeated": rng.randint(0, 6),
+            "last_repeated": (NOW - timedelta(days=rng.uniform(0, 40))).isoformat(),
+        }
+        if rng.random() < 0.7:
+            if isinstance(scheduler, FSRSScheduler):
+                card["stability"] = rng.uniform(0.1, 100)
+                card["difficulty"] = rng.uniform(1, 10)
+            else:
+                card["interval"] = rng.uniform(0.5, 60)
+                card["ease"] = rng.uniform(1.3, 3)
+        cards.append(card)
+    return cards
+
+
+class SchedulerParityTest(unittest.TestCase):
+    """The NumPy pass used for forecasts gives what answering card by card gives."""
+
+    STATE = {"sm2": ("interval", "ease"), "fsrs": ("stability", "difficulty")}
+
+    def check_parity(self, scheduler: Scheduler, correct: bool):
+        cards = make_cards(scheduler, 200)
+        elapsed = np.array(
+            [(NOW - datetime.fromisoformat(c["last_repeated"])) / ONE_DAY for c in cards]
+        )
+        state = scheduler.state_arrays(cards, np)
+        days = scheduler.review_arrays(state, np.full(len(cards), correct), elapsed, np)
+
+        for i, card in enumerate(deepcopy(cards)):
+            if correct:
+                expected_days = (scheduler.correct(card, NOW) - NOW) / ONE_DAY
+            else:
+                scheduler.wrong(card, NOW)
+                expected_days = RELEARNING_STEP / ONE_DAY
+            self.assertAlmostEqual(days[i], expected_days, places=6, msg=f"card {i}")
+            for field in self.STATE[scheduler.name]:
+                self.assertAlmostEqual(
+                    state[field][i], card[field], places=9, msg=f"{field} of card {i}"
+                )
+
+    def test_sm2(self):
+        for correct in (True, False):
+            with self.subTest(correct=correct):
+                self.check_parity(SM2Scheduler(0.9, {"Math": 1.3}), correct)
+
+    def test_fsrs(self):
+        for correct in (True, False):
+            with self.subTest(correct=correct):
+                self.check_parity(FSRSScheduler(0.9, {"Math": 1.3}), correct)
+
+
+class FSRSSchedulerTest(unittest.TestCase):
+    # computed by hand from the FSRS 4.5 formulas with the default weights:
+    # new card: S = w[grade - 1], D = w4 - (grade - 3) w5
+    # review:   R = (1 + 19/81 t / S) ** -0.5
+    #           S' = S (1 + e^w8 (11 - D) S^-w9 (e^(w10 (1 - R)) - 1))       Good
+    #           S' = w11 D^-w12 ((S + 1)^w13 - 1) e^(w14 (1 - R))            Again
+    #           D' = w7 D0(4) + (1 - w7) (D - w6 (grade - 3))
+
+    def setUp(self):
+        self.scheduler = FSRSScheduler()
+        self.card = {
+            "id": 0,
+            "subject": "Math",
+            "repeated": 0,
+            "last_repeated": NOW.isoformat(),
+        }
+
+    def test_new_card_answered_correctly(self):
+        due = self.scheduler.correct(self.card, NOW)
+
+        self.assertAlmostEqual(self.card["stability"], 3.7145)
+        self.assertAlmostEqual(self.card["difficulty"], 5.1618)
+        # at 90% desired retention the interval is the stability
+        self.assertAlmostEqual((due - NOW) / ONE_DAY, 3.7145, places=6)
+
+    def test_new_card_answered_wrong(self):
+        self.scheduler.wrong(self.card, NOW)
+
+        self.assertAlmostEqual(self.card["stability"], 0.4872)
+        self.assertAlmostEqual(self.card["difficulty"], 7.6214)
+
+    def answer_after_three_days(self, correct: bool):
+        self.scheduler.correct(self.card, NOW)
+        self.card["repeated"] = 1
+        later = NOW + timedelta(days=3)  # R = 0.916911
+        if correct:
+            self.scheduler.correct(self.card, later)
+        else:
+            self.scheduler.wrong(self.card, later)
+
+    def test_review_answered_correctly(self):
+        self.answer_after_three_days(correct=True)
+
+        self.assertAlmostEqual(self.card["stability"], 12.262351, places=5)
+        self.assertAlmostEqual(self.card["difficulty"], 5.123676, places=5)
+
+    def test_review_answered_wrong(self):
+        self.answer_after_three_days(correct=False)
+
+        self.assertAlmostEqual(self.card["stability"], 1.380961, places=5)
+        self.assertAlmostEqual(self.card["difficulty"], 6.863031, places=5)
+
+
+class TempHomeTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = mock.patch.dict(os.environ, {"POMLET_HOME": self._tmp.name})
+        self._env.start()
+        os.environ.pop("POMLET_SCHEDULER", None)
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+
+class GetSchedulerTest(TempHomeTestCase):
+    def test_selected_by_environment(self):
+        self.assertIsInstance(get_scheduler(), SM2Scheduler)
+        for name, cls in (("fsrs", FSRSScheduler), ("FSRS", FSRSScheduler)):
+            with self.subTest(name=name):
+                with mock.patch.dict(os.environ, {"POMLET_SCHEDULER": name}):
+                    self.assertIsInstance(get_scheduler(), cls)
+
+    def test_unknown_scheduler(self):
+        with mock.patch.dict(os.environ, {"POMLET_SCHEDULER": "leitner"}):
+            with self.assertRaises(ValueError):
+                get_scheduler()
+
+
+class RetiredCardsTest(TempHomeTestCase):
+    def test_rescheduled_on_load(self):
+        retired = {
+            "id": 0,
+            "question": "What is SM-2?",
+            "subject": "Math",
+            "created": "2025-01-01T12:00:00",
+            "last_repeated": "2025-03-01T12:00:00",
+            "repeated": 3,
+            "next_repeat": None,
+        }
+        get_question_path().write_text(json.dumps([retired]), encoding="utf-8")
+
+        question = QuestionManager().find_by_id(0)
+
+        # back on its last interval of the old table, 3 days after 3 repetitions
+        expected = datetime(2025, 3, 4, 12)
+        self.assertEqual(datetime.fromisoformat(question["next_repeat"]), expected)
+        saved = json.loads(get_question_path().read_text(encoding="utf-8"))
+        self.assertEqual(datetime.fromisoformat(saved[0]["next_repeat"]), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
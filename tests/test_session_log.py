@@ -0,0 +1,97 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.review_log import CORRECT, ReviewLog
+from src.session_log import BREAK, RECORD, WORK, SessionLog
+
+START = datetime(2025, 3, 14, 9, 0)
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class SessionLogTest(TempDirTestCase):
+    def append(self, log: SessionLog, subject: str, hour: int, minutes: int, **kwargs):
+        start = START + timedelta(hours=hour)
+        end = start + timedelta(minutes=minutes)
+        log.append(subject, kwargs.pop("kind", WORK), start, end, 1500, **kwargs)
+
+    def test_minutes_leave_out_pauses_and_count_stopped_sessions(self):
+        log = SessionLog(self.dir)
+        self.append(log, "Math", 0, 25)
+        self.append(log, "Math", 1, 30, paused=300)
+        self.append(log, "Physics", 2, 10, interrupted=True)
+        self.append(log, "Physics", 3, 5, kind=BREAK)
+
+        minutes = log.minutes_by_subject(START, START + timedelta(days=1))
+        self.assertEqual(minutes, {"Math": 50, "Physics": 10})
+
+    def test_keeps_sessions_sorted_by_start(self):
+        log = SessionLog(self.dir)
+        self.append(log, "Math", 2, 25)
+        self.append(log, "Math", 0, 25)  # restored after it ended while closed
+        self.append(log, "Math", 1, 25)
+
+        self.assertEqual(list(log.read()["start"]), sorted(log.read()["start"]))
+        self.assertEqual(len(log.between(START, START + timedelta(hours=1))), 1)
+
+    def test_drops_a_torn_record(self):
+        log = SessionLog(self.dir)
+        self.append(log, "Math", 0, 25)
+        with open(log.path, "ab") as f:
+            f.write(b"\0" * (RECORD.size // 2))
+        self.append(log, "Math", 1, 25)
+
+        sessions = log.read()
+        self.assertEqual(len(sessions), 2)
+        self.assertEqual(sessions["end"][1] - sessions["start"][1], 25 * 60)
+
+
+class ReviewLogTest(TempDirTestCase):
+    def test_drops_a_torn_record(self):
+        log = ReviewLog(self.dir)
+        log.append(1, CORRECT, 1.0, 1.0, ts=1.0)
+        segment = next(self.dir.glob("segment-*.bin"))
+        with open(segment, "ab") as f:
+            f.write(b"\0" * 5)
+        self.assertEqual(len(log.read()), 1)
+
+        log.append(2, CORRECT, 1.0, 1.0, ts=2.0)
+        self.assertEqual(list(log.read()["card_id"]), [1, 2])
+
+    def test_ignores_a_file_of_another_kind(self):
+        SessionLog(self.dir).append("Math", WORK, START, START + timedelta(minutes=25), 1500)
+        SessionLog(self.dir).path.rename(self.dir.joinpath("segment-000000.bin"))
+
+        with self.assertLogs("src.binary_log", "WARNING"):
+            self.assertEqual(len(ReviewLog(self.dir).read()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import array
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List
+from unittest import mock
+
+from src.gui import sound
+from src.gui.sound import SAMPLE_RATE, NullSink, SoundEngine, decode_aiff, synthesize_alert
+
+
+def extended(value: int) -> bytes:
+    """An integer as the 80-bit extended float of the AIFF COMM chunk."""
+    exponent = value.bit_length() - 1
+    return struct.pack(">HQ", 16383 + exponent, value << (63 - exponent))
+
+
+def chunk(chunk_id: bytes, body: bytes) -> bytes:
+    return chunk_id + struct.pack(">I", len(body)) + body + b"\0" * (len(body) & 1)
+
+
+def make_aiff(samples: List[int], sample_rate: int, channels: int = 1, bits: int = 16) -> bytes:
+    frames = len(samples) // channels
+    comm = struct.pack(">hIh", channels, frames, bits) + extended(sample_rate)
+    ssnd = struct.pack(">II", 0, 0) + struct.pack(f">{len(samples)}h", *samples)
+    body = b"AIFF" + chunk(b"COMM", comm) + chunk(b"NAME", b"pin") + chunk(b"SSND", ssnd)
+    return b"FORM" + struct.pack(">I", len(body)) + body
+
+
+class SynthesizeAlertTest(unittest.TestCase):
+    def test_two_tones_of_half_a_second(self):
+        pcm = synthesize_alert()
+
+        samples = array.array("h", pcm)
+        if sys.byteorder == "big":
+            samples.byteswap()
+        self.assertEqual(len(samples), int(SAMPLE_RATE * 0.18) + int(SAMPLE_RATE * 0.32))
+        peak = max(abs(s) for s in samples)
+        self.assertLessEqual(peak, int(0.6 * 32767))
+        self.assertGreater(peak, 0.55 * 32767)
+
+    def test_follows_the_sample_rate(self):
+        self.assertEqual(len(synthesize_alert(8000)), 2 * (int(8000 * 0.18) + int(8000 * 0.32)))
+
+
+class DecodeAiffTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name).joinpath("Ping.aiff")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_decodes_to_little_endian_pcm(self):
+        samples = [0, 1000, -1000, 32767, -32768, 258]
+        self.path.write_bytes(make_aiff(samples, 22050, channels=2))
+
+        pcm, sample_rate, channels = decode_aiff(self.path)
+
+        self.assertEqual((sample_rate, channels), (22050, 2))
+        self.assertEqual(pcm, struct.pack(f"<{len(samples)}h", *samples))
+
+    def test_rejects_other_files(self):
+        self.path.write_bytes(b"RIFF" + b"\0" * 40)
+        with self.assertRaises(ValueError):
+            decode_aiff(self.path)
+
+        self.path.write_bytes(make_aiff([0, 1, 2, 3], 44100, bits=8))
+        with self.assertRaises(ValueError):
+            decode_aiff(self.path)
+
+
+class NullAudioTest(unittest.TestCase):
+    def setUp(self):
+        no_device = mock.Mock(side_effect=AssertionError("opened an audio device"))
+        self._patches = [
+            mock.patch.dict(os.environ, {"POMLET_AUDIO": "null"}),
+            mock.patch.object(sound, "_engine", None),
+            mock.patch.object(sound, "QtSink", no_device),
+            mock.patch.object(sound, "QMediaDevices", no_device, create=True),
+        ]
+        for patch in self._patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in reversed(self._patches):
+            patch.stop()
+
+    def test_plays_nothing_without_opening_a_device(self):
+        engine = SoundEngine()
+        engine.play()
+
+        self.assertIsInstance(engine.sink, NullSink)
+        self.assertEqual(engine.sink.played, [len(synthesize_alert())])
+
+    def test_play_sound(self):
+        sound.play_sound()
+        sound.play_sound()
+
+        self.assertEqual(len(sound.get_sound_engine().sink.played), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Pomlet - A simple Pomodoro timer for your studies.
+Copyright (C) 2025 @ Manueel62
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest import mock
+
+from src.review_log import CORRECT, WRONG, ReviewLog
+from src.session_log import WORK, SessionLog
+from src.stats import StatsStore, get_stats_store
+
+
+class GetStatsStoreTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_follows_the_data_directory(self):
+        first, second = self.dir.joinpath("first"), self.dir.joinpath("second")
+        with mock.patch.dict(os.environ, {"POMLET_HOME": str(first)}):
+            get_stats_store().record_added("Math", when=datetime(2025, 3, 14))
+        with mock.patch.dict(os.environ, {"POMLET_HOME": str(second)}):
+            store = get_stats_store()
+            self.assertEqual(store.path, second.joinpath("stats.json"))
+            self.assertEqual(store.subjects(), {})
+            store.record_added("Physics", when=datetime(2025, 3, 14))
+
+        self.assertTrue(first.joinpath("stats.json").exists())
+        self.assertTrue(second.joinpath("stats.json").exists())
+
+
+class BackfillTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self.path = self.dir.joinpath("stats.json")
+        self.cards = [{"id": 1, "subject": "Math", "created": "2025-03-10T08:00:00"}]
+        self.reviews = ReviewLog(self.dir.joinpath("reviews"))
+        self.reviews.append(1, CORRECT, 1.0, 1.0, ts=datetime(2025, 3, 11, 9).timestamp())
+        self.reviews.append(1, WRONG, 1.0, 1.0, ts=datetime(2025, 3, 12, 9).timestamp())
+        self.sessions = SessionLog(self.dir.joinpath("sessions"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def log_session(self, start: datetime, minutes: float) -> float:
+        self.sessions.append("Math", WORK, start, start + timedelta(minutes=minutes), 1500)
+        return minutes
+
+    def test_session_recorded_first_does_not_prevent_the_backfill(self):
+        self.log_session(datetime(2025, 3, 10, 10), 25)
+        # a pomodoro that ended while the app was closed, logged before the deck loads
+        ended = datetime(2025, 3, 13, 10)
+        StatsStore(self.path).record_session("Math", self.log_session(ended, 20), ended)
+
+        store = StatsStore(self.path)
+        self.assertFalse(store.backfilled())
+        store.backfill(self.cards, self.reviews.read(), self.sessions)
+
+        store = StatsStore(self.path)
+        self.assertTrue(store.backfilled())
+        self.assertEqual(
+            store.subjects()["Math"], {"reviews": 2, "correct": 1, "added": 1, "minutes": 45}
+        )
+        self.assertEqual(store.streak(date(2025, 3, 13)), (4, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()